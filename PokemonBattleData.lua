@@ -217,11 +217,12 @@ end
 
 -- Configuration constants
 local CONFIG = {
-    FRAME_UPDATE_INTERVAL = 60,     -- Update party every 60 frames
     BUTTON_HOLD_FRAMES = 10,        -- Default frames to hold a button
     SWITCH_HOLD_FRAMES = 30,        -- Frames to hold button during switch
     BATTLE_MENU_SELECT_VALUE = 122, -- Value when an option is selected in battle
-    ANIMATION_WAIT_FRAMES = 900     -- Longer wait time for some animations
+    ANIMATION_WAIT_FRAMES = 900,    -- Longer wait time for some animations
+    TURBO_PLAYBACK = true,          -- Unthrottle from a turn's arrival until the battle menu is back
+    NATIVE_FPS = 59.7275            -- Game Boy frame rate, to convert frames to real-time seconds
 }
 
 -- Global state variables
@@ -229,7 +230,8 @@ local state = {
     backToMainMenu = true,          -- Track if we're back at the main menu
     lastSelectedPokeIndex = 0,      -- Store the last selected Pokemon index
     currentEnemyMoveIndex = 0,      -- Current enemy move index
-    waitingForMenuReturn = false    -- Whether we're waiting to return to menu
+    waitingForMenuReturn = false,   -- Whether we're waiting to return to menu
+    menuChanged = true              -- Set by the menu memory hooks; the loop re-reads the menu only then
 }
 
 -- Global RNG Sync variables
@@ -256,21 +258,6 @@ local RNG = {
     enemySnappedOut = false
 }
 
--- Global Pokemon Data Sync variables
-local pokemonData = {
-    nickname = "STARMIE",
-    species = SPECIES_DATA["Starmie"],
-    currentHP = 323, maxHP = 323,
-    level = 100,
-    type1 = TYPEMAP["Water"], type2 = TYPEMAP["Psychic"],
-    moves = {1, 0, 0, 0},
-    movesPP = {35, 0, 0, 0},
-    attack = 999,
-    defense = 999,
-    speed = 999,
-    special = 999
-}
-
 -- Default Pokemon Data
 local unknownData = {
     nickname = "UNKNOWN",
@@ -286,6 +273,134 @@ local unknownData = {
     special = 999
 }
 
+-- Shared memory written by emulator_bridge.py once per completed turn (little-endian)
+local BRIDGE = {
+    NAME = "ShowdownBattleState",   -- Memory-mapped file name
+    SIZE = 776,
+    TURN_OFFSET = 4,
+    RNG_OFFSET = 16,                -- playerFirst, flinched, then player and enemy sides
+    RNG_SIDE_SIZE = 10,
+    POKEMON_OFFSET = 38,            -- Active player and enemy Pokemon (not read here)
+    PARTY_OFFSET = 108,             -- Player party, then enemy party
+    PARTY_SIZE = 332,               -- Slot count, active slot, 6 party records, 6 nicknames
+    PARTY_RECORDS_OFFSET = 2,       -- Within a party block; 44-byte records as laid out in WRAM
+    PARTY_NICKS_OFFSET = 266,       -- Within a party block; 11 ASCII bytes each
+    NO_ACTIVE_SLOT = 0xFF,
+    TAIL_OFFSET = 772               -- Copy of the head sequence, written first
+}
+
+local Bridge = {
+    sequence = 0,                   -- Last snapshot applied
+    turn = 0                        -- Showdown turn number of that snapshot
+}
+
+-- comm.mmfReadBytes tables start at index 0, so offsets index them directly
+function Bridge.u16(bytes, offset)
+    return bytes[offset] | (bytes[offset + 1] << 8)
+end
+
+function Bridge.u32(bytes, offset)
+    return bytes[offset] | (bytes[offset + 1] << 8) | (bytes[offset + 2] << 16) | (bytes[offset + 3] << 24)
+end
+
+function Bridge.readSide(bytes, offset, side)
+    RNG[side .. "Damage"] = Bridge.u16(bytes, offset)
+    RNG[side .. "Crit"] = bytes[offset + 2]
+    RNG[side .. "MoveMiss"] = bytes[offset + 3]
+    RNG[side .. "StatDownEffect"] = bytes[offset + 4] ~= 0
+    RNG[side .. "FullyParalyzed"] = bytes[offset + 5] ~= 0
+    RNG[side .. "HitConfuse"] = bytes[offset + 6] ~= 0
+    RNG[side .. "Statused"] = bytes[offset + 7] ~= 0
+    RNG[side .. "WokeUp"] = bytes[offset + 8] ~= 0
+    RNG[side .. "SnappedOut"] = bytes[offset + 9] ~= 0
+end
+
+function Bridge.readNickname(bytes, offset)
+    local chars = {}
+    for i = 0, MEMORY.POKEMON_NICK_SIZE - 1 do
+        local byte = bytes[offset + i]
+        if byte == 0 then break end
+        chars[#chars + 1] = string.char(byte)
+    end
+    return table.concat(chars)
+end
+
+-- Loads the claimed slots of one side into party, then writes only the Pokemon that changed
+function Bridge.readParty(bytes, offset, party)
+    local active = bytes[offset + 1]
+    local written = 0
+    for i = 0, 5 do
+        local recordOffset = offset + BRIDGE.PARTY_RECORDS_OFFSET + i * MEMORY.POKEMON_DATA_SIZE
+        if bytes[recordOffset] ~= 0 then    -- Unclaimed slots keep their placeholder
+            party[i]:load(bytes, recordOffset)
+            party[i]:setNickname(Bridge.readNickname(bytes, offset + BRIDGE.PARTY_NICKS_OFFSET + i * MEMORY.POKEMON_NICK_SIZE))
+            if party[i]:sync(i == active) then written = written + 1 end
+        end
+    end
+    return written
+end
+
+-- Cheap per-frame check: only the 4-byte head sequence is read until Python publishes a turn
+function Bridge.pending()
+    return Bridge.u32(comm.mmfReadBytes(BRIDGE.NAME, 4), 0) ~= Bridge.sequence
+end
+
+-- Reads and applies the whole block once Bridge.pending() reports a new turn
+function Bridge.poll(enemy_party)
+    local bytes = comm.mmfReadBytes(BRIDGE.NAME, BRIDGE.SIZE)
+    local sequence = Bridge.u32(bytes, 0)
+    if sequence == 0 or sequence == Bridge.sequence then
+        return false
+    end
+    if sequence ~= Bridge.u32(bytes, BRIDGE.TAIL_OFFSET) then
+        return false    -- Python is mid-write, pick it up next frame
+    end
+    Bridge.sequence = sequence
+    Bridge.turn = Bridge.u32(bytes, BRIDGE.TURN_OFFSET)
+
+    RNG.playerFirst = bytes[BRIDGE.RNG_OFFSET] ~= 0
+    RNG.flinched = bytes[BRIDGE.RNG_OFFSET + 1] ~= 0
+    Bridge.readSide(bytes, BRIDGE.RNG_OFFSET + 2, "player")
+    Bridge.readSide(bytes, BRIDGE.RNG_OFFSET + 2 + BRIDGE.RNG_SIDE_SIZE, "enemy")
+    local written = Bridge.readParty(bytes, BRIDGE.PARTY_OFFSET + BRIDGE.PARTY_SIZE, enemy_party)
+    print(string.format("Bridge: turn %d received (seq %d), %d enemy Pokemon written",
+        Bridge.turn, sequence, written))
+    return true
+end
+
+-- Dirty bits for Pokemon:sync; a Pokemon with none set costs no memory writes
+local DIRTY = {
+    RECORD = 0x01,                  -- Any byte of the 44-byte party record
+    SPECIES = 0x02,                 -- Species list entry ahead of the records
+    MOVES = 0x04,                   -- Moves or PP, also copied into the Pokemon in battle
+    NICKNAME = 0x08
+}
+
+-- Extra dirty bits per record byte (1-based, like the record tables)
+local RECORD_DIRTY = {[MEMORY.POKEMON_SPECIES_OFFSET + 1] = DIRTY.SPECIES}
+for i = 1, 4 do
+    RECORD_DIRTY[MEMORY.MOVES_OFFSET + i] = DIRTY.MOVES
+    RECORD_DIRTY[MEMORY.MOVES_PP_OFFSET + i] = DIRTY.MOVES
+end
+
+-- Stat words (1-based, like the record tables) that Python sends as 0 until it knows them;
+-- the record keeps its current value instead, since a zero stat breaks the game's damage formula
+local KEEP_IF_ZERO = {}
+for _, statOffset in ipairs({MEMORY.MAX_HP_OFFSET, MEMORY.ATTACK_STAT_OFFSET, MEMORY.DEFENSE_STAT_OFFSET,
+                             MEMORY.SPEED_STAT_OFFSET, MEMORY.SPECIAL_STAT_OFFSET}) do
+    KEEP_IF_ZERO[statOffset + 1] = true
+end
+
+-- Big-endian u16 at a 0-based record offset
+local function recordU16(record, offset)
+    return (record[offset + 1] << 8) | record[offset + 2]
+end
+
+local function setRecordU16(record, offset, value)
+    record[offset + 1] = (value >> 8) & 0xFF
+    record[offset + 2] = value & 0xFF
+end
+
 -- Unified Pokemon class that works for both player and enemy
 local Pokemon = {}
 Pokemon.__index = Pokemon
@@ -298,98 +413,119 @@ function Pokemon.new(index, isPlayer, pokemonData)
     self.enemyBaseAddress = MEMORY.ENEMY_PARTY_BASE + (index * MEMORY.POKEMON_DATA_SIZE)
     self.nickAddress = MEMORY.PLAYER_NICKS_BASE + (index * MEMORY.POKEMON_NICK_SIZE)
     self.enemyNickAddress = MEMORY.ENEMY_NICKS_BASE + (index * MEMORY.POKEMON_NICK_SIZE)
-    self.nickname = pokemonData.nickname
-    self.species = pokemonData.species
-    self.currentHP, self.maxHP = pokemonData.currentHP, pokemonData.maxHP
-    self.level = pokemonData.level
-    self.type1, self.type2 = pokemonData.type1, pokemonData.type2
-    self.moves = pokemonData.moves
-    self.movesPP = pokemonData.movesPP
-    self.attack = pokemonData.attack
-    self.defense = pokemonData.defense
-    self.speed = pokemonData.speed
-    self.special = pokemonData.special
+    self.record = {}                -- Party record as last written, 1-based
+    self.nickBytes = {}
+    self.dirty = 0
+    self:load(Pokemon.pack(pokemonData), 1)
+    self:setNickname(pokemonData.nickname)
     print(string.format("Created %s Pokemon %d: %s (HP: %d)",
         isPlayer and "Player" or "Enemy",
         index,
         SPECIES_NAMES[self.species] or "Unknown",
         self.currentHP))
     
-    self:set(index)
+    self:sync(false)
     return self
 end
 
-function Pokemon:set(index)
-    local memLocation = self.isPlayer and "P1 System Bus" or "P2 System Bus"
-    
-    memory.writebyte(MEMORY.PLAYER_SPECIES_ARRAY + index, self.species, memLocation)
-    memory.writebyte(self.baseAddress + MEMORY.POKEMON_SPECIES_OFFSET, self.species, memLocation)
-    memory.write_u16_be(self.baseAddress + MEMORY.CURRENT_HP_OFFSET, self.currentHP, memLocation)
-    memory.write_u16_be(self.baseAddress + MEMORY.MAX_HP_OFFSET, self.maxHP, memLocation)
-    memory.writebyte(self.baseAddress + MEMORY.ACTUAL_LEVEL_OFFSET, self.level, memLocation)
-    memory.writebyte(self.baseAddress + MEMORY.TYPE1_OFFSET, self.type1, memLocation)
-    memory.writebyte(self.baseAddress + MEMORY.TYPE2_OFFSET, self.type2, memLocation)
-    
+-- Builds a 44-byte party record from a table of Pokemon fields
+function Pokemon.pack(data)
+    local record = {}
+    for i = 1, MEMORY.POKEMON_DATA_SIZE do record[i] = 0 end
+    record[MEMORY.POKEMON_SPECIES_OFFSET + 1] = data.species
+    setRecordU16(record, MEMORY.CURRENT_HP_OFFSET, data.currentHP)
+    record[MEMORY.PSEUDO_LEVEL_OFFSET + 1] = data.level
+    record[MEMORY.TYPE1_OFFSET + 1] = data.type1
+    record[MEMORY.TYPE2_OFFSET + 1] = data.type2
     for i = 1, 4 do
-        memory.writebyte(self.baseAddress + MEMORY.MOVES_OFFSET + i - 1, self.moves[i], memLocation)
-        memory.writebyte(self.baseAddress + MEMORY.MOVES_PP_OFFSET + i - 1, self.movesPP[i] | 0xC0, memLocation)
-    end
-    
-    memory.write_u16_be(self.baseAddress + MEMORY.ATTACK_STAT_OFFSET, self.attack, memLocation)
-    memory.write_u16_be(self.baseAddress + MEMORY.DEFENSE_STAT_OFFSET, self.defense, memLocation)
-    memory.write_u16_be(self.baseAddress + MEMORY.SPEED_STAT_OFFSET, self.speed, memLocation)
-    memory.write_u16_be(self.baseAddress + MEMORY.SPECIAL_STAT_OFFSET, self.special, memLocation)
-    
-    for i = 1, MEMORY.POKEMON_NICK_SIZE do
-        local char = string.sub(self.nickname, i, i)
-        local charValue = CHARMAP[char] or 0x50
-        memory.writebyte(self.nickAddress + i - 1, charValue, memLocation)
+        record[MEMORY.MOVES_OFFSET + i] = data.moves[i]
+        record[MEMORY.MOVES_PP_OFFSET + i] = data.movesPP[i] | 0xC0  -- Sets top 2 bits to 1 for Max PP UP
     end
+    record[MEMORY.ACTUAL_LEVEL_OFFSET + 1] = data.level
+    setRecordU16(record, MEMORY.MAX_HP_OFFSET, data.maxHP)
+    setRecordU16(record, MEMORY.ATTACK_STAT_OFFSET, data.attack)
+    setRecordU16(record, MEMORY.DEFENSE_STAT_OFFSET, data.defense)
+    setRecordU16(record, MEMORY.SPEED_STAT_OFFSET, data.speed)
+    setRecordU16(record, MEMORY.SPECIAL_STAT_OFFSET, data.special)
+    return record
 end
 
-function Pokemon:updateEnemyParty(index)
-    local memLocation = self.isPlayer and "P2 System Bus" or "P1 System Bus"
-    
-    memory.writebyte(MEMORY.ENEMY_SPECIES_ARRAY + index, self.species, memLocation)
-    memory.writebyte(self.enemyBaseAddress + MEMORY.POKEMON_SPECIES_OFFSET, self.species, memLocation)
-    memory.write_u16_be(self.enemyBaseAddress + MEMORY.CURRENT_HP_OFFSET, self.currentHP, memLocation)
-    memory.write_u16_be(self.enemyBaseAddress + MEMORY.MAX_HP_OFFSET, self.maxHP, memLocation)
-    memory.writebyte(self.enemyBaseAddress + MEMORY.ACTUAL_LEVEL_OFFSET, self.level, memLocation)
-    memory.writebyte(self.enemyBaseAddress + MEMORY.TYPE1_OFFSET, self.type1, memLocation)
-    memory.writebyte(self.enemyBaseAddress + MEMORY.TYPE2_OFFSET, self.type2, memLocation)
-    
-    for i = 1, 4 do
-        memory.writebyte(self.enemyBaseAddress + MEMORY.MOVES_OFFSET + i - 1, self.moves[i], memLocation)
-        memory.writebyte(self.enemyBaseAddress + MEMORY.MOVES_PP_OFFSET + i - 1, self.movesPP[i] | 0xC0, memLocation)
+-- Copies a party record from bytes[offset..], marking what changed; fields are decoded only then
+function Pokemon:load(bytes, offset)
+    local record, dirty = self.record, 0
+    local i = 1
+    while i <= MEMORY.POKEMON_DATA_SIZE do
+        local byte = bytes[offset + i - 1]
+        if KEEP_IF_ZERO[i] and record[i] and byte == 0 and bytes[offset + i] == 0 then
+            i = i + 2                       -- Unknown stat: keep the placeholder
+        else
+            if record[i] ~= byte then
+                record[i] = byte
+                dirty = dirty | DIRTY.RECORD | (RECORD_DIRTY[i] or 0)
+            end
+            i = i + 1
+        end
     end
-    
-    memory.write_u16_be(self.enemyBaseAddress + MEMORY.ATTACK_STAT_OFFSET, self.attack, memLocation)
-    memory.write_u16_be(self.enemyBaseAddress + MEMORY.DEFENSE_STAT_OFFSET, self.defense, memLocation)
-    memory.write_u16_be(self.enemyBaseAddress + MEMORY.SPEED_STAT_OFFSET, self.speed, memLocation)
-    memory.write_u16_be(self.enemyBaseAddress + MEMORY.SPECIAL_STAT_OFFSET, self.special, memLocation)
-    
+    if dirty ~= 0 then
+        self.species = record[MEMORY.POKEMON_SPECIES_OFFSET + 1]
+        self.currentHP = recordU16(record, MEMORY.CURRENT_HP_OFFSET)
+        self.status = record[MEMORY.STATUS_OFFSET + 1]
+        self.type1, self.type2 = record[MEMORY.TYPE1_OFFSET + 1], record[MEMORY.TYPE2_OFFSET + 1]
+        self.moves, self.movesPP = {}, {}
+        for i = 1, 4 do
+            self.moves[i] = record[MEMORY.MOVES_OFFSET + i]
+            self.movesPP[i] = record[MEMORY.MOVES_PP_OFFSET + i] & 0x3F
+        end
+        self.level = record[MEMORY.ACTUAL_LEVEL_OFFSET + 1]
+        self.maxHP = recordU16(record, MEMORY.MAX_HP_OFFSET)
+        self.attack = recordU16(record, MEMORY.ATTACK_STAT_OFFSET)
+        self.defense = recordU16(record, MEMORY.DEFENSE_STAT_OFFSET)
+        self.speed = recordU16(record, MEMORY.SPEED_STAT_OFFSET)
+        self.special = recordU16(record, MEMORY.SPECIAL_STAT_OFFSET)
+        self.dirty = self.dirty | dirty
+    end
+end
+
+function Pokemon:setNickname(nickname)
+    if nickname == self.nickname then return end
+    self.nickname = nickname
     for i = 1, MEMORY.POKEMON_NICK_SIZE do
-        local char = string.sub(self.nickname, i, i)
-        local charValue = CHARMAP[char] or 0x50
-        memory.writebyte(self.enemyNickAddress + i - 1, charValue, memLocation)
+        self.nickBytes[i] = CHARMAP[string.sub(nickname, i, i)] or 0x50
     end
+    self.dirty = self.dirty | DIRTY.NICKNAME
 end
 
-function Pokemon:updateMoveList(moves, movesPP)
+-- Writes whatever changed since the last sync to this core's party and the other core's enemy party,
+-- one range write per record; returns false without touching memory when nothing changed
+function Pokemon:sync(active)
+    local dirty = self.dirty
+    if dirty == 0 then return false end
+    self.dirty = 0
     local memLocation = self.isPlayer and "P1 System Bus" or "P2 System Bus"
     local enemyMemLocation = self.isPlayer and "P2 System Bus" or "P1 System Bus"
-    self.moves = moves
-    self.movesPP = movesPP
-    for i = 1, 4 do
-        memory.writebyte(self.baseAddress + MEMORY.MOVES_OFFSET + i - 1, moves[i], memLocation)
-        memory.writebyte(self.baseAddress + MEMORY.MOVES_PP_OFFSET + i - 1, movesPP[i] | 0xC0, memLocation)  -- Sets top 2 bits to 1 for Max PP UP
-        memory.writebyte(MEMORY.BATTLE_MON_MOVES + i - 1, moves[i], memLocation)
-        memory.writebyte(MEMORY.BATTLE_MON_PP + i - 1, movesPP[i] | 0xC0, memLocation)
-        memory.writebyte(self.enemyBaseAddress + MEMORY.MOVES_OFFSET + i - 1, moves[i], enemyMemLocation)
-        memory.writebyte(self.enemyBaseAddress + MEMORY.MOVES_PP_OFFSET + i - 1, movesPP[i] | 0xC0, enemyMemLocation)
-        memory.writebyte(MEMORY.ENEMY_MON_MOVES + i - 1, moves[i], enemyMemLocation)
-        memory.writebyte(MEMORY.ENEMY_MON_PP + i - 1, movesPP[i] | 0xC0, enemyMemLocation)
+    
+    if dirty & DIRTY.RECORD ~= 0 then
+        memory.write_bytes_as_array(self.baseAddress, self.record, memLocation)
+        memory.write_bytes_as_array(self.enemyBaseAddress, self.record, enemyMemLocation)
+    end
+    if dirty & DIRTY.SPECIES ~= 0 then
+        memory.writebyte(MEMORY.PLAYER_SPECIES_ARRAY + self.index, self.species, memLocation)
+        memory.writebyte(MEMORY.ENEMY_SPECIES_ARRAY + self.index, self.species, enemyMemLocation)
+    end
+    if dirty & DIRTY.NICKNAME ~= 0 then
+        memory.write_bytes_as_array(self.nickAddress, self.nickBytes, memLocation)
+        memory.write_bytes_as_array(self.enemyNickAddress, self.nickBytes, enemyMemLocation)
     end
+    if active and dirty & DIRTY.MOVES ~= 0 then
+        -- The Pokemon in battle keeps its own copy of the moves and PP
+        local moves = {table.unpack(self.record, MEMORY.MOVES_OFFSET + 1, MEMORY.MOVES_OFFSET + 4)}
+        local movesPP = {table.unpack(self.record, MEMORY.MOVES_PP_OFFSET + 1, MEMORY.MOVES_PP_OFFSET + 4)}
+        memory.write_bytes_as_array(MEMORY.BATTLE_MON_MOVES, moves, memLocation)
+        memory.write_bytes_as_array(MEMORY.BATTLE_MON_PP, movesPP, memLocation)
+        memory.write_bytes_as_array(MEMORY.ENEMY_MON_MOVES, moves, enemyMemLocation)
+        memory.write_bytes_as_array(MEMORY.ENEMY_MON_PP, movesPP, enemyMemLocation)
+    end
+    return true
 end
 
 function Pokemon:getName()
@@ -443,7 +579,15 @@ function Input.faintedSequence(offset)
 end
 
 -- UI Display functions
-local Display = {}
+local Display = {
+    lines = {}                      -- y -> overlay text, redrawn every frame without touching memory
+}
+
+function Display.draw()
+    for y, text in pairs(Display.lines) do
+        gui.text(10, y, text)
+    end
+end
 
 -- Display information about the currently selected move
 function Display.selectedMove()
@@ -451,7 +595,7 @@ function Display.selectedMove()
     if selectedMoveIndex <= 4 then
         local moveID = memory.readbyte(MEMORY.SELECTED_MOVE_ID)
         local pp = memory.readbyte(MEMORY.MOVE_PP_BASE + selectedMoveIndex - 1) & 0x3F
-        gui.text(10, 10, "Selected Move: " .. (MOVE_NAMES[moveID] or "Unknown") .. " (PP: " .. pp .. ")")
+        Display.lines[10] = "Selected Move: " .. (MOVE_NAMES[moveID] or "Unknown") .. " (PP: " .. pp .. ")"
         if memory.readbyte(MEMORY.BATTLE_MENU_STATE) == CONFIG.BATTLE_MENU_SELECT_VALUE and state.backToMainMenu then
             state.backToMainMenu = false
             return true
@@ -467,7 +611,7 @@ function Display.selectedPokemon()
     if ypos ~= 12 then state.lastSelectedPokeIndex = selectedPokeIndex end
     if selectedPokeIndex < 6 then
         local species = memory.readbyte(MEMORY.PLAYER_PARTY_BASE + selectedPokeIndex)
-        gui.text(10, 30, "Selected Pokémon: " .. (SPECIES_NAMES[species] or "Unknown"))
+        Display.lines[30] = "Selected Pokémon: " .. (SPECIES_NAMES[species] or "Unknown")
     end
     if ypos == 12 and memory.readbyte(MEMORY.BATTLE_MENU_STATE) == CONFIG.BATTLE_MENU_SELECT_VALUE and state.backToMainMenu then
         state.backToMainMenu = false
@@ -478,6 +622,7 @@ end
 
 -- Display battle menu options and handle selections
 function Display.options()
+    Display.lines = {}
     local xpos, ypos = memory.readbyte(MEMORY.CURSOR_X_POS), memory.readbyte(MEMORY.CURSOR_Y_POS)
     if ypos == 14 then state.backToMainMenu = true end
     if xpos == 5 and ypos == 12 then return Display.selectedMove()
@@ -485,6 +630,45 @@ function Display.options()
     return false
 end
 
+-- Plays each Showdown turn back unthrottled, so the emulated battle keeps pace with the live one.
+-- Timings use os.clock, which BizHawk's Windows C runtime reports as elapsed wall-clock time.
+local Playback = {
+    active = false,
+    turn = 0,
+    leftMenu = false,               -- An option was selected since the turn arrived
+    startClock = 0,
+    startFrame = 0
+}
+
+function Playback.start(turn)
+    if Playback.active then
+        print(string.format("Playback: turn %d arrived %.2f s into turn %d", turn, os.clock() - Playback.startClock, Playback.turn))
+        Playback.turn = turn
+        return
+    end
+    Playback.active = true
+    Playback.turn = turn
+    Playback.leftMenu = not state.backToMainMenu
+    Playback.startClock = os.clock()
+    Playback.startFrame = emu.framecount()
+    if CONFIG.TURBO_PLAYBACK then emu.limitframerate(false) end
+end
+
+-- The battle menu was left (an option was selected); the animations that follow run unthrottled
+function Playback.selected()
+    Playback.leftMenu = true
+end
+
+-- Back at the battle menu after the turn played out: return to real time and report how long it took
+function Playback.menuReached()
+    if not (Playback.active and Playback.leftMenu) then return end
+    Playback.active = false
+    if CONFIG.TURBO_PLAYBACK then emu.limitframerate(true) end
+    local frames = emu.framecount() - Playback.startFrame
+    print(string.format("Playback: turn %d caught up in %.2f s (%d frames, %.2f s at normal speed)",
+        Playback.turn, os.clock() - Playback.startClock, frames, frames / CONFIG.NATIVE_FPS))
+end
+
 -- AI Battle Logic
 local BattleAI = {}
 
@@ -746,77 +930,41 @@ function main()
 
     -- Initialize player and enemy parties
     local player_party, enemy_party = {}, {}
-    enemy_party[0] = Pokemon.new(0, false, pokemonData)
-    for i = 1, 5 do
-    --     player_party[i] = Pokemon.new(i, true, pokemonData)
+    for i = 0, 5 do
+    --     player_party[i] = Pokemon.new(i, true, unknownData)
         enemy_party[i] = Pokemon.new(i, false, unknownData)
     end
 
-    local frameCount = 0
-    -- Main game loop
-    while true do
-        if joypad.get(1)["Start"] then
-            RNG = {
-                playerFirst = true,
-                flinched = false,
-                playerDamage = 100,
-                playerCrit = 0,
-                playerMoveMiss = 0,
-                playerStatDownEffect = false,
-                playerFullyParalyzed = false,
-                playerHitConfuse = false,
-                playerStatused = false,
-                playerWokeUp = false,
-                playerSnappedOut = false,
-                enemyDamage = 100,
-                enemyCrit = 0,
-                enemyMoveMiss = 0,
-                enemyStatDownEffect = false,
-                enemyFullyParalyzed = false,
-                enemyHitConfuse = false,
-                enemyStatused = false,
-                enemyWokeUp = false,
-                enemySnappedOut = false
-            }
-
-            pokemonData = {
-                nickname = "STARMIE",
-                species = SPECIES_DATA["Starmie"],
-                currentHP = 323, maxHP = 323,
-                level = 100,
-                type1 = TYPEMAP["Water"], type2 = TYPEMAP["Psychic"],
-                moves = {MOVE_DATA["Psychic"].id, 0, 0, 0},
-                movesPP = {MOVE_DATA["Psychic"].pp, 0, 0, 0},
-                attack = 999,
-                defense = 999,
-                speed = 999,
-                special = 999
-            }
-            
-            for i = 0, 5 do
-                if enemy_party[i].species == pokemonData.species then
-                    if enemy_party[i].moves ~= pokemonData.moves then
-                        enemy_party[i]:updateMoveList(pokemonData.moves, pokemonData.movesPP)
-                    end
-                    break
-                elseif enemy_party[i].nickname == "UNKNOWN" then
-                    enemy_party[i] = Pokemon.new(i, false, pokemonData)
-                    enemy_party[i]:updateEnemyParty(i)
-                    break
-                end
-            end
-            
-            client.pause()
+    -- Menu hooks only raise a flag; the loop re-reads the menu when a watched byte actually changed
+    local menuValues = {}
+    local function menuWritten(address, value)
+        if value == nil or menuValues[address] ~= value then
+            menuValues[address] = value
+            state.menuChanged = true
         end
-        
-        frameCount = frameCount + 1
-        if frameCount >= CONFIG.FRAME_UPDATE_INTERVAL then
-            frameCount = 0
+    end
+    for _, address in ipairs({MEMORY.CURSOR_X_POS, MEMORY.CURSOR_Y_POS, MEMORY.SELECTED_INDEX,
+                              MEMORY.SELECTED_MOVE_ID, MEMORY.BATTLE_MENU_STATE}) do
+        event.on_bus_write(menuWritten, address, "MenuChanged", "P1 System Bus")
+    end
 
+    -- Main game loop: idle frames cost one 4-byte bridge read and the overlay redraw
+    while true do
+        -- Apply the latest turn published by the Python client
+        if Bridge.pending() and Bridge.poll(enemy_party) then
+            state.menuChanged = true    -- PP shown in the overlay may have changed
+            Playback.start(Bridge.turn)
         end
-        -- If player selects an option, have the enemy randomly select an option
-        if Display.options() then
-            -- BattleAI.selectRandomAction(enemy_party)
+        
+        if state.menuChanged then
+            state.menuChanged = false
+            -- If player selects an option, have the enemy randomly select an option
+            if Display.options() then
+                Playback.selected()
+                -- BattleAI.selectRandomAction(enemy_party)
+            elseif state.backToMainMenu then
+                Playback.menuReached()
+            end
         end
         -- Check if active Pokemon fainted (HP = 0) and select replacement if needed
         -- if memory.read_u16_be(MEMORY.CURRENT_ENEMY_POKEMON_HP) == 0 and not state.waitingForMenuReturn then
@@ -827,6 +975,7 @@ function main()
         if state.backToMainMenu and state.waitingForMenuReturn then
             state.waitingForMenuReturn = false
         end
+        Display.draw()
         emu.frameadvance()
     end
 end
@@ -1,86 +1,77 @@
-import json
 import asyncio
-from pokemon_api import PokemonAPI
 
 class BattleParser:
-    def __init__(self, battle_state, pokemon_api, log_callback):
+    def __init__(self, battle_state, pokemon_api, log_callback, log_enabled=None):
         self.battle_state = battle_state
         self.pokemon_api = pokemon_api
         self.log = log_callback
+        # Checked before building f-string messages, e.g. Logger.is_enabled
+        self.log_enabled = log_enabled or (lambda log_type: True)
+        self.turn_callbacks = []
+        
+        # Protocol message type (second '|' field) -> handler(line, parts)
+        self.handlers = {
+            'move': self._parse_move,
+            '-crit': self._parse_critical_hit,
+            '-miss': self._parse_miss,
+            '-damage': self._parse_damage,
+            '-status': self._parse_status,
+            '-curestatus': self._parse_status_recovery,
+            'cant': self._parse_cant_move,
+            '-activate': self._parse_confusion_activate,
+            '-message': self._parse_confusion_damage,
+            '-end': self._parse_confusion_end,
+            '-unboost': self._parse_stat_change,
+            '-boost': self._parse_stat_change,
+            'turn': self._parse_turn,
+            'switch': self._parse_switch,
+            'drag': self._parse_switch,
+            'request': self._parse_request,
+            'faint': self._parse_faint,
+            '-heal': self._parse_heal,
+            'win': self._parse_battle_end,
+            'tie': self._parse_battle_end,
+        }
+        
+    def add_turn_callback(self, callback):
+        """Add a callback(battle_state, turn) run with each completed turn's results"""
+        self.turn_callbacks.append(callback)
+        
+    def remove_turn_callback(self, callback):
+        """Remove a turn callback"""
+        if callback in self.turn_callbacks:
+            self.turn_callbacks.remove(callback)
+            
+    def _notify_turn_complete(self):
+        """Hand the results of the turn that just finished to the turn callbacks"""
+        for callback in self.turn_callbacks[:]:
+            try:
+                callback(self.battle_state, self.battle_state.current_turn)
+            except Exception as e:
+                self.log(f"Turn callback error: {str(e)}", "ERROR")
         
     def parse_gen1_battle_data(self, line):
         """Parse line for Gen 1 specific battle mechanics"""
+        # Battle protocol lines look like "|type|arg1|arg2..."; anything else is rejected here
+        if not line.startswith('|'):
+            return
+        type_end = line.find('|', 1)
+        if type_end < 0:
+            return
+        msg_type = line[1:type_end]
+        handler = self.handlers.get(msg_type)
+        if handler is None:
+            return
+        
         try:
-            # Track move order to determine speed ties
-            if '|move|' in line:
-                self._parse_move(line)
-                
-            # Critical hit detection
-            elif '|-crit|' in line:
-                self._parse_critical_hit(line)
-                
-            # Miss detection
-            elif '|-miss|' in line:
-                self._parse_miss(line)
-                
-            # Damage parsing to extract exact damage numbers
-            elif '|-damage|' in line:
-                self._parse_damage(line)
-                
-            # Status condition detection
-            elif '|-status|' in line:
-                self._parse_status(line)
-                
-            # Status recovery
-            elif '|-curestatus|' in line:
-                self._parse_status_recovery(line)
-                
-            # Full paralysis and sleep detection
-            elif '|cant|' in line:
-                self._parse_cant_move(line)
-                
-            # Confusion hit detection
-            elif '|-activate|' in line and 'confusion' in line:
-                self._parse_confusion_activate(line)
-                
-            # Check for confusion in various message formats
-            elif 'hurt itself in its confusion' in line.lower() or '[from] confusion' in line:
-                self._parse_confusion_damage(line)
-                
-            # End confusion
-            elif '|-end|' in line and 'confusion' in line:
-                self._parse_confusion_end(line)
-                
-            # Stat changes (both decreases and increases)
-            elif '|-unboost|' in line or '|-boost|' in line:
-                self._parse_stat_change(line)
-                
-            # Turn tracking
-            elif '|turn|' in line:
-                self._parse_turn(line)
-                
-            # Switch/Drag events
-            elif '|switch|' in line or '|drag|' in line:
-                self._parse_switch(line)
-                
-            # Request messages for exact HP
-            elif '|request|' in line:
-                self._parse_request(line)
-                
-            # Faint detection
-            elif '|faint|' in line:
-                self._parse_faint(line)
-                
-            # Heal detection for HP updates
-            elif '|-heal|' in line:
-                self._parse_heal(line)
-                
+            # Keep the |request| JSON payload in one piece
+            parts = line.split('|', 2) if msg_type == 'request' else line.split('|')
+            handler(line, parts)
         except Exception as e:
             self.log(f"Error parsing battle data: {str(e)}", "ERROR")
             
-    def _parse_move(self, line):
+    def _parse_move(self, line, parts):
         """Parse move messages to track turn order"""
-        parts = line.split('|')
         if len(parts) >= 3:
             player = parts[2]
             move = parts[3] if len(parts) > 3 else "unknown"
@@ -94,86 +85,88 @@ class BattleParser:
             # If this is the first move of the turn, reset turn-specific values and determine speed
             if len(self.battle_state.turn_moves) == 1:
                 # Reset all turn-specific battle state values at start of new turn
-                self.battle_state.state['playerCrit'] = 0
-                self.battle_state.state['playerMoveMiss'] = 0
-                self.battle_state.state['playerFullyParalyzed'] = False
-                self.battle_state.state['playerHitConfuse'] = False
-                self.battle_state.state['playerStatused'] = False
-                self.battle_state.state['playerDamage'] = 0
-                self.battle_state.state['playerStatDownEffect'] = False
-                self.battle_state.state['playerMoveUsed'] = ""
-                self.battle_state.state['playerFainted'] = False
-                
-                self.battle_state.state['enemyCrit'] = 0
-                self.battle_state.state['enemyMoveMiss'] = 0
-                self.battle_state.state['enemyFullyParalyzed'] = False
-                self.battle_state.state['enemyHitConfuse'] = False
-                self.battle_state.state['enemyStatused'] = False
-                self.battle_state.state['enemyDamage'] = 0
-                self.battle_state.state['enemyStatDownEffect'] = False
-                self.battle_state.state['enemyMoveUsed'] = ""
-                self.battle_state.state['enemyFainted'] = False
-                
-                self.battle_state.state['flinched'] = False
+                self.battle_state.state.playerCrit = 0
+                self.battle_state.state.playerMoveMiss = 0
+                self.battle_state.state.playerFullyParalyzed = False
+                self.battle_state.state.playerHitConfuse = False
+                self.battle_state.state.playerStatused = False
+                self.battle_state.state.playerDamage = 0
+                self.battle_state.state.playerStatDownEffect = False
+                self.battle_state.state.playerMoveUsed = ""
+                self.battle_state.state.playerFainted = False
+                
+                self.battle_state.state.enemyCrit = 0
+                self.battle_state.state.enemyMoveMiss = 0
+                self.battle_state.state.enemyFullyParalyzed = False
+                self.battle_state.state.enemyHitConfuse = False
+                self.battle_state.state.enemyStatused = False
+                self.battle_state.state.enemyDamage = 0
+                self.battle_state.state.enemyStatDownEffect = False
+                self.battle_state.state.enemyMoveUsed = ""
+                self.battle_state.state.enemyFainted = False
+                
+                self.battle_state.state.flinched = False
                 
                 if 'p1a' in player:
-                    self.battle_state.state['playerFirst'] = True
+                    self.battle_state.state.playerFirst = True
                     self.log("Player moved first (won speed tie or faster)", "BATTLE_STATE")
                 elif 'p2a' in player:
-                    self.battle_state.state['playerFirst'] = False
+                    self.battle_state.state.playerFirst = False
                     self.log("Enemy moved first (won speed tie or faster)", "BATTLE_STATE")
             
             # Track moves used by each Pokemon and set current turn move
             if 'p1a' in player and move != "unknown":
-                self.battle_state.state['playerMoveUsed'] = move
+                self.battle_state.state.playerMoveUsed = move
                 move_slot = self.battle_state.add_player_move(move)
                 if move_slot >= 0:
-                    self.log(f"Player used {move} (slot {move_slot + 1}, PP remaining: {self.battle_state.player_pokemon['movesPP'][move_slot]})", "BATTLE_STATE")
+                    if self.log_enabled("BATTLE_STATE"):
+                        self.log(f"Player used {move} (slot {move_slot + 1}, PP remaining: {self.battle_state.player_pokemon.movesPP[move_slot]})", "BATTLE_STATE")
                 else:
-                    self.log(f"Player used {move} (move not in database or no moveslot available)", "BATTLE_STATE")
+                    if self.log_enabled("BATTLE_STATE"):
+                        self.log(f"Player used {move} (move not in database or no moveslot available)", "BATTLE_STATE")
             elif 'p2a' in player and move != "unknown":
-                self.battle_state.state['enemyMoveUsed'] = move
+                self.battle_state.state.enemyMoveUsed = move
                 move_slot = self.battle_state.add_enemy_move(move)
                 if move_slot >= 0:
-                    self.log(f"Enemy used {move} (slot {move_slot + 1}, PP remaining: {self.battle_state.enemy_pokemon['movesPP'][move_slot]})", "BATTLE_STATE")
+                    if self.log_enabled("BATTLE_STATE"):
+                        self.log(f"Enemy used {move} (slot {move_slot + 1}, PP remaining: {self.battle_state.enemy_pokemon.movesPP[move_slot]})", "BATTLE_STATE")
                 else:
-                    self.log(f"Enemy used {move} (move not in database or no moveslot available)", "BATTLE_STATE")
+                    if self.log_enabled("BATTLE_STATE"):
+                        self.log(f"Enemy used {move} (move not in database or no moveslot available)", "BATTLE_STATE")
             
-            self.log(f"Move: {player} used {move}", "BATTLE_STATE")
+            if self.log_enabled("BATTLE_STATE"):
+                self.log(f"Move: {player} used {move}", "BATTLE_STATE")
             
-    def _parse_critical_hit(self, line):
+    def _parse_critical_hit(self, line, parts):
         """Parse critical hit messages"""
-        parts = line.split('|')
         if len(parts) >= 3:
             target = parts[2]  # This is the Pokemon that GOT crit
             if 'p1a' in target:
-                self.battle_state.state['enemyCrit'] = 1
+                self.battle_state.state.enemyCrit = 1
                 self.log("Enemy scored critical hit on Player!", "BATTLE_STATE")
             elif 'p2a' in target:
-                self.battle_state.state['playerCrit'] = 1
+                self.battle_state.state.playerCrit = 1
                 self.log("Player scored critical hit on Enemy!", "BATTLE_STATE")
                 
-    def _parse_miss(self, line):
+    def _parse_miss(self, line, parts):
         """Parse miss messages"""
-        parts = line.split('|')
         if len(parts) >= 3:
             attacker = parts[2]
             if 'p1a' in attacker:
-                self.battle_state.state['playerMoveMiss'] = 1
+                self.battle_state.state.playerMoveMiss = 1
                 self.log("Player move missed!", "BATTLE_STATE")
             elif 'p2a' in attacker:
-                self.battle_state.state['enemyMoveMiss'] = 1
+                self.battle_state.state.enemyMoveMiss = 1
                 self.log("Enemy move missed!", "BATTLE_STATE")
                 
-    def _parse_damage(self, line):
+    def _parse_damage(self, line, parts):
         """Parse damage messages"""
-        parts = line.split('|')
         if len(parts) >= 4:
             target = parts[2]
             damage_info = parts[3]
             
             # Check if damage is from confusion
-            is_confusion_damage = '[from] confusion' in line or 'confusion' in line.lower()
+            is_confusion_damage = any('confusion' in part.lower() for part in parts[4:])
             
             # Handle faint format: "0 fnt"
             if 'fnt' in damage_info:
@@ -210,7 +203,8 @@ class BattleParser:
                 self.battle_state.player_exact_hp["current"] > 0 and
                 self.battle_state.player_exact_hp["current"] != self.battle_state.player_exact_hp["max"]):
                 actual_damage = self.battle_state.player_exact_hp["current"]
-                self.log(f"Using exact HP tracking: {actual_damage}", "BATTLE_STATE")
+                if self.log_enabled("BATTLE_STATE"):
+                    self.log(f"Using exact HP tracking: {actual_damage}", "BATTLE_STATE")
             
             # Priority 2: Use previous display HP converted to real HP
             elif (hasattr(self.battle_state, 'player_prev_hp_display') and 
@@ -219,27 +213,32 @@ class BattleParser:
                 if self.battle_state.player_prev_hp_display <= 100:
                     # Convert percentage to actual HP
                     actual_damage = int((self.battle_state.player_prev_hp_display / 100.0) * self.battle_state.player_real_max_hp)
-                    self.log(f"Using percentage conversion: {self.battle_state.player_prev_hp_display}% of {self.battle_state.player_real_max_hp} = {actual_damage}", "BATTLE_STATE")
+                    if self.log_enabled("BATTLE_STATE"):
+                        self.log(f"Using percentage conversion: {self.battle_state.player_prev_hp_display}% of {self.battle_state.player_real_max_hp} = {actual_damage}", "BATTLE_STATE")
                 else:
                     # Already real HP
                     actual_damage = self.battle_state.player_prev_hp_display
-                    self.log(f"Using real HP directly: {actual_damage}", "BATTLE_STATE")
+                    if self.log_enabled("BATTLE_STATE"):
+                        self.log(f"Using real HP directly: {actual_damage}", "BATTLE_STATE")
             
             # Priority 3: Use Pokemon data structure current HP
-            elif self.battle_state.player_pokemon["currentHP"] > 0:
-                actual_damage = self.battle_state.player_pokemon["currentHP"]
-                self.log(f"Using Pokemon data current HP: {actual_damage}", "BATTLE_STATE")
+            elif self.battle_state.player_pokemon.currentHP > 0:
+                actual_damage = self.battle_state.player_pokemon.currentHP
+                if self.log_enabled("BATTLE_STATE"):
+                    self.log(f"Using Pokemon data current HP: {actual_damage}", "BATTLE_STATE")
             
             if actual_damage > 0:
                 if not is_confusion_damage:
-                    self.battle_state.state['enemyDamage'] = actual_damage
-                    self.log(f"Enemy dealt {actual_damage} damage to player - PLAYER FAINTED!", "BATTLE_STATE")
+                    self.battle_state.state.enemyDamage = actual_damage
+                    if self.log_enabled("BATTLE_STATE"):
+                        self.log(f"Enemy dealt {actual_damage} damage to player - PLAYER FAINTED!", "BATTLE_STATE")
                 else:
-                    self.battle_state.state['playerHitConfuse'] = True
-                    self.log(f"Player hit itself in confusion for {actual_damage} damage - PLAYER FAINTED!", "BATTLE_STATE")
+                    self.battle_state.state.playerHitConfuse = True
+                    if self.log_enabled("BATTLE_STATE"):
+                        self.log(f"Player hit itself in confusion for {actual_damage} damage - PLAYER FAINTED!", "BATTLE_STATE")
             
             # Update Pokemon HP
-            self.battle_state.player_pokemon["currentHP"] = 0
+            self.battle_state.player_pokemon.currentHP = 0
             self.battle_state.player_prev_hp_display = 0
             # Reset exact HP tracking
             if hasattr(self.battle_state, 'player_exact_hp'):
@@ -250,9 +249,9 @@ class BattleParser:
         damage_display = self.battle_state.player_prev_hp_display - current_hp if hasattr(self.battle_state, 'player_prev_hp_display') else 0
         
         # Update Pokemon HP in data structure
-        self.battle_state.player_pokemon["currentHP"] = current_hp
+        self.battle_state.player_pokemon.currentHP = current_hp
         if max_hp > 100:
-            self.battle_state.player_pokemon["maxHP"] = max_hp
+            self.battle_state.player_pokemon.maxHP = max_hp
         
         # Update exact HP tracking if we have real HP values
         if max_hp > 100:
@@ -278,13 +277,16 @@ class BattleParser:
             
             if actual_damage > 0:
                 if is_confusion_damage:
-                    self.battle_state.state['playerHitConfuse'] = True
-                    self.log(f"Player hit itself in confusion for {actual_damage} damage ({current_hp}/{max_hp} remaining)", "BATTLE_STATE")
+                    self.battle_state.state.playerHitConfuse = True
+                    if self.log_enabled("BATTLE_STATE"):
+                        self.log(f"Player hit itself in confusion for {actual_damage} damage ({current_hp}/{max_hp} remaining)", "BATTLE_STATE")
                 else:
-                    self.battle_state.state['enemyDamage'] = actual_damage
-                    self.log(f"Enemy dealt {actual_damage} damage to player ({current_hp}/{max_hp} remaining)", "BATTLE_STATE")
+                    self.battle_state.state.enemyDamage = actual_damage
+                    if self.log_enabled("BATTLE_STATE"):
+                        self.log(f"Enemy dealt {actual_damage} damage to player ({current_hp}/{max_hp} remaining)", "BATTLE_STATE")
         else:
-            self.log(f"Player took {damage_display}% damage (awaiting server HP data)", "BATTLE_STATE")
+            if self.log_enabled("BATTLE_STATE"):
+                self.log(f"Player took {damage_display}% damage (awaiting server HP data)", "BATTLE_STATE")
             
         self.battle_state.player_prev_hp_display = current_hp
         
@@ -297,18 +299,21 @@ class BattleParser:
             # Use simplified 100 HP system - just use the previous percentage HP
             if hasattr(self.battle_state, 'enemy_prev_hp_display') and self.battle_state.enemy_prev_hp_display > 0:
                 actual_damage = self.battle_state.enemy_prev_hp_display
-                self.log(f"Using simplified HP system: {actual_damage}", "BATTLE_STATE")
+                if self.log_enabled("BATTLE_STATE"):
+                    self.log(f"Using simplified HP system: {actual_damage}", "BATTLE_STATE")
             
             if actual_damage > 0:
                 if not is_confusion_damage:
-                    self.battle_state.state['playerDamage'] = actual_damage
-                    self.log(f"Player dealt {actual_damage} damage to enemy - ENEMY FAINTED!", "BATTLE_STATE")
+                    self.battle_state.state.playerDamage = actual_damage
+                    if self.log_enabled("BATTLE_STATE"):
+                        self.log(f"Player dealt {actual_damage} damage to enemy - ENEMY FAINTED!", "BATTLE_STATE")
                 else:
-                    self.battle_state.state['enemyHitConfuse'] = True
-                    self.log(f"Enemy hit itself in confusion for {actual_damage} damage - ENEMY FAINTED!", "BATTLE_STATE")
+                    self.battle_state.state.enemyHitConfuse = True
+                    if self.log_enabled("BATTLE_STATE"):
+                        self.log(f"Enemy hit itself in confusion for {actual_damage} damage - ENEMY FAINTED!", "BATTLE_STATE")
             
             # Update Pokemon HP
-            self.battle_state.enemy_pokemon["currentHP"] = 0
+            self.battle_state.enemy_pokemon.currentHP = 0
             self.battle_state.enemy_prev_hp_display = 0
             return
         
@@ -316,37 +321,41 @@ class BattleParser:
         damage_display = self.battle_state.enemy_prev_hp_display - current_hp if hasattr(self.battle_state, 'enemy_prev_hp_display') else 0
         
         # Update Pokemon HP in data structure using percentage values
-        self.battle_state.enemy_pokemon["currentHP"] = current_hp
-        self.battle_state.enemy_pokemon["maxHP"] = 100  # Always use 100 for simplicity
+        self.battle_state.enemy_pokemon.currentHP = current_hp
+        self.battle_state.enemy_pokemon.maxHP = 100  # Always use 100 for simplicity
         
         # For enemy, always use the percentage damage as actual damage (simplified system)
         if damage_display > 0:
             if is_confusion_damage:
-                self.battle_state.state['enemyHitConfuse'] = True
-                self.log(f"Enemy hit itself in confusion for {damage_display} damage ({current_hp}/100 remaining)", "BATTLE_STATE")
+                self.battle_state.state.enemyHitConfuse = True
+                if self.log_enabled("BATTLE_STATE"):
+                    self.log(f"Enemy hit itself in confusion for {damage_display} damage ({current_hp}/100 remaining)", "BATTLE_STATE")
             else:
-                self.battle_state.state['playerDamage'] = damage_display
-                self.log(f"Player dealt {damage_display} damage to enemy ({current_hp}/100 remaining)", "BATTLE_STATE")
+                self.battle_state.state.playerDamage = damage_display
+                if self.log_enabled("BATTLE_STATE"):
+                    self.log(f"Player dealt {damage_display} damage to enemy ({current_hp}/100 remaining)", "BATTLE_STATE")
             
         self.battle_state.enemy_prev_hp_display = current_hp
         
-    def _parse_status(self, line):
+    def _parse_status(self, line, parts):
         """Parse status condition messages"""
-        parts = line.split('|')
         if len(parts) >= 4:
             target = parts[2]
             status = parts[3]
             
             if 'p1a' in target:
-                self.battle_state.state['enemyStatused'] = True
-                self.log(f"Enemy inflicted {status} status on player", "BATTLE_STATE")
+                self.battle_state.state.enemyStatused = True
+                self.battle_state.player_pokemon.status = status
+                if self.log_enabled("BATTLE_STATE"):
+                    self.log(f"Enemy inflicted {status} status on player", "BATTLE_STATE")
             elif 'p2a' in target:
-                self.battle_state.state['playerStatused'] = True
-                self.log(f"Player inflicted {status} status on enemy", "BATTLE_STATE")
+                self.battle_state.state.playerStatused = True
+                self.battle_state.enemy_pokemon.status = status
+                if self.log_enabled("BATTLE_STATE"):
+                    self.log(f"Player inflicted {status} status on enemy", "BATTLE_STATE")
                 
-    def _parse_status_recovery(self, line):
+    def _parse_status_recovery(self, line, parts):
         """Parse status recovery messages"""
-        parts = line.split('|')
         if len(parts) >= 4:
             target = parts[2]
             status = parts[3]
@@ -358,49 +367,53 @@ class BattleParser:
             # If this is the first action of the turn, reset battle state values and determine turn order
             if len(self.battle_state.turn_moves) == 0:
                 # Reset all turn-specific battle state values at start of new turn
-                self.battle_state.state['playerCrit'] = 0
-                self.battle_state.state['playerMoveMiss'] = 0
-                self.battle_state.state['playerFullyParalyzed'] = False
-                self.battle_state.state['playerHitConfuse'] = False
-                self.battle_state.state['playerStatused'] = False
-                self.battle_state.state['playerDamage'] = 0
-                self.battle_state.state['playerStatDownEffect'] = False
-                self.battle_state.state['playerMoveUsed'] = ""
-                self.battle_state.state['playerFainted'] = False
-                
-                self.battle_state.state['enemyCrit'] = 0
-                self.battle_state.state['enemyMoveMiss'] = 0
-                self.battle_state.state['enemyFullyParalyzed'] = False
-                self.battle_state.state['enemyHitConfuse'] = False
-                self.battle_state.state['enemyStatused'] = False
-                self.battle_state.state['enemyDamage'] = 0
-                self.battle_state.state['enemyStatDownEffect'] = False
-                self.battle_state.state['enemyMoveUsed'] = ""
-                self.battle_state.state['enemyFainted'] = False
-                
-                self.battle_state.state['flinched'] = False
+                self.battle_state.state.playerCrit = 0
+                self.battle_state.state.playerMoveMiss = 0
+                self.battle_state.state.playerFullyParalyzed = False
+                self.battle_state.state.playerHitConfuse = False
+                self.battle_state.state.playerStatused = False
+                self.battle_state.state.playerDamage = 0
+                self.battle_state.state.playerStatDownEffect = False
+                self.battle_state.state.playerMoveUsed = ""
+                self.battle_state.state.playerFainted = False
+                
+                self.battle_state.state.enemyCrit = 0
+                self.battle_state.state.enemyMoveMiss = 0
+                self.battle_state.state.enemyFullyParalyzed = False
+                self.battle_state.state.enemyHitConfuse = False
+                self.battle_state.state.enemyStatused = False
+                self.battle_state.state.enemyDamage = 0
+                self.battle_state.state.enemyStatDownEffect = False
+                self.battle_state.state.enemyMoveUsed = ""
+                self.battle_state.state.enemyFainted = False
+                
+                self.battle_state.state.flinched = False
                 
                 # Track who acted first (status recovery counts as an action)
                 if 'p1a' in target:
-                    self.battle_state.state['playerFirst'] = True
+                    self.battle_state.state.playerFirst = True
                     self.log("Player acted first (status recovery)", "BATTLE_STATE")
                 elif 'p2a' in target:
-                    self.battle_state.state['playerFirst'] = False
+                    self.battle_state.state.playerFirst = False
                     self.log("Enemy acted first (status recovery)", "BATTLE_STATE")
             
             # Track this as a turn action
             self.battle_state.turn_moves.append(target)
             
+            if 'p1a' in target:
+                self.battle_state.player_pokemon.status = ""
+            elif 'p2a' in target:
+                self.battle_state.enemy_pokemon.status = ""
+            
             if 'p1a' in target and status == 'slp':
-                self.battle_state.state['playerWokeUp'] = True
+                self.battle_state.state.playerWokeUp = True
                 self.log("Player woke up from sleep", "BATTLE_STATE")
             elif 'p2a' in target and status == 'slp':
-                self.battle_state.state['enemyWokeUp'] = True
+                self.battle_state.state.enemyWokeUp = True
                 self.log("Enemy woke up from sleep", "BATTLE_STATE")
                 
-    def _parse_cant_move(self, line):
+    def _parse_cant_move(self, line, parts):
         """Parse can't move messages (paralysis, sleep, etc.)"""
-        parts = line.split('|')
         if len(parts) >= 4:
             pokemon = parts[2]
             reason = parts[3]
@@ -412,45 +425,45 @@ class BattleParser:
             # If this is the first "can't move" of the turn, reset battle state values
             if len(self.battle_state.turn_moves) == 0:
                 # Reset all turn-specific battle state values at start of new turn
-                self.battle_state.state['playerCrit'] = 0
-                self.battle_state.state['playerMoveMiss'] = 0
-                self.battle_state.state['playerFullyParalyzed'] = False
-                self.battle_state.state['playerHitConfuse'] = False
-                self.battle_state.state['playerStatused'] = False
-                self.battle_state.state['playerDamage'] = 0
-                self.battle_state.state['playerStatDownEffect'] = False
-                self.battle_state.state['playerMoveUsed'] = ""
-                self.battle_state.state['playerFainted'] = False
-                
-                self.battle_state.state['enemyCrit'] = 0
-                self.battle_state.state['enemyMoveMiss'] = 0
-                self.battle_state.state['enemyFullyParalyzed'] = False
-                self.battle_state.state['enemyHitConfuse'] = False
-                self.battle_state.state['enemyStatused'] = False
-                self.battle_state.state['enemyDamage'] = 0
-                self.battle_state.state['enemyStatDownEffect'] = False
-                self.battle_state.state['enemyMoveUsed'] = ""
-                self.battle_state.state['enemyFainted'] = False
-                
-                self.battle_state.state['flinched'] = False
+                self.battle_state.state.playerCrit = 0
+                self.battle_state.state.playerMoveMiss = 0
+                self.battle_state.state.playerFullyParalyzed = False
+                self.battle_state.state.playerHitConfuse = False
+                self.battle_state.state.playerStatused = False
+                self.battle_state.state.playerDamage = 0
+                self.battle_state.state.playerStatDownEffect = False
+                self.battle_state.state.playerMoveUsed = ""
+                self.battle_state.state.playerFainted = False
+                
+                self.battle_state.state.enemyCrit = 0
+                self.battle_state.state.enemyMoveMiss = 0
+                self.battle_state.state.enemyFullyParalyzed = False
+                self.battle_state.state.enemyHitConfuse = False
+                self.battle_state.state.enemyStatused = False
+                self.battle_state.state.enemyDamage = 0
+                self.battle_state.state.enemyStatDownEffect = False
+                self.battle_state.state.enemyMoveUsed = ""
+                self.battle_state.state.enemyFainted = False
+                
+                self.battle_state.state.flinched = False
             
             # Track who would have moved first (even if they can't move)
             self.battle_state.turn_moves.append(pokemon)
             if len(self.battle_state.turn_moves) == 1:
                 if 'p1a' in pokemon:
-                    self.battle_state.state['playerFirst'] = True
+                    self.battle_state.state.playerFirst = True
                     self.log("Player would have moved first (but can't move)", "BATTLE_STATE")
                 elif 'p2a' in pokemon:
-                    self.battle_state.state['playerFirst'] = False
+                    self.battle_state.state.playerFirst = False
                     self.log("Enemy would have moved first (but can't move)", "BATTLE_STATE")
             
             # Set the specific paralysis/sleep flags
             if reason == 'par':
                 if 'p1a' in pokemon:
-                    self.battle_state.state['playerFullyParalyzed'] = True
+                    self.battle_state.state.playerFullyParalyzed = True
                     self.log("Player is fully paralyzed!", "BATTLE_STATE")
                 elif 'p2a' in pokemon:
-                    self.battle_state.state['enemyFullyParalyzed'] = True
+                    self.battle_state.state.enemyFullyParalyzed = True
                     self.log("Enemy is fully paralyzed!", "BATTLE_STATE")
             elif reason == 'slp':
                 if 'p1a' in pokemon:
@@ -458,46 +471,47 @@ class BattleParser:
                 elif 'p2a' in pokemon:
                     self.log("Enemy is asleep and can't move!", "BATTLE_STATE")
                     
-    def _parse_confusion_activate(self, line):
+    def _parse_confusion_activate(self, line, parts):
         """Parse confusion activation messages"""
-        parts = line.split('|')
-        if len(parts) >= 3:
+        if len(parts) >= 4 and 'confusion' in parts[3]:
             pokemon = parts[2]
             if 'p1a' in pokemon:
-                self.battle_state.state['playerHitConfuse'] = True
+                self.battle_state.state.playerHitConfuse = True
                 self.log("Player hit by confusion! [ACTIVATE]", "BATTLE_STATE")
             elif 'p2a' in pokemon:
-                self.battle_state.state['enemyHitConfuse'] = True
+                self.battle_state.state.enemyHitConfuse = True
                 self.log("Enemy hit by confusion! [ACTIVATE]", "BATTLE_STATE")
                 
-    def _parse_confusion_damage(self, line):
+    def _parse_confusion_damage(self, line, parts):
         """Parse confusion self-damage messages"""
-        self.log(f"Confusion damage line detected: {line}", "BATTLE_STATE")
+        if 'hurt itself in its confusion' not in line.lower():
+            return
+            
+        if self.log_enabled("BATTLE_STATE"):
+            self.log(f"Confusion damage line detected: {line}", "BATTLE_STATE")
         
         if 'p1a' in line:
-            self.battle_state.state['playerHitConfuse'] = True
+            self.battle_state.state.playerHitConfuse = True
             self.log("Player hit by confusion! [FROM LINE]", "BATTLE_STATE")
         elif 'p2a' in line:
-            self.battle_state.state['enemyHitConfuse'] = True
+            self.battle_state.state.enemyHitConfuse = True
             self.log("Enemy hit by confusion! [FROM LINE]", "BATTLE_STATE")
             
-    def _parse_confusion_end(self, line):
+    def _parse_confusion_end(self, line, parts):
         """Parse end of confusion messages"""
-        parts = line.split('|')
-        if len(parts) >= 3:
+        if len(parts) >= 4 and 'confusion' in parts[3]:
             pokemon = parts[2]
             
             if 'p1a' in pokemon:
-                self.battle_state.state['playerSnappedOut'] = True
+                self.battle_state.state.playerSnappedOut = True
                 self.log("Player snapped out of confusion!", "BATTLE_STATE")
             elif 'p2a' in pokemon:
-                self.battle_state.state['enemySnappedOut'] = True
+                self.battle_state.state.enemySnappedOut = True
                 self.log("Enemy snapped out of confusion!", "BATTLE_STATE")
                 
-    def _parse_stat_change(self, line):
+    def _parse_stat_change(self, line, parts):
         """Parse stat change messages"""
-        if '|-unboost|' in line:
-            parts = line.split('|')
+        if parts[1] == '-unboost':
             if len(parts) >= 5:
                 target = parts[2]
                 stat = parts[3]
@@ -505,16 +519,17 @@ class BattleParser:
                 
                 if 'p2a' in target:
                     # Enemy's stat was lowered
-                    self.battle_state.state['playerStatDownEffect'] = True
-                    self.log(f"Player's move lowered enemy's {stat} by {stages} stage(s)! [FLAG SET]", "BATTLE_STATE")
+                    self.battle_state.state.playerStatDownEffect = True
+                    if self.log_enabled("BATTLE_STATE"):
+                        self.log(f"Player's move lowered enemy's {stat} by {stages} stage(s)! [FLAG SET]", "BATTLE_STATE")
                 elif 'p1a' in target:
                     # Player's stat was lowered
-                    self.battle_state.state['enemyStatDownEffect'] = True
-                    self.log(f"Enemy's move lowered player's {stat} by {stages} stage(s)! [FLAG SET]", "BATTLE_STATE")
+                    self.battle_state.state.enemyStatDownEffect = True
+                    if self.log_enabled("BATTLE_STATE"):
+                        self.log(f"Enemy's move lowered player's {stat} by {stages} stage(s)! [FLAG SET]", "BATTLE_STATE")
         
         # Also check for stat increases (|-boost|)
-        elif '|-boost|' in line:
-            parts = line.split('|')
+        elif parts[1] == '-boost':
             if len(parts) >= 5:
                 target = parts[2]
                 stat = parts[3]
@@ -522,27 +537,37 @@ class BattleParser:
                 
                 # Log stat boosts but don't set stat down flags
                 if 'p1a' in target:
-                    self.log(f"Player's {stat} rose by {stages} stage(s)!", "BATTLE_STATE")
+                    if self.log_enabled("BATTLE_STATE"):
+                        self.log(f"Player's {stat} rose by {stages} stage(s)!", "BATTLE_STATE")
                 elif 'p2a' in target:
-                    self.log(f"Enemy's {stat} rose by {stages} stage(s)!", "BATTLE_STATE")
+                    if self.log_enabled("BATTLE_STATE"):
+                        self.log(f"Enemy's {stat} rose by {stages} stage(s)!", "BATTLE_STATE")
                 
-    def _parse_turn(self, line):
+    def _parse_turn(self, line, parts):
         """Parse turn messages"""
-        turn_num = line.split('|')[2] if len(line.split('|')) > 2 else "?"
-        self.log(f"=== TURN {turn_num} ===", "BATTLE_STATE")
+        turn_num = parts[2] if len(parts) > 2 else "?"
+        
+        # State still holds the results of the turn that just ended
+        self.battle_state.apply_player_request()
+        self._notify_turn_complete()
+        
+        if self.log_enabled("BATTLE_STATE"):
+            self.log(f"=== TURN {turn_num} ===", "BATTLE_STATE")
         
         # Log current battle state BEFORE starting new turn
         if hasattr(self.battle_state, 'turn_moves') and len(self.battle_state.turn_moves) > 0:
             self.log("=== PREVIOUS TURN SUMMARY ===", "BATTLE_STATE")
-            self.log(f"Player used: {self.battle_state.state.get('playerMoveUsed', 'None')}", "BATTLE_STATE")
-            self.log(f"Enemy used: {self.battle_state.state.get('enemyMoveUsed', 'None')}", "BATTLE_STATE")
-            self.log(f"Player dealt {self.battle_state.state['playerDamage']} damage", "BATTLE_STATE")
-            self.log(f"Enemy dealt {self.battle_state.state['enemyDamage']} damage", "BATTLE_STATE")
-            self.log(f"Player stat down effect: {self.battle_state.state['playerStatDownEffect']}", "BATTLE_STATE")
-            self.log(f"Enemy stat down effect: {self.battle_state.state['enemyStatDownEffect']}", "BATTLE_STATE")
-            if self.battle_state.state['playerFainted']:
+            if self.log_enabled("BATTLE_STATE"):
+                state = self.battle_state.state
+                self.log(f"Player used: {state.playerMoveUsed}", "BATTLE_STATE")
+                self.log(f"Enemy used: {state.enemyMoveUsed}", "BATTLE_STATE")
+                self.log(f"Player dealt {state.playerDamage} damage", "BATTLE_STATE")
+                self.log(f"Enemy dealt {state.enemyDamage} damage", "BATTLE_STATE")
+                self.log(f"Player stat down effect: {state.playerStatDownEffect}", "BATTLE_STATE")
+                self.log(f"Enemy stat down effect: {state.enemyStatDownEffect}", "BATTLE_STATE")
+            if self.battle_state.state.playerFainted:
                 self.log("Player Pokemon fainted this turn!", "BATTLE_STATE")
-            if self.battle_state.state['enemyFainted']:
+            if self.battle_state.state.enemyFainted:
                 self.log("Enemy Pokemon fainted this turn!", "BATTLE_STATE")
         
         self.battle_state.current_turn = turn_num
@@ -552,154 +577,214 @@ class BattleParser:
         
         # Clear wakeup flags after they've been logged for one full turn
         if hasattr(self.battle_state, 'clear_wakeup_flags_next_turn') and self.battle_state.clear_wakeup_flags_next_turn:
-            self.battle_state.state['playerWokeUp'] = False
-            self.battle_state.state['enemyWokeUp'] = False
-            self.battle_state.state['playerSnappedOut'] = False
-            self.battle_state.state['enemySnappedOut'] = False
+            self.battle_state.state.playerWokeUp = False
+            self.battle_state.state.enemyWokeUp = False
+            self.battle_state.state.playerSnappedOut = False
+            self.battle_state.state.enemySnappedOut = False
             self.battle_state.clear_wakeup_flags_next_turn = False
             self.log("Cleared persistent status flags from previous turn", "BATTLE_STATE")
         
         # Set flag to clear wakeup flags next turn if any are currently set
-        if any([self.battle_state.state['playerWokeUp'], self.battle_state.state['enemyWokeUp'],
-                self.battle_state.state['playerSnappedOut'], self.battle_state.state['enemySnappedOut']]):
+        if any([self.battle_state.state.playerWokeUp, self.battle_state.state.enemyWokeUp,
+                self.battle_state.state.playerSnappedOut, self.battle_state.state.enemySnappedOut]):
             self.battle_state.clear_wakeup_flags_next_turn = True
             
-    def _parse_switch(self, line):
+    def _parse_switch(self, line, parts):
         """Parse switch/drag messages"""
-        parts = line.split('|')
         if len(parts) >= 4:
             pokemon = parts[2]
             hp_info = parts[4] if len(parts) > 4 else ""
             
-            # Extract Pokemon name and queue stats lookup
-            pokemon_name = self.pokemon_api.get_pokemon_name_from_line(line)
+            # Extract Pokemon name (e.g. "p1a: Alakazam" -> "alakazam") and queue stats lookup
+            pokemon_name = pokemon.split(':')[-1].strip().lower()
+            # Details carry the species even when the Pokemon is nicknamed ("Tauros, L74, M")
+            species_name = parts[3].split(',')[0]
             
             if '/' in hp_info:
                 try:
                     current_hp_str, max_hp_str = hp_info.split('/')
                     current_hp = int(current_hp_str.strip())
-                    max_hp = int(max_hp_str.split()[0].strip())
+                    max_hp_parts = max_hp_str.split()
+                    max_hp = int(max_hp_parts[0])
+                    status = max_hp_parts[1] if len(max_hp_parts) > 1 else ""
                     
                     if 'p1a' in pokemon:
-                        self._handle_player_switch(pokemon_name, current_hp, max_hp)
+                        self._handle_player_switch(pokemon_name, current_hp, max_hp, species_name, status)
                     elif 'p2a' in pokemon:
-                        self._handle_enemy_switch(pokemon_name, current_hp, max_hp)
+                        self._handle_enemy_switch(pokemon_name, current_hp, max_hp, species_name, status)
                 except ValueError:
                     pass
                     
         self.log(f"Switch/Drag: {line}", "BATTLE")
         
-    def _handle_player_switch(self, pokemon_name, current_hp, max_hp):
+    def _handle_player_switch(self, pokemon_name, current_hp, max_hp, species_name=None, status=""):
         """Handle player Pokemon switch"""
         self.battle_state.player_prev_hp_display = current_hp
         
         # Update Pokemon data structure
-        self.battle_state.update_player_pokemon(pokemon_name, current_hp, max_hp)
+        self.battle_state.update_player_pokemon(pokemon_name, current_hp, max_hp, species_name=species_name, status=status)
         
         if max_hp > 100:  # Real HP, not percentage
             self.battle_state.player_exact_hp = {"current": current_hp, "max": max_hp}
             self.battle_state.player_real_max_hp = max_hp
-            self.log(f"Player switched in {pokemon_name} with {current_hp}/{max_hp} HP [EXACT]", "BATTLE_STATE")
+            if self.log_enabled("BATTLE_STATE"):
+                self.log(f"Player switched in {pokemon_name} with {current_hp}/{max_hp} HP [EXACT]", "BATTLE_STATE")
         else:  # Percentage display
+            if self.log_enabled("BATTLE_STATE"):
+                self.log(f"Player switched in {pokemon_name} with {current_hp}% HP", "BATTLE_STATE")
             if pokemon_name:
-                asyncio.create_task(self._update_player_max_hp(pokemon_name))
-            self.log(f"Player switched in {pokemon_name} with {current_hp}% HP (querying server...)", "BATTLE_STATE")
+                # Nicknames aren't in the Pokedex; look up the species from the switch details
+                lookup_name = species_name or pokemon_name
+                # Local Pokedex hit: apply immediately, otherwise query in the background
+                queried_max_hp, base_hp = self.pokemon_api.get_cached_stats(lookup_name, level=100)
+                if queried_max_hp:
+                    self._apply_player_max_hp(queried_max_hp)
+                else:
+                    self._schedule_max_hp_query(self._update_player_max_hp, lookup_name)
             
-    def _handle_enemy_switch(self, pokemon_name, current_hp, max_hp):
+    def _handle_enemy_switch(self, pokemon_name, current_hp, max_hp, species_name=None, status=""):
         """Handle enemy Pokemon switch"""
         self.battle_state.enemy_prev_hp_display = current_hp
         
         # Update Pokemon data structure
-        self.battle_state.update_enemy_pokemon(pokemon_name, current_hp, max_hp)
+        self.battle_state.update_enemy_pokemon(pokemon_name, current_hp, max_hp, species_name=species_name, status=status)
         
         if max_hp > 100:  # Real HP, not percentage
             self.battle_state.enemy_exact_hp = {"current": current_hp, "max": max_hp}
             self.battle_state.enemy_real_max_hp = max_hp
-            self.log(f"Enemy switched in {pokemon_name} with {current_hp}/{max_hp} HP [EXACT]", "BATTLE_STATE")
+            if self.log_enabled("BATTLE_STATE"):
+                self.log(f"Enemy switched in {pokemon_name} with {current_hp}/{max_hp} HP [EXACT]", "BATTLE_STATE")
+            self._apply_enemy_stats(self.battle_state.enemy_pokemon, species_name or pokemon_name)
         else:  # Percentage display
+            if self.log_enabled("BATTLE_STATE"):
+                self.log(f"Enemy switched in {pokemon_name} with {current_hp}% HP", "BATTLE_STATE")
             if pokemon_name:
-                asyncio.create_task(self._update_enemy_max_hp(pokemon_name))
-            self.log(f"Enemy switched in {pokemon_name} with {current_hp}% HP (querying server...)", "BATTLE_STATE")
+                # Nicknames aren't in the Pokedex; look up the species from the switch details
+                lookup_name = species_name or pokemon_name
+                # Local Pokedex hit: apply immediately, otherwise query in the background
+                queried_max_hp, base_hp = self.pokemon_api.get_cached_stats(lookup_name, level=100)
+                if queried_max_hp:
+                    self._apply_enemy_max_hp(queried_max_hp)
+                    self._apply_enemy_stats(self.battle_state.enemy_pokemon, lookup_name)
+                else:
+                    self._schedule_max_hp_query(self._update_enemy_max_hp, lookup_name, self.battle_state.enemy_pokemon)
+            
+    def _apply_enemy_stats(self, pokemon, pokemon_name):
+        """Estimate an enemy's stats from its Pokedex base stats; the emulator can't run on zeros"""
+        if pokemon.attack:
+            return  # Stats are fixed for the battle
+        stats = self.pokemon_api.get_cached_battle_stats(pokemon_name, level=pokemon.level)
+        if stats:
+            pokemon.attack, pokemon.defense, pokemon.speed, pokemon.special = stats
+            
+    def _schedule_max_hp_query(self, update_coroutine, pokemon_name, *args):
+        """Query max HP in the background when running inside an event loop (not in offline replays)"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            if self.log_enabled("BATTLE_STATE"):
+                self.log(f"{pokemon_name} not in local Pokedex (no event loop to query server)", "BATTLE_STATE")
+            return
+        if self.log_enabled("BATTLE_STATE"):
+            self.log(f"{pokemon_name} not in local Pokedex (querying server...)", "BATTLE_STATE")
+        asyncio.create_task(update_coroutine(pokemon_name, *args))
             
     async def _update_player_max_hp(self, pokemon_name):
         """Update player max HP from API"""
         try:
             queried_max_hp, base_hp = await self.pokemon_api.query_pokemon_stats(pokemon_name, level=100)
             if queried_max_hp:
-                self.battle_state.player_real_max_hp = queried_max_hp
-                if hasattr(self.battle_state, 'player_prev_hp_display'):
-                    estimated_current = int((self.battle_state.player_prev_hp_display / 100.0) * queried_max_hp)
-                    self.battle_state.player_exact_hp = {"current": estimated_current, "max": queried_max_hp}
-                    self.log(f"Updated player max HP from server (L100): {queried_max_hp} (current: {estimated_current})", "BATTLE_STATE")
+                self._apply_player_max_hp(queried_max_hp)
         except Exception as e:
             self.log(f"Error updating player max HP: {str(e)}", "ERROR")
             
-    async def _update_enemy_max_hp(self, pokemon_name):
-        """Update enemy max HP from API"""
+    def _apply_player_max_hp(self, queried_max_hp):
+        """Apply a looked-up L100 max HP to player HP tracking"""
+        self.battle_state.player_real_max_hp = queried_max_hp
+        if hasattr(self.battle_state, 'player_prev_hp_display'):
+            estimated_current = int((self.battle_state.player_prev_hp_display / 100.0) * queried_max_hp)
+            self.battle_state.player_exact_hp = {"current": estimated_current, "max": queried_max_hp}
+            if self.log_enabled("BATTLE_STATE"):
+                self.log(f"Updated player max HP from Pokedex (L100): {queried_max_hp} (current: {estimated_current})", "BATTLE_STATE")
+            
+    async def _update_enemy_max_hp(self, pokemon_name, pokemon):
+        """Update enemy max HP and stats from API"""
         try:
             queried_max_hp, base_hp = await self.pokemon_api.query_pokemon_stats(pokemon_name, level=100)
             if queried_max_hp:
-                self.battle_state.enemy_real_max_hp = queried_max_hp
-                if hasattr(self.battle_state, 'enemy_prev_hp_display'):
-                    estimated_current = int((self.battle_state.enemy_prev_hp_display / 100.0) * queried_max_hp)
-                    self.battle_state.enemy_exact_hp = {"current": estimated_current, "max": queried_max_hp}
-                    self.log(f"Updated enemy max HP from server (L100): {queried_max_hp} (current: {estimated_current})", "BATTLE_STATE")
+                self._apply_enemy_max_hp(queried_max_hp)
+                # The switch's own Pokemon: another may be active by the time the query returns
+                self._apply_enemy_stats(pokemon, pokemon_name)
         except Exception as e:
             self.log(f"Error updating enemy max HP: {str(e)}", "ERROR")
             
-    def _parse_request(self, line):
+    def _apply_enemy_max_hp(self, queried_max_hp):
+        """Apply a looked-up L100 max HP to enemy HP tracking"""
+        self.battle_state.enemy_real_max_hp = queried_max_hp
+        if hasattr(self.battle_state, 'enemy_prev_hp_display'):
+            estimated_current = int((self.battle_state.enemy_prev_hp_display / 100.0) * queried_max_hp)
+            self.battle_state.enemy_exact_hp = {"current": estimated_current, "max": queried_max_hp}
+            if self.log_enabled("BATTLE_STATE"):
+                self.log(f"Updated enemy max HP from Pokedex (L100): {queried_max_hp} (current: {estimated_current})", "BATTLE_STATE")
+            
+    def _parse_request(self, line, parts):
         """Parse request messages for exact HP"""
         try:
-            json_start = line.find('|request|') + 9
-            json_data = line[json_start:]
-            request_data = json.loads(json_data)
-            
-            # Extract exact HP from side pokemon data
-            if 'side' in request_data and 'pokemon' in request_data['side']:
-                for pokemon in request_data['side']['pokemon']:
-                    if pokemon.get('active', False) and 'condition' in pokemon:
-                        condition = pokemon['condition']
-                        if '/' in condition:
-                            # Parse exact HP values like "270/323"
-                            hp_parts = condition.split('/')
-                            current_hp = int(hp_parts[0])
-                            max_hp = int(hp_parts[1].split()[0])  # Remove status conditions
-                            
-                            # Store previous HP for damage calculation
-                            if self.battle_state.player_exact_hp["current"] > 0:
-                                prev_hp = self.battle_state.player_exact_hp["current"]
-                                damage_dealt = prev_hp - current_hp
-                                
-                                if damage_dealt > 0:
-                                    # Player took damage, so enemy dealt it
-                                    self.battle_state.state['enemyDamage'] = damage_dealt
-                                    damage_pct = (damage_dealt / max_hp) * 100
-                                    self.log(f"Enemy dealt {damage_dealt} damage to player ({damage_pct:.1f}% of max HP) [EXACT]", "BATTLE_STATE")
-                            
-                            # Update exact HP tracking
-                            self.battle_state.player_exact_hp = {"current": current_hp, "max": max_hp}
-                            self.battle_state.player_real_max_hp = max_hp
-                            break
-        except (json.JSONDecodeError, ValueError, KeyError) as e:
+            if len(parts) < 3 or not parts[2]:
+                return
+            # Parsed once and diffed per party member; the party itself is applied at |turn|
+            request = self.battle_state.player_request
+            if request.update(parts[2]) is None:
+                return  # Same payload as last time
+            
+            # Extract exact HP from the active Pokemon ("270/323"; fainted ones have no max)
+            active = request.active_member()
+            if active is not None and active.maxHP:
+                current_hp = active.currentHP
+                max_hp = active.maxHP
+                
+                # Store previous HP for damage calculation
+                if self.battle_state.player_exact_hp["current"] > 0:
+                    prev_hp = self.battle_state.player_exact_hp["current"]
+                    damage_dealt = prev_hp - current_hp
+                    
+                    if damage_dealt > 0:
+                        # Player took damage, so enemy dealt it
+                        self.battle_state.state.enemyDamage = damage_dealt
+                        damage_pct = (damage_dealt / max_hp) * 100
+                        if self.log_enabled("BATTLE_STATE"):
+                            self.log(f"Enemy dealt {damage_dealt} damage to player ({damage_pct:.1f}% of max HP) [EXACT]", "BATTLE_STATE")
+                
+                # Update exact HP tracking
+                self.battle_state.player_exact_hp = {"current": current_hp, "max": max_hp}
+                self.battle_state.player_real_max_hp = max_hp
+        except (ValueError, KeyError, AttributeError) as e:
             # If JSON parsing fails, continue with normal processing
             pass
             
-    def _parse_faint(self, line):
+    def _parse_battle_end(self, line, parts):
+        """Parse win/tie messages; the final turn has no |turn| line after it"""
+        self.battle_state.apply_player_request()
+        self._notify_turn_complete()
+        if parts[1] == 'win' and len(parts) > 2:
+            self.log(f"Battle won by {parts[2]}", "BATTLE")
+        else:
+            self.log("Battle ended in a tie", "BATTLE")
+            
+    def _parse_faint(self, line, parts):
         """Parse faint messages"""
-        parts = line.split('|')
         if len(parts) >= 3:
             pokemon = parts[2]
             
             if 'p1a' in pokemon:
-                self.battle_state.state['playerFainted'] = True
+                self.battle_state.state.playerFainted = True
                 self.log("Player Pokemon fainted!", "BATTLE_STATE")
             elif 'p2a' in pokemon:
-                self.battle_state.state['enemyFainted'] = True
+                self.battle_state.state.enemyFainted = True
                 self.log("Enemy Pokemon fainted!", "BATTLE_STATE")
                 
-    def _parse_heal(self, line):
+    def _parse_heal(self, line, parts):
         """Parse heal messages to update HP tracking"""
-        parts = line.split('|')
         if len(parts) >= 4:
             target = parts[2]
             hp_info = parts[3]
@@ -713,7 +798,7 @@ class BattleParser:
                     if 'p1a' in target:
                         # Update player HP tracking after heal
                         self.battle_state.player_prev_hp_display = current_hp
-                        self.battle_state.player_pokemon["currentHP"] = current_hp
+                        self.battle_state.player_pokemon.currentHP = current_hp
                         
                         if max_hp > 100:
                             # Real HP values
@@ -721,22 +806,26 @@ class BattleParser:
                                 self.battle_state.player_exact_hp["current"] = current_hp
                                 self.battle_state.player_exact_hp["max"] = max_hp
                             self.battle_state.player_real_max_hp = max_hp
-                            self.log(f"Player healed to {current_hp}/{max_hp} HP [EXACT]", "BATTLE_STATE")
+                            if self.log_enabled("BATTLE_STATE"):
+                                self.log(f"Player healed to {current_hp}/{max_hp} HP [EXACT]", "BATTLE_STATE")
                         else:
                             # Percentage display - update exact HP if we have real max
                             if hasattr(self.battle_state, 'player_exact_hp') and self.battle_state.player_real_max_hp > 0:
                                 exact_current = int((current_hp / 100.0) * self.battle_state.player_real_max_hp)
                                 self.battle_state.player_exact_hp["current"] = exact_current
-                                self.log(f"Player healed to {current_hp}% HP (exact: {exact_current}/{self.battle_state.player_real_max_hp})", "BATTLE_STATE")
+                                if self.log_enabled("BATTLE_STATE"):
+                                    self.log(f"Player healed to {current_hp}% HP (exact: {exact_current}/{self.battle_state.player_real_max_hp})", "BATTLE_STATE")
                             else:
-                                self.log(f"Player healed to {current_hp}% HP", "BATTLE_STATE")
+                                if self.log_enabled("BATTLE_STATE"):
+                                    self.log(f"Player healed to {current_hp}% HP", "BATTLE_STATE")
                         
                     elif 'p2a' in target:
                         # Update enemy HP tracking after heal (using simplified 100 HP system)
                         self.battle_state.enemy_prev_hp_display = current_hp
-                        self.battle_state.enemy_pokemon["currentHP"] = current_hp
-                        self.battle_state.enemy_pokemon["maxHP"] = 100  # Always use 100 for enemy
-                        self.log(f"Enemy healed to {current_hp}/100 HP", "BATTLE_STATE")
+                        self.battle_state.enemy_pokemon.currentHP = current_hp
+                        self.battle_state.enemy_pokemon.maxHP = 100  # Always use 100 for enemy
+                        if self.log_enabled("BATTLE_STATE"):
+                            self.log(f"Enemy healed to {current_hp}/100 HP", "BATTLE_STATE")
                         
                 except ValueError:
                     pass
\ No newline at end of file
@@ -0,0 +1,79 @@
+from collections import OrderedDict
+from battle_state import BattleState
+from battle_parser import BattleParser
+
+class BattleSession:
+    """BattleState/BattleParser pair for a single battle room"""
+
+    def __init__(self, room, pokemon_api, log_callback, log_enabled=None):
+        self.room = room
+        self.battle_state = BattleState(log_callback, log_enabled)
+        self.battle_parser = BattleParser(self.battle_state, pokemon_api, log_callback, log_enabled)
+        self.finished = False
+
+class SessionRegistry:
+    """Create, look up and evict one BattleSession per battle room"""
+
+    def __init__(self, pokemon_api, log_callback, max_sessions=16, max_finished=2, turn_callback=None,
+                 log_enabled=None):
+        self.pokemon_api = pokemon_api
+        self.log = log_callback
+        self.log_enabled = log_enabled
+        self.turn_callback = turn_callback  # Registered on every session's parser
+        self.max_sessions = max_sessions  # Hard cap, least recently active evicted first
+        self.max_finished = max_finished  # Finished battles kept around for display
+        self.sessions = OrderedDict()
+
+    @staticmethod
+    def is_battle_room(room):
+        return room.startswith('battle-')
+
+    def get(self, room):
+        return self.sessions.get(room)
+
+    def create(self, room):
+        """Create a session for a room, evicting old ones to stay within bounds"""
+        def session_log(message, log_type="INFO"):
+            self.log(message, log_type, room)
+
+        session = BattleSession(room, self.pokemon_api, session_log, self.log_enabled)
+        if self.turn_callback:
+            session.battle_parser.add_turn_callback(self.turn_callback)
+        self.sessions[room] = session
+        while len(self.sessions) > self.max_sessions:
+            self.evict(next(iter(self.sessions)))
+        return session
+
+    def evict(self, room):
+        """Drop a room's session"""
+        session = self.sessions.pop(room, None)
+        if session:
+            self.log(f"Closed battle session: {room}", "BATTLE", room)
+        return session
+
+    def _evict_finished(self):
+        """Keep only the most recently finished sessions"""
+        finished = [room for room, session in self.sessions.items() if session.finished]
+        while len(finished) > self.max_finished:
+            self.evict(finished.pop(0))
+
+    def route(self, line, room):
+        """Parse a line in its room's session; returns the session, or None for non-battle rooms"""
+        if not self.is_battle_room(room):
+            return None
+
+        session = self.sessions.get(room)
+        if session is None:
+            session = self.create(room)
+            self.log(f"Entering battle room: {room}", "BATTLE", room)
+        else:
+            self.sessions.move_to_end(room)
+
+        session.battle_parser.parse_gen1_battle_data(line)
+
+        if line == '|deinit':
+            self.evict(room)
+        elif line.startswith('|win|') or line == '|tie':
+            session.finished = True
+            self._evict_finished()
+        return session
@@ -0,0 +1,89 @@
+"""Measure EmulatorBridge publish cost and publish-to-reader latency.
+
+A separate reader process polls the shared block the way the Lua script does
+(once per --poll-ms, 16.7 ms for a 60 fps frame; 0 = busy poll) and records how
+long after publish() each turn became readable.
+
+    python benchmarks/bridge_latency.py [--turns 500] [--poll-ms 0] [--log benchmarks/data/gen1ou_sample.log]
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+import multiprocessing
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from emulator_bridge import EmulatorBridge
+from parser_dispatch import make_parser
+
+DEFAULT_LOG = os.path.join(ROOT, "benchmarks", "data", "gen1ou_sample.log")
+
+def reader(path, turns, poll_seconds, results):
+    bridge = EmulatorBridge(path=path)
+    last_sequence = 0
+    latencies = []
+    torn = 0
+    while len(latencies) < turns:
+        head = int.from_bytes(bridge.buffer[0:4], "little")
+        if head != last_sequence:
+            snapshot = bridge.read()
+            if snapshot is None:
+                torn += 1
+            else:
+                last_sequence = snapshot[0]
+                latencies.append(time.monotonic_ns() - snapshot[2])
+        if poll_seconds:
+            time.sleep(poll_seconds)
+    results.put((latencies, torn))
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--turns", type=int, default=500)
+    parser.add_argument("--poll-ms", type=float, default=0.0)
+    parser.add_argument("--log", default=DEFAULT_LOG)
+    args = parser.parse_args()
+
+    with open(args.log, "r", encoding="utf-8") as f:
+        lines = [line.rstrip("\r\n") for line in f]
+    battle_parser = make_parser()
+    for line in lines:
+        battle_parser.parse_gen1_battle_data(line)
+    battle_state = battle_parser.battle_state
+
+    path = os.path.join(tempfile.gettempdir(), f"bridge_bench_{os.getpid()}")
+    bridge = EmulatorBridge(path=path)
+    try:
+        start = time.perf_counter()
+        for turn in range(10000):
+            bridge.publish(battle_state, turn)
+        publish_us = (time.perf_counter() - start) / 10000 * 1e6
+        print(f"publish(): {publish_us:.2f} us per turn")
+
+        results = multiprocessing.Queue()
+        process = multiprocessing.Process(target=reader, args=(path, args.turns, args.poll_ms / 1000, results))
+        process.start()
+        time.sleep(0.5)
+        # Turns arrive a few ms apart, unaligned with the reader's polling
+        for turn in range(args.turns):
+            bridge.publish(battle_state, turn)
+            time.sleep(0.003 + (turn % 7) * 0.001 + args.poll_ms / 1000)
+        latencies, torn = results.get(timeout=60)
+        process.join()
+
+        latencies_ms = [latency / 1e6 for latency in latencies]
+        print(f"reader polling every {args.poll_ms or 0:g} ms: {len(latencies)} turns, {torn} torn reads retried")
+        print(f"  latency p50 {percentile(latencies_ms, 0.5):.3f} ms  p99 {percentile(latencies_ms, 0.99):.3f} ms  "
+              f"max {max(latencies_ms):.3f} ms")
+    finally:
+        bridge.close()
+        os.remove(path)
+
+if __name__ == "__main__":
+    main()
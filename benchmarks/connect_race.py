@@ -0,0 +1,104 @@
+"""Compare sequential and staggered-race connects against local stand-in servers.
+
+Starts websocket servers whose handshakes are delayed by the given amounts plus
+one that accepts TCP but never answers, lists them slowest-first (the order the
+old sequential loop would hit a dead host in), then times the first connection
+each way. The race is run twice: the second start reads the connect times the
+first one saved and tries the fastest server first.
+
+    python benchmarks/connect_race.py [--delays-ms 1500 400 60] [--stagger-ms 250] [--timeout 10]
+"""
+import os
+import sys
+import time
+import asyncio
+import argparse
+import tempfile
+
+import websockets
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from showdown_client import ShowdownClient
+
+async def handshake_delay_server(delay):
+    """Websocket server that stalls each opening handshake for delay seconds"""
+    async def process_request(connection, request):
+        await asyncio.sleep(delay)
+        return None
+
+    async def handler(websocket):
+        await websocket.wait_closed()
+
+    server = await websockets.serve(handler, "127.0.0.1", 0, process_request=process_request)
+    return server, f"ws://127.0.0.1:{server.sockets[0].getsockname()[1]}/showdown/websocket"
+
+async def black_hole_server():
+    """Accepts TCP connections and never answers the handshake"""
+    writers = []
+    async def hold(reader, writer):
+        writers.append(writer)
+        await reader.read()
+
+    server = await asyncio.start_server(hold, "127.0.0.1", 0)
+    return server, f"ws://127.0.0.1:{server.sockets[0].getsockname()[1]}/showdown/websocket"
+
+async def sequential_connect(servers, timeout):
+    """The pre-race loop: one server at a time, first handshake wins"""
+    for server_uri in servers:
+        try:
+            return server_uri, await websockets.connect(server_uri, open_timeout=timeout)
+        except Exception:
+            continue
+    return None
+
+async def timed(label, connect):
+    start = time.perf_counter()
+    result = await connect()
+    elapsed = time.perf_counter() - start
+    if result is None:
+        print(f"{label:<12} no server reachable after {elapsed:.3f}s")
+        return
+    server_uri, websocket = result
+    print(f"{label:<12} connected to :{server_uri.split(':')[2].split('/')[0]} in {elapsed:.3f}s")
+    await websocket.close()
+
+async def run(args):
+    servers = []
+    hole, hole_uri = await black_hole_server()
+    servers.append(hole)
+    uris = [hole_uri]
+    for delay_ms in sorted(args.delays_ms, reverse=True):
+        server, uri = await handshake_delay_server(delay_ms / 1000)
+        servers.append(server)
+        uris.append(uri)
+    print("servers (list order): black hole, " + ", ".join(f"{delay} ms" for delay in sorted(args.delays_ms, reverse=True)))
+
+    latency_file = os.path.join(tempfile.mkdtemp(prefix="connect_race_"), "server_latency.json")
+    try:
+        await timed("sequential", lambda: sequential_connect(uris, args.timeout))
+        for label in ("race (cold)", "race (warm)"):
+            client = ShowdownClient("bench", "", None, connect_stagger=args.stagger_ms / 1000,
+                                    connect_timeout=args.timeout, latency_file=latency_file)
+            client.SERVERS = uris
+            client.load_server_latency()
+            client.start()
+            await timed(label, client.race_connect)
+    finally:
+        for server in servers:
+            server.close()
+        if os.path.exists(latency_file):
+            os.remove(latency_file)
+        os.rmdir(os.path.dirname(latency_file))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--delays-ms", type=float, nargs="+", default=[1500, 400, 60])
+    parser.add_argument("--stagger-ms", type=float, default=250)
+    parser.add_argument("--timeout", type=float, default=10.0, help="handshake timeout per server")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+if __name__ == "__main__":
+    main()
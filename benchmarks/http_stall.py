@@ -0,0 +1,100 @@
+"""Measure event-loop stall caused by HTTP calls against a local stub server.
+
+Compares the old pattern (a blocking HTTP call inside a coroutine, as
+ShowdownClient.login and PokemonAPI.query_pokemon_stats used to do) with
+the shared HttpSession.
+
+    python benchmarks/http_stall.py [--requests 20] [--delay 0.2]
+"""
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import threading
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from http_session import HttpSession
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Answers every request with a small JSON body after a fixed delay"""
+    delay = 0.2
+    protocol_version = "HTTP/1.1"
+
+    def _respond(self):
+        length = int(self.headers.get("Content-Length", 0) or 0)
+        if length:
+            self.rfile.read(length)
+        time.sleep(self.delay)
+        body = json.dumps({"assertion": "stub"}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self._respond()
+
+    def do_POST(self):
+        self._respond()
+
+    def log_message(self, format, *args):
+        pass
+
+async def monitor_stall(stop_event, interval=0.001):
+    """Record the longest time the loop failed to wake a 1 ms sleeper"""
+    loop = asyncio.get_running_loop()
+    worst = 0.0
+    while not stop_event.is_set():
+        start = loop.time()
+        await asyncio.sleep(interval)
+        worst = max(worst, loop.time() - start - interval)
+    return worst
+
+async def run_blocking(url, count):
+    for _ in range(count):
+        with urllib.request.urlopen(url, timeout=10) as response:
+            response.read()
+
+async def run_async(url, count):
+    http = HttpSession()
+    try:
+        await asyncio.gather(*(http.get(url) for _ in range(count)))
+    finally:
+        await http.close()
+
+async def measure(label, runner, url, count):
+    stop_event = asyncio.Event()
+    monitor = asyncio.create_task(monitor_stall(stop_event))
+    await asyncio.sleep(0)  # Let the monitor start its first sleep
+    start = time.perf_counter()
+    await runner(url, count)
+    elapsed = time.perf_counter() - start
+    stop_event.set()
+    worst_stall = await monitor
+    print(f"{label:<10} {count} requests in {elapsed * 1000:8.1f} ms, worst loop stall {worst_stall * 1000:8.1f} ms")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--delay", type=float, default=0.2, help="stub server response delay in seconds")
+    args = parser.parse_args()
+
+    StubHandler.delay = args.delay
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/"
+
+    try:
+        asyncio.run(measure("blocking", run_blocking, url, args.requests))
+        asyncio.run(measure("async", run_async, url, args.requests))
+    finally:
+        server.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Measure the per-line cost of Logger.log_message on the calling thread.
+
+Feeds recorded server lines (including |request| JSON) at a fixed rate through
+the old synchronous logger (format, print, write + flush, callbacks inline)
+and the queued Logger, with a terminal and GUI callback that are slow to
+respond, then through a Logger whose sinks all exclude RAW, and reports the
+time each call took on the producer thread.
+
+    python benchmarks/logger_throughput.py [--rate 10000] [--seconds 3] [--slow-ms 2]
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from logger import Logger
+
+DEFAULT_LOG = os.path.join(ROOT, "benchmarks", "data", "gen1ou_sample.log")
+
+class LegacyLogger:
+    """The pre-queue Logger.log_message: everything inline on the caller's thread"""
+
+    def __init__(self, log_filename, console):
+        self.log_file = open(log_filename, "a", encoding="utf-8")
+        self.console = console
+        self.callbacks = []
+
+    def log_message(self, message, log_type="INFO", room=None):
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        if room:
+            formatted_msg = f"[{timestamp}] [{log_type}] [{room}] {message}"
+        else:
+            formatted_msg = f"[{timestamp}] [{log_type}] {message}"
+        print(formatted_msg, file=self.console)
+        self.log_file.write(formatted_msg + "\n")
+        self.log_file.flush()
+        for callback in self.callbacks[:]:
+            callback(formatted_msg, log_type, timestamp)
+
+    def close(self):
+        self.log_file.close()
+
+def slow_callback(delay):
+    """A GUI/terminal stand-in that occasionally stalls for delay seconds"""
+    calls = [0]
+    def callback(formatted_msg, log_type, timestamp):
+        calls[0] += 1
+        if delay and calls[0] % 100 == 0:
+            time.sleep(delay)
+    return callback
+
+def drive(logger, lines, rate, seconds):
+    """Call log_message at a fixed rate; returns per-call durations in microseconds"""
+    interval = 1.0 / rate
+    total = int(rate * seconds)
+    durations = []
+    start = time.perf_counter()
+    for i in range(total):
+        line = lines[i % len(lines)]
+        before = time.perf_counter()
+        logger.log_message(line, "RAW", "battle-gen1ou-1")
+        after = time.perf_counter()
+        durations.append((after - before) * 1e6)
+        # Pace to the target rate without sleeping past it
+        delay = start + (i + 1) * interval - after
+        if delay > 0:
+            time.sleep(delay)
+    return durations, time.perf_counter() - start
+
+def report(label, durations, elapsed):
+    ordered = sorted(durations)
+    pick = lambda fraction: ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+    print(f"{label:<9} {len(durations)} lines in {elapsed:5.2f}s ({len(durations) / elapsed:8,.0f}/s)  "
+          f"per line p50 {pick(0.5):7.1f} us  p99 {pick(0.99):8.1f} us  max {ordered[-1]:9.1f} us")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rate", type=int, default=10000, help="lines per second")
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--slow-ms", type=float, default=2.0, help="stall of the slow callback every 100 lines")
+    parser.add_argument("--log", default=DEFAULT_LOG)
+    args = parser.parse_args()
+
+    with open(args.log, "r", encoding="utf-8") as f:
+        lines = [line.rstrip("\r\n") for line in f if line.strip()]
+
+    directory = tempfile.mkdtemp(prefix="logger_bench_")
+    console = open(os.devnull, "w", encoding="utf-8")
+    try:
+        legacy = LegacyLogger(os.path.join(directory, "legacy.txt"), console)
+        legacy.callbacks.append(slow_callback(args.slow_ms / 1000))
+        durations, elapsed = drive(legacy, lines, args.rate, args.seconds)
+        legacy.close()
+        report("sync", durations, elapsed)
+
+        queued = Logger(os.path.join(directory, "queued.txt"), console=False)
+        queued.add_callback(slow_callback(args.slow_ms / 1000))
+        queued.open_log_file()
+        durations, elapsed = drive(queued, lines, args.rate, args.seconds)
+        drain_start = time.perf_counter()
+        queued.close_log_file()
+        report("queued", durations, elapsed)
+        print(f"queued: writer drained the backlog {1000 * (time.perf_counter() - drain_start):.1f} ms after the last line")
+        queued.shutdown()
+
+        # Headless: RAW is enabled for no sink, so log_message returns before queueing
+        filtered = Logger(os.path.join(directory, "filtered.txt"), console=False,
+                          file_types={"BATTLE", "BATTLE_STATE", "ERROR", "INFO"})
+        filtered.open_log_file()
+        durations, elapsed = drive(filtered, lines, args.rate, args.seconds)
+        filtered.close_log_file()
+        report("filtered", durations, elapsed)
+        filtered.shutdown()
+    finally:
+        console.close()
+        for name in os.listdir(directory):
+            os.remove(os.path.join(directory, name))
+        os.rmdir(directory)
+
+if __name__ == "__main__":
+    main()
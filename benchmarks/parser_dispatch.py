@@ -0,0 +1,97 @@
+"""Replay a recorded battle log through the old substring-scan parser path
+and the table-driven dispatcher, reporting lines/sec for each.
+
+    python benchmarks/parser_dispatch.py [log_file] [--repeat 200]
+"""
+import os
+import sys
+import time
+import argparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from battle_state import BattleState
+from battle_parser import BattleParser
+from pokemon_api import PokemonAPI
+
+DEFAULT_LOG = os.path.join(ROOT, "benchmarks", "data", "gen1ou_sample.log")
+
+# Base HP for the sample log's species so switches resolve from the in-memory Pokedex
+SAMPLE_BASE_HP = {
+    "alakazam": 55, "chansey": 250, "tauros": 75, "snorlax": 160,
+    "exeggutor": 95, "starmie": 60, "jynx": 65
+}
+
+def legacy_parse(parser, line):
+    """The pre-dispatcher substring cascade, calling the same handlers"""
+    try:
+        if '|move|' in line:
+            parser._parse_move(line, line.split('|'))
+        elif '|-crit|' in line:
+            parser._parse_critical_hit(line, line.split('|'))
+        elif '|-miss|' in line:
+            parser._parse_miss(line, line.split('|'))
+        elif '|-damage|' in line:
+            parser._parse_damage(line, line.split('|'))
+        elif '|-status|' in line:
+            parser._parse_status(line, line.split('|'))
+        elif '|-curestatus|' in line:
+            parser._parse_status_recovery(line, line.split('|'))
+        elif '|cant|' in line:
+            parser._parse_cant_move(line, line.split('|'))
+        elif '|-activate|' in line and 'confusion' in line:
+            parser._parse_confusion_activate(line, line.split('|'))
+        elif 'hurt itself in its confusion' in line.lower() or '[from] confusion' in line:
+            parser._parse_confusion_damage(line, line.split('|'))
+        elif '|-end|' in line and 'confusion' in line:
+            parser._parse_confusion_end(line, line.split('|'))
+        elif '|-unboost|' in line or '|-boost|' in line:
+            parser._parse_stat_change(line, line.split('|'))
+        elif '|turn|' in line:
+            parser._parse_turn(line, line.split('|'))
+        elif '|switch|' in line or '|drag|' in line:
+            parser._parse_switch(line, line.split('|'))
+        elif '|request|' in line:
+            parser._parse_request(line, line.split('|', 2))
+        elif '|faint|' in line:
+            parser._parse_faint(line, line.split('|'))
+        elif '|-heal|' in line:
+            parser._parse_heal(line, line.split('|'))
+    except Exception as e:
+        parser.log(f"Error parsing battle data: {str(e)}", "ERROR")
+
+def make_parser():
+    def log(message, log_type="INFO"):
+        pass
+    api = PokemonAPI()
+    api.pokedex.species = {name: [hp, 0, 0, 0, 0, 0] for name, hp in SAMPLE_BASE_HP.items()}
+    return BattleParser(BattleState(log), api, log)
+
+def run(label, parse, lines, repeat):
+    parser = make_parser()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        parser.battle_state.reset_all()
+        for line in lines:
+            parse(parser, line)
+    elapsed = time.perf_counter() - start
+    total = len(lines) * repeat
+    print(f"{label:<12} {total} lines in {elapsed:.3f}s  {total / elapsed:12,.0f} lines/sec")
+    return total / elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("log_file", nargs="?", default=DEFAULT_LOG)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    with open(args.log_file, "r", encoding="utf-8") as f:
+        lines = [line.rstrip("\n") for line in f if line.strip()]
+
+    old_rate = run("substring", legacy_parse, lines, args.repeat)
+    new_rate = run("dispatch", BattleParser.parse_gen1_battle_data, lines, args.repeat)
+    print(f"speedup: {new_rate / old_rate:.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Measure the cost of one switch-in: name-keyed move registry vs the six-slot Party.
+
+The registry path is the old update_*_pokemon: overwrite the single active
+Pokemon, copy the registry's move lists into it and build the "Restored ...
+moves" log string. The Party path claims the slot by switch name and repoints
+the active Pokemon at it.
+
+    python benchmarks/party_switch.py [--switches 200000]
+"""
+import os
+import sys
+import time
+import argparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from battle_state import BattleState, Party, Pokemon
+
+TEAM = ("alakazam", "chansey", "tauros", "snorlax", "exeggutor", "starmie")
+MOVES = (("Psychic", 0x5E, 16), ("Thunder Wave", 0x56, 32), ("Recover", 0x69, 32), ("Seismic Toss", 0x45, 32))
+
+def registry_switches(names, log):
+    """Active Pokemon plus {name: move lists}, copied on every switch"""
+    active = Pokemon()
+    registry = {}
+    for name in names:
+        active.nickname = name
+        active.species_name = name
+        active.level = 100
+        active.currentHP = 100
+        active.maxHP = 100
+        moves = registry.get(name)
+        if moves is not None:
+            active.moves = moves["moves"].copy()
+            active.movesPP = moves["movesPP"].copy()
+            active.move_names = moves["move_names"].copy()
+            log(f"Restored {name} moves from registry: {[move for move in moves['move_names'] if move]}", "BATTLE_STATE")
+        else:
+            registry[name] = {
+                "moves": [move_id for _, move_id, _ in MOVES],
+                "movesPP": [pp for _, _, pp in MOVES],
+                "move_names": [move_name for move_name, _, _ in MOVES]
+            }
+            log(f"Registered new player Pokemon for move tracking: {name}", "BATTLE_STATE")
+    return active
+
+def party_switches(names, log):
+    """BattleState.update_player_pokemon over a Party, with BATTLE_STATE filtered out"""
+    battle_state = BattleState(log, log_enabled=lambda log_type: False)
+    for name in names:
+        battle_state.update_player_pokemon(name, 100, 100)
+    return battle_state.player_pokemon
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--switches", type=int, default=200000)
+    args = parser.parse_args()
+
+    names = [TEAM[i % len(TEAM)] for i in range(args.switches)]
+    log = lambda message, log_type="INFO": None
+    baseline = None
+    for label, run in (("registry", registry_switches), ("party", party_switches)):
+        start = time.perf_counter()
+        run(names, log)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"{label:<9} {args.switches} switches in {elapsed:5.2f}s  "
+              f"{1e6 * elapsed / args.switches:6.2f} us/switch  ({elapsed / baseline:.2f}x)")
+
+    party = Party()
+    for name in TEAM:
+        party.claim(name)
+    print(f"party records: {len(party.pack())} bytes ({Party.SIZE} x {Party.RECORD.size})")
+
+if __name__ == "__main__":
+    main()
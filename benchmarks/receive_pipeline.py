@@ -0,0 +1,90 @@
+"""Measure battle-line latency behind slow non-battle handling, inline vs pipelined.
+
+A local server sends a chat frame for a lobby room and a battle frame for a
+battle room every --interval-ms. Handling a lobby line awaits --chat-ms (slow
+log I/O, GUI), battle lines are handled immediately. Inline reads the next
+frame only after the previous one was handled, like the old
+ShowdownClient.handle_message loop; pipelined uses ShowdownClient's reader task
+and per-lane consumers. Reports how long after being sent each battle line was
+handled.
+
+    python benchmarks/receive_pipeline.py [--frames 400] [--interval-ms 5] [--chat-ms 20]
+"""
+import os
+import sys
+import time
+import asyncio
+import argparse
+
+import websockets
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from showdown_client import ShowdownClient
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+def make_server(frames, interval):
+    async def serve(websocket):
+        for i in range(frames):
+            await websocket.send(f">lobby\n|c|user{i % 7}|chat message {i}")
+            await websocket.send(f">battle-gen1ou-1\n|bench|{time.perf_counter()}")
+            await asyncio.sleep(interval)
+        await websocket.close()
+    return serve
+
+def make_handler(chat_delay, latencies):
+    async def handler(line, room):
+        if room.startswith("battle-"):
+            latencies.append(time.perf_counter() - float(line.split("|")[2]))
+        elif chat_delay:
+            await asyncio.sleep(chat_delay)
+    return handler
+
+async def inline(uri, client):
+    """The pre-pipeline loop: each frame is fully handled before the next recv"""
+    async with websockets.connect(uri) as websocket:
+        try:
+            async for message in websocket:
+                await client.handle_message(message)
+        except websockets.exceptions.ConnectionClosed:
+            pass
+
+async def pipelined(uri, client):
+    client.SERVERS = [uri]
+    client.start()
+    await client.connect_once()
+    for lane in client.lanes:
+        print(f"  {lane.summary()}")
+
+async def run(args):
+    server = await websockets.serve(make_server(args.frames, args.interval_ms / 1000), "127.0.0.1", 0)
+    uri = f"ws://127.0.0.1:{server.sockets[0].getsockname()[1]}/showdown/websocket"
+    try:
+        for label, mode in (("inline", inline), ("pipelined", pipelined)):
+            latencies = []
+            client = ShowdownClient("bench", "", make_handler(args.chat_ms / 1000, latencies),
+                                    log_callback=lambda message, log_type="INFO": None, latency_file=None)
+            start = time.perf_counter()
+            await mode(uri, client)
+            elapsed = time.perf_counter() - start
+            latencies_ms = [latency * 1000 for latency in latencies]
+            print(f"{label:<10} {len(latencies)} battle lines in {elapsed:.2f}s, send-to-handled "
+                  f"p50 {percentile(latencies_ms, 0.5):8.2f} ms  p99 {percentile(latencies_ms, 0.99):8.2f} ms  "
+                  f"max {max(latencies_ms):8.2f} ms")
+    finally:
+        server.close()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=400)
+    parser.add_argument("--interval-ms", type=float, default=5.0)
+    parser.add_argument("--chat-ms", type=float, default=20.0)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+if __name__ == "__main__":
+    main()
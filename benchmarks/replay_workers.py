@@ -0,0 +1,53 @@
+"""Report replay ingestion throughput (replays/sec) at 1, 2, 4 and N workers.
+
+Builds a synthetic corpus by copying a recorded battle log, then runs the
+replay.py serial and process-pool paths over it.
+
+    python benchmarks/replay_workers.py [--replays 2000] [--log benchmarks/data/gen1ou_sample.log]
+"""
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from replay import run_serial, run_parallel
+
+DEFAULT_LOG = os.path.join(ROOT, "benchmarks", "data", "gen1ou_sample.log")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--replays", type=int, default=2000)
+    parser.add_argument("--log", default=DEFAULT_LOG)
+    args = parser.parse_args()
+
+    cores = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, cores})
+
+    corpus = tempfile.mkdtemp(prefix="replay_bench_")
+    try:
+        for i in range(args.replays):
+            shutil.copyfile(args.log, os.path.join(corpus, f"battle-gen1ou-{i:06d}.log"))
+
+        baseline = None
+        for workers in worker_counts:
+            with open(os.devnull, "w", encoding="utf-8") as output:
+                start = time.perf_counter()
+                if workers == 1:
+                    replays, lines, turns = run_serial([corpus], "*.log", output)
+                else:
+                    replays, lines, turns = run_parallel([corpus], "*.log", output, workers)
+                elapsed = time.perf_counter() - start
+            rate = replays / elapsed
+            baseline = baseline or rate
+            print(f"{workers:>3} worker(s): {replays} replays in {elapsed:6.2f}s  "
+                  f"{rate:9.1f} replays/sec  ({rate / baseline:.2f}x)")
+    finally:
+        shutil.rmtree(corpus, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Compare the per-turn cost of handling |request| payloads.
+
+"json" is the old _parse_request: json.loads of the whole payload, then a scan
+for the active Pokemon's condition. "parse" is the JSON backend alone (orjson
+when installed). "snapshot" is RequestSnapshot.update, which parses, reuses
+unchanged party members and builds exact stats, moves and PP for all six;
+"snapshot+apply" adds copying that into BattleState at |turn|.
+
+    python benchmarks/request_parse.py [--log benchmarks/data/gen1ou_sample.log] [--rounds 500]
+"""
+import os
+import sys
+import json
+import time
+import argparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import request_snapshot
+from battle_state import BattleState
+from request_snapshot import RequestSnapshot
+
+DEFAULT_LOG = os.path.join(ROOT, "benchmarks", "data", "gen1ou_sample.log")
+
+def old_parse(payload):
+    request_data = json.loads(payload)
+    for pokemon in request_data['side']['pokemon']:
+        if pokemon.get('active', False) and '/' in pokemon.get('condition', ''):
+            hp_parts = pokemon['condition'].split('/')
+            return int(hp_parts[0]), int(hp_parts[1].split()[0])
+    return None
+
+def run_json(payloads, rounds):
+    for _ in range(rounds):
+        for payload in payloads:
+            old_parse(payload)
+
+def run_snapshot(payloads, rounds):
+    for _ in range(rounds):
+        snapshot = RequestSnapshot()
+        for payload in payloads:
+            snapshot.update(payload)
+
+def run_snapshot_apply(payloads, rounds):
+    for _ in range(rounds):
+        battle_state = BattleState()
+        for payload in payloads:
+            battle_state.player_request.update(payload)
+            battle_state.apply_player_request()
+
+def parse_only(payloads, rounds):
+    loads = request_snapshot.json_loads
+    for _ in range(rounds):
+        for payload in payloads:
+            loads(payload)
+
+def measure(runs, payloads, rounds, repeat=5):
+    """Best of repeat interleaved runs, so scheduler noise hits every variant alike"""
+    best = {}
+    for _ in range(repeat):
+        for label, func in runs:
+            start = time.perf_counter()
+            func(payloads, rounds)
+            elapsed = time.perf_counter() - start
+            best[label] = min(best.get(label, elapsed), elapsed)
+    per_request = {label: elapsed / (rounds * len(payloads)) * 1e6 for label, elapsed in best.items()}
+    for label, _ in runs:
+        print(f"{label:<16} {per_request[label]:7.2f} us per |request|")
+    return per_request
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--log", default=DEFAULT_LOG)
+    parser.add_argument("--rounds", type=int, default=500)
+    args = parser.parse_args()
+
+    with open(args.log, "r", encoding="utf-8") as f:
+        payloads = [line.rstrip("\r\n").split("|", 2)[2] for line in f if line.startswith("|request|")]
+    print(f"{len(payloads)} payloads, avg {sum(map(len, payloads)) // len(payloads)} bytes, "
+          f"JSON backend: {'orjson' if request_snapshot.orjson else 'json'}")
+
+    backend = "orjson" if request_snapshot.orjson else "json"
+    results = measure([
+        ("json", run_json),
+        (f"{backend} parse", parse_only),
+        ("snapshot", run_snapshot),
+        ("snapshot+apply", run_snapshot_apply)
+    ], payloads, args.rounds)
+    print(f"parse only vs json: {results['json'] / results[f'{backend} parse']:.2f}x, "
+          f"snapshot (parse, diff, six members) vs json: {results['json'] / results['snapshot']:.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Measure per-battle memory with tracemalloc for many concurrent sessions.
+
+Compares the old dict-based turn flags, active Pokemon and move registries
+against the __slots__ TurnState and six-slot Party classes, then measures full
+BattleSessions that have each parsed a recorded battle log.
+
+    python benchmarks/session_memory.py [--sessions 10000] [--log benchmarks/data/gen1ou_sample.log]
+"""
+import os
+import sys
+import time
+import argparse
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from battle_state import TurnState, Party
+from battle_session import BattleSession
+from pokemon_api import PokemonAPI
+from parser_dispatch import SAMPLE_BASE_HP
+
+DEFAULT_LOG = os.path.join(ROOT, "benchmarks", "data", "gen1ou_sample.log")
+
+# Six Pokemon per side, four known moves each, as in a finished 6v6 battle
+TEAM = ("alakazam", "chansey", "tauros", "snorlax", "exeggutor", "starmie")
+MOVES = (("Psychic", 0x5E, 16), ("Thunder Wave", 0x56, 32), ("Recover", 0x69, 32), ("Seismic Toss", 0x45, 32))
+
+def legacy_pokemon():
+    """The dict layout _create_empty_pokemon used to return"""
+    return {
+        "nickname": "", "species": 0x00, "species_name": "", "currentHP": 0, "maxHP": 0,
+        "level": 100, "type1": 0x00, "type2": 0x00,
+        "moves": [0, 0, 0, 0], "movesPP": [0, 0, 0, 0], "move_names": ["", "", "", ""],
+        "attack": 0, "defense": 0, "speed": 0, "special": 0
+    }
+
+def legacy_battle():
+    """Turn flags, active Pokemon and move registries in the old dict layout"""
+    state = TurnState().as_dict()
+    sides = []
+    for _ in range(2):
+        registry = {}
+        for name in TEAM:
+            registry[name] = {
+                "moves": [move_id for _, move_id, _ in MOVES],
+                "movesPP": [pp for _, _, pp in MOVES],
+                "move_names": [move_name for move_name, _, _ in MOVES]
+            }
+        active = legacy_pokemon()
+        active["species_name"] = TEAM[-1]
+        # Switch-in copied the registry lists into the active Pokemon
+        for key in ("moves", "movesPP", "move_names"):
+            active[key] = registry[TEAM[-1]][key].copy()
+        sides.append((active, registry))
+    return state, sides
+
+def slots_battle():
+    """The same data held in TurnState and a Party of __slots__ Pokemon per side"""
+    state = TurnState()
+    sides = []
+    for _ in range(2):
+        party = Party()
+        for name in TEAM:
+            pokemon = party.slots[party.claim(name)]
+            for i, (move_name, move_id, pp) in enumerate(MOVES):
+                pokemon.moves[i] = move_id
+                pokemon.movesPP[i] = pp
+                pokemon.move_names[i] = move_name
+        active = party.switch_in(party.index(TEAM[-1]))
+        sides.append((active, party))
+    return state, sides
+
+def measure(label, factory, count, baseline=None):
+    """Build count objects with factory and report traced bytes per object"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    kept = [factory(i) for i in range(count)]
+    elapsed = time.perf_counter() - start
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del kept
+
+    ratio = f"  ({used / baseline:.2f}x)" if baseline else ""
+    print(f"{label:<28} {count} x {used / count:9,.0f} bytes = {used / 2**20:8.1f} MiB in {elapsed:5.2f}s{ratio}")
+    return used
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=10000)
+    parser.add_argument("--log", default=DEFAULT_LOG)
+    args = parser.parse_args()
+
+    with open(args.log, "r", encoding="utf-8") as f:
+        lines = [line.rstrip("\r\n") for line in f]
+
+    # Keep switches off the network: base HP comes from the in-memory Pokedex
+    pokemon_api = PokemonAPI()
+    pokemon_api.pokedex.species = {name: [hp, 0, 0, 0, 0, 0] for name, hp in SAMPLE_BASE_HP.items()}
+
+    def parsed_session(i):
+        session = BattleSession(f"battle-gen1ou-{i}", pokemon_api, lambda message, log_type="INFO": None)
+        for line in lines:
+            session.battle_parser.parse_gen1_battle_data(line)
+        return session
+
+    legacy = measure("dict state/pokemon/registry", lambda i: legacy_battle(), args.sessions)
+    measure("__slots__ classes", lambda i: slots_battle(), args.sessions, legacy)
+    measure("full BattleSession (parsed)", parsed_session, args.sessions)
+
+if __name__ == "__main__":
+    main()
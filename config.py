@@ -7,20 +7,40 @@ class Config:
         self.config = configparser.ConfigParser()
         
     def load_credentials(self):
-        """Load saved credentials from config file"""
+        """Load credentials from SHOWDOWN_USERNAME/SHOWDOWN_PASSWORD, else the config file
+        
+        The password may be empty when it isn't remembered; a saved login session is
+        used instead when there is one.
+        """
+        env_username = os.environ.get("SHOWDOWN_USERNAME", "")
+        env_password = os.environ.get("SHOWDOWN_PASSWORD", "")
+        if env_username and env_password:
+            return env_username, env_password
+            
+        username, password = "", ""
         if os.path.exists(self.config_file):
             self.config.read(self.config_file)
             if "credentials" in self.config:
                 username = self.config["credentials"].get("username", "")
                 password = self.config["credentials"].get("password", "")
-                return username, password
-        return "", ""
+        if env_username and env_username != username:
+            return env_username, ""
+        return username, password
+        
+    def load_remember_password(self):
+        """Whether the password should be written to the config file (default: no, opt-in)"""
+        if os.path.exists(self.config_file):
+            self.config.read(self.config_file)
+            if "credentials" in self.config:
+                return self.config["credentials"].getboolean("remember_password", False)
+        return False
                 
-    def save_credentials(self, username, password):
-        """Save credentials to config file"""
+    def save_credentials(self, username, password, remember_password=False):
+        """Save credentials to config file, leaving the password out unless it is remembered"""
         self.config["credentials"] = {
             "username": username,
-            "password": password
+            "password": password if remember_password else "",
+            "remember_password": "yes" if remember_password else "no"
         }
         with open(self.config_file, "w") as f:
-            self.config.write(f)
\ No newline at end of file
+            self.config.write(f)
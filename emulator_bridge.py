@@ -0,0 +1,142 @@
+import os
+import sys
+import mmap
+import time
+import struct
+import tempfile
+
+from battle_state import Party
+from gen1_data import SPECIES_TYPES
+
+class EmulatorBridge:
+    """Publish each completed turn's BattleState to the BizHawk Lua script over shared memory
+
+    The block is a named memory-mapped file (Windows, opened from Lua with
+    comm.mmfReadBytes) or a file-backed mapping elsewhere. Every field is
+    little-endian at a fixed offset, mirrored by BRIDGE in PokemonBattleData.lua:
+
+        0   u32  head sequence (written last)
+        4   u32  turn number
+        8   u64  publish time (time.monotonic_ns)
+        16  RNG block: playerFirst, flinched, then per side (player, enemy)
+            u16 damage, u8 crit, moveMiss, statDownEffect, fullyParalyzed,
+            hitConfuse, statused, wokeUp, snappedOut
+        38  Pokemon block per side (player, enemy): u8 species, level, type1, type2,
+            u16 currentHP, maxHP, u8 moves[4], movesPP[4],
+            u16 attack, defense, speed, special, 11-byte ASCII nickname
+        108 Party block per side (player, enemy): u8 slots claimed, active slot
+            (0xFF before the first switch), six 44-byte Gen 1 party records
+            (big-endian, exactly as in WRAM), six 11-byte ASCII nicknames
+        772 u32  tail sequence (written first)
+
+    A reader accepts a snapshot only when head == tail, so it never acts on a
+    half-written turn.
+    """
+
+    DEFAULT_NAME = "ShowdownBattleState"
+
+    HEADER = struct.Struct("<IIQ")
+    RNG_SIDE = struct.Struct("<HBBBBBBBB")
+    POKEMON = struct.Struct("<BBBBHH4B4BHHHH11s")
+    TAIL = struct.Struct("<I")
+    NICK_SIZE = 11
+    PARTY_SIZE = 2 + Party.SIZE * (Party.RECORD.size + NICK_SIZE)
+
+    RNG_OFFSET = HEADER.size
+    POKEMON_OFFSET = RNG_OFFSET + 2 + 2 * RNG_SIDE.size
+    PARTY_OFFSET = POKEMON_OFFSET + 2 * POKEMON.size
+    TAIL_OFFSET = PARTY_OFFSET + 2 * PARTY_SIZE
+    SIZE = TAIL_OFFSET + TAIL.size
+
+    def __init__(self, name=DEFAULT_NAME, path=None):
+        self.name = name
+        self.sequence = 0
+        self.file = None
+        if sys.platform == "win32" and path is None:
+            # Named mapping in the page file, shared with BizHawk's comm.mmf* functions
+            self.path = None
+            self.buffer = mmap.mmap(-1, self.SIZE, tagname=name)
+        else:
+            self.path = path or os.path.join(tempfile.gettempdir(), name)
+            self.file = open(self.path, "a+b")
+            self.file.truncate(self.SIZE)
+            self.buffer = mmap.mmap(self.file.fileno(), self.SIZE)
+        self.buffer[:self.SIZE] = bytes(self.SIZE)
+
+    @staticmethod
+    def _clamp(value, limit):
+        return max(0, min(int(value), limit))
+
+    def _pack_side(self, state, side):
+        return self.RNG_SIDE.pack(
+            self._clamp(state[f"{side}Damage"], 0xFFFF),
+            self._clamp(state[f"{side}Crit"], 0xFF),
+            self._clamp(state[f"{side}MoveMiss"], 0xFF),
+            1 if state[f"{side}StatDownEffect"] else 0,
+            1 if state[f"{side}FullyParalyzed"] else 0,
+            1 if state[f"{side}HitConfuse"] else 0,
+            1 if state[f"{side}Statused"] else 0,
+            1 if state[f"{side}WokeUp"] else 0,
+            1 if state[f"{side}SnappedOut"] else 0
+        )
+
+    @classmethod
+    def _nickname(cls, pokemon):
+        return pokemon.species_name.upper().encode("ascii", "ignore")[:cls.NICK_SIZE]
+
+    def _pack_pokemon(self, battle_state, pokemon):
+        clamp = self._clamp
+        nickname = self._nickname(pokemon)
+        species = pokemon.species or battle_state.get_species_id(pokemon.species_name)
+        # Types follow from the species; the slot's own values only for an unknown species
+        type1, type2 = SPECIES_TYPES.get(species, (pokemon.type1, pokemon.type2))
+        return self.POKEMON.pack(
+            species, clamp(pokemon.level, 0xFF), type1, type2,
+            clamp(pokemon.currentHP, 0xFFFF), clamp(pokemon.maxHP, 0xFFFF),
+            *pokemon.moves, *(clamp(pp, 0x3F) for pp in pokemon.movesPP),
+            clamp(pokemon.attack, 0xFFFF), clamp(pokemon.defense, 0xFFFF),
+            clamp(pokemon.speed, 0xFFFF), clamp(pokemon.special, 0xFFFF),
+            nickname
+        )
+
+    def _pack_party(self, party):
+        nicknames = b"".join(self._nickname(pokemon).ljust(self.NICK_SIZE, b"\0") for pokemon in party.slots)
+        active = party.active if party.active >= 0 else 0xFF
+        return bytes((min(party.count, Party.SIZE), active)) + party.pack() + nicknames
+
+    def publish(self, battle_state, turn):
+        """Write one turn's state; usable directly as a BattleParser turn callback"""
+        state = battle_state.state
+        payload = b"".join((
+            bytes((1 if state.playerFirst else 0, 1 if state.flinched else 0)),
+            self._pack_side(state, "player"),
+            self._pack_side(state, "enemy"),
+            self._pack_pokemon(battle_state, battle_state.player_pokemon),
+            self._pack_pokemon(battle_state, battle_state.enemy_pokemon),
+            self._pack_party(battle_state.player_party),
+            self._pack_party(battle_state.enemy_party)
+        ))
+        self.sequence = (self.sequence + 1) & 0xFFFFFFFF
+        turn_number = int(turn) if str(turn).isdigit() else 0
+
+        # Tail first, head last: a reader that sees head == tail saw a complete write
+        buffer = self.buffer
+        buffer[self.TAIL_OFFSET:self.SIZE] = self.TAIL.pack(self.sequence)
+        buffer[4:self.RNG_OFFSET] = struct.pack("<IQ", turn_number, time.monotonic_ns())
+        buffer[self.RNG_OFFSET:self.TAIL_OFFSET] = payload
+        buffer[0:4] = self.TAIL.pack(self.sequence)
+        return self.sequence
+
+    def read(self):
+        """Return (sequence, turn, published_ns, payload) for a complete snapshot, or None"""
+        data = self.buffer[:self.SIZE]
+        head, turn, published_ns = self.HEADER.unpack_from(data)
+        tail, = self.TAIL.unpack_from(data, self.TAIL_OFFSET)
+        if head != tail or head == 0:
+            return None
+        return head, turn, published_ns, data[self.RNG_OFFSET:self.TAIL_OFFSET]
+
+    def close(self):
+        self.buffer.close()
+        if self.file:
+            self.file.close()
@@ -1,10 +1,72 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
+import queue
+from collections import deque
+
+class BoundedLogPane:
+    """A ScrolledText log that keeps only its last max_lines lines
+    
+    Line counts are tracked per appended message, so trimming deletes the oldest
+    messages by index instead of reading the whole widget back on every insert.
+    """
+    def __init__(self, parent, max_lines, **text_options):
+        self.text = scrolledtext.ScrolledText(parent, **text_options)
+        self.max_lines = max_lines
+        self.message_lines = deque()  # Lines taken by each message, oldest first
+        self.line_count = 0
+        
+    def pack(self, **options):
+        self.text.pack(**options)
+        
+    def append(self, message):
+        """Append one message and drop the oldest ones past max_lines"""
+        self.append_many((message,))
+        
+    def append_many(self, messages):
+        """Append a batch of messages with a single insert"""
+        counts = [message.count("\n") + 1 for message in messages]
+        # A burst longer than the pane only needs its tail inserted
+        first = 0
+        batch_lines = sum(counts)
+        while batch_lines > self.max_lines and first < len(counts) - 1:
+            batch_lines -= counts[first]
+            first += 1
+        if first == len(counts):
+            return
+        self.text.insert(tk.END, "\n".join(messages[first:]) + "\n")
+        self.message_lines.extend(counts[first:])
+        self.line_count += batch_lines
+        
+        excess = 0
+        while self.line_count - excess > self.max_lines and len(self.message_lines) > 1:
+            excess += self.message_lines.popleft()
+        if excess:
+            # Line excess + 1 is the first line that stays
+            self.text.delete("1.0", f"{excess + 1}.0")
+            self.line_count -= excess
+        self.text.see(tk.END)
+        
+    def clear(self):
+        self.text.delete("1.0", tk.END)
+        self.message_lines.clear()
+        self.line_count = 0
 
 class ShowdownGUI:
-    def __init__(self, on_start_callback, on_stop_callback):
+    # Pending log lines and battle state redraws are applied at most this often
+    UPDATE_INTERVAL_MS = 33
+    
+    def __init__(self, on_start_callback, on_stop_callback, has_saved_session=None):
         self.on_start = on_start_callback
         self.on_stop = on_stop_callback
+        # username -> whether a saved login session lets the password be left empty
+        self.has_saved_session = has_saved_session or (lambda username: False)
+        
+        # Filled from the logger/network threads, drained only on the Tk thread
+        self.pending_logs = queue.SimpleQueue()
+        self.state_provider = None  # Returns the battle state text; set with the dirty flag
+        self.state_dirty = False
+        self.update_job = None
+        
         self.setup_gui()
         
     def setup_gui(self):
@@ -27,9 +89,12 @@ class ShowdownGUI:
         self.password_entry = ttk.Entry(main_frame, width=30, show="*")
         self.password_entry.grid(row=2, column=1, sticky=(tk.W, tk.E), pady=5)
         
+        self.remember_password_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(main_frame, text="Remember password", variable=self.remember_password_var).grid(row=3, column=1, sticky=tk.W)
+        
         # Buttons
         button_frame = ttk.Frame(main_frame)
-        button_frame.grid(row=3, column=0, columnspan=2, pady=20)
+        button_frame.grid(row=4, column=0, columnspan=2, pady=20)
         
         self.connect_btn = ttk.Button(button_frame, text="Start Gen 1 Logging", command=self.start_logging)
         self.connect_btn.pack(side=tk.LEFT, padx=5)
@@ -39,11 +104,11 @@ class ShowdownGUI:
         
         # Status
         self.status_label = ttk.Label(main_frame, text="Status: Disconnected", foreground="red")
-        self.status_label.grid(row=4, column=0, columnspan=2, pady=10)
+        self.status_label.grid(row=5, column=0, columnspan=2, pady=10)
         
         # Create notebook for tabs
         notebook = ttk.Notebook(main_frame)
-        notebook.grid(row=5, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(10, 0))
+        notebook.grid(row=6, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(10, 0))
         
         # Battle State Tab
         state_frame = ttk.Frame(notebook)
@@ -60,8 +125,8 @@ class ShowdownGUI:
         
         ttk.Label(battle_frame, text="Battle Events Log:", font=("Arial", 10, "bold")).pack(anchor=tk.W, pady=(5, 5))
         
-        self.battle_log_text = scrolledtext.ScrolledText(battle_frame, width=70, height=20, font=("Consolas", 8))
-        self.battle_log_text.pack(fill=tk.BOTH, expand=True, pady=5)
+        self.battle_log = BoundedLogPane(battle_frame, 200, width=70, height=20, font=("Consolas", 8))
+        self.battle_log.pack(fill=tk.BOTH, expand=True, pady=5)
         
         # Full Log Tab
         full_log_frame = ttk.Frame(notebook)
@@ -69,17 +134,18 @@ class ShowdownGUI:
         
         ttk.Label(full_log_frame, text="All Server Messages:", font=("Arial", 10, "bold")).pack(anchor=tk.W, pady=(5, 5))
         
-        self.log_text = scrolledtext.ScrolledText(full_log_frame, width=70, height=20, font=("Consolas", 8))
-        self.log_text.pack(fill=tk.BOTH, expand=True, pady=5)
+        self.full_log = BoundedLogPane(full_log_frame, 300, width=70, height=20, font=("Consolas", 8))
+        self.full_log.pack(fill=tk.BOTH, expand=True, pady=5)
         
         # Configure grid weights
         self.root.columnconfigure(0, weight=1)
         self.root.rowconfigure(0, weight=1)
         main_frame.columnconfigure(1, weight=1)
-        main_frame.rowconfigure(5, weight=1)
+        main_frame.rowconfigure(6, weight=1)
         
-    def set_credentials(self, username, password):
+    def set_credentials(self, username, password, remember_password=False):
         """Set the credential fields"""
+        self.remember_password_var.set(remember_password)
         self.username_entry.delete(0, tk.END)
         self.username_entry.insert(0, username)
         self.password_entry.delete(0, tk.END)
@@ -89,11 +155,14 @@ class ShowdownGUI:
         """Get the current credentials from the form"""
         return self.username_entry.get().strip(), self.password_entry.get().strip()
         
+    def remember_password(self):
+        return self.remember_password_var.get()
+        
     def start_logging(self):
         """Handle start logging button"""
         username, password = self.get_credentials()
         
-        if not username or not password:
+        if not username or (not password and not self.has_saved_session(username)):
             messagebox.showerror("Error", "Please enter both username and password")
             return
             
@@ -124,27 +193,51 @@ class ShowdownGUI:
         self.status_label.config(text="Status: Connection Failed", foreground="red")
         
     def add_log_message(self, formatted_msg, log_type, timestamp):
-        """Add a message to the appropriate log tabs"""
-        # Add to Full Server Log tab (all messages)
-        self.log_text.insert(tk.END, formatted_msg + "\n")
-        self.log_text.see(tk.END)
-        
-        # Keep only last 300 lines in full log
-        lines = self.log_text.get("1.0", tk.END).split("\n")
-        if len(lines) > 300:
-            self.log_text.delete("1.0", f"{len(lines)-300}.0")
-        
-        # Add to Battle Events tab (only battle-related messages)
-        if log_type in ["BATTLE", "BATTLE_STATE"]:
-            battle_formatted = f"[{timestamp.split()[1]}] {formatted_msg.split('] ', 2)[-1]}"
-            self.battle_log_text.insert(tk.END, battle_formatted + "\n")
-            self.battle_log_text.see(tk.END)
+        """Queue a message for the log tabs; safe to call from any thread"""
+        self.pending_logs.put((formatted_msg, log_type, timestamp))
+        
+    def mark_battle_state_dirty(self, state_provider):
+        """Redraw the battle state on the next tick; safe to call from any thread"""
+        self.state_provider = state_provider
+        self.state_dirty = True
+        
+    def apply_pending_updates(self):
+        """Apply all queued log lines in one insert per tab and redraw the state once if dirty"""
+        full_lines = []
+        battle_lines = []
+        while True:
+            try:
+                formatted_msg, log_type, timestamp = self.pending_logs.get_nowait()
+            except queue.Empty:
+                break
+            # Full Server Log tab (all messages)
+            full_lines.append(formatted_msg)
+            # Battle Events tab (only battle-related messages)
+            if log_type in ["BATTLE", "BATTLE_STATE"]:
+                battle_lines.append(f"[{timestamp.split()[1]}] {formatted_msg.split('] ', 2)[-1]}")
+                
+        if full_lines:
+            self.full_log.append_many(full_lines)
+        if battle_lines:
+            self.battle_log.append_many(battle_lines)
             
-            # Keep only last 200 lines in battle log
-            battle_lines = self.battle_log_text.get("1.0", tk.END).split("\n")
-            if len(battle_lines) > 200:
-                self.battle_log_text.delete("1.0", f"{len(battle_lines)-200}.0")
+        if self.state_dirty:
+            self.state_dirty = False
+            if self.state_provider:
+                self.update_battle_state_display(self.state_provider())
                 
+    def _update_tick(self):
+        """Periodic root.after callback that drains pending updates"""
+        try:
+            self.apply_pending_updates()
+        except tk.TclError:
+            # Window destroyed
+            self.update_job = None
+            return
+        except Exception as e:
+            print(f"Error updating GUI: {e}")
+        self.update_job = self.root.after(self.UPDATE_INTERVAL_MS, self._update_tick)
+        
     def update_battle_state_display(self, state_display):
         """Update the battle state display"""
         self.state_text.delete("1.0", tk.END)
@@ -153,6 +246,7 @@ class ShowdownGUI:
     def run(self):
         """Run the GUI"""
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+        self.update_job = self.root.after(self.UPDATE_INTERVAL_MS, self._update_tick)
         self.root.mainloop()
         
     def on_closing(self):
@@ -160,6 +254,9 @@ class ShowdownGUI:
         try:
             # Disable further logging callbacks to prevent GUI update errors
             self.root.withdraw()  # Hide the window immediately
+            if self.update_job:
+                self.root.after_cancel(self.update_job)
+                self.update_job = None
             # Stop the logging gracefully
             self.on_stop()
             # Give time for cleanup, then destroy the window
@@ -0,0 +1,140 @@
+import time
+import asyncio
+import aiohttp
+from http.cookies import SimpleCookie
+from email.utils import parsedate_to_datetime
+from yarl import URL
+
+class HttpSession:
+    """Shared non-blocking HTTP session with pooled keep-alive connections"""
+
+    def __init__(self, max_connections=8, max_concurrent=4, timeout=10):
+        self.max_connections = max_connections
+        self.max_concurrent = max_concurrent
+        self.timeout = timeout
+        self.session = None
+        self.semaphore = None
+        self.loop = None
+        self.pending_cookies = []  # Applied to the next session's cookie jar
+        self.cookie_expires = {}  # (name, domain) -> absolute expiry epoch, fixed when the cookie is received
+
+    async def _ensure_session(self):
+        """Create the session for the running loop (the GUI starts a new loop per connection)"""
+        loop = asyncio.get_running_loop()
+        if self.session is None or self.session.closed or self.loop is not loop:
+            # Cookie jars belong to a loop; carry the login session over to the new one
+            if self.session is not None:
+                self.pending_cookies = self.export_cookies()
+                await self._release_session()
+            connector = aiohttp.TCPConnector(limit=self.max_connections, keepalive_timeout=30)
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+            self.semaphore = asyncio.Semaphore(self.max_concurrent)
+            self.loop = loop
+        if self.pending_cookies:
+            self._apply_cookies(self.pending_cookies)
+            self.pending_cookies = []
+        return self.session
+
+    async def _release_session(self):
+        """Close a session left behind by a previous loop"""
+        session, loop = self.session, self.loop
+        if session.closed:
+            return
+        if loop.is_running():
+            # Still serving another thread: close it there
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+            return
+        try:
+            # A closed loop's transports are gone with it, so this only marks the pool closed
+            await session.close()
+        except RuntimeError:
+            session.detach()  # Stopped but not closed: its futures can't be awaited from here
+
+    @staticmethod
+    def _morsel_expires(morsel, now):
+        """Absolute expiry of a freshly received morsel (0 for a session cookie)"""
+        if morsel["max-age"]:
+            try:
+                return now + int(morsel["max-age"])
+            except ValueError:
+                pass
+        if morsel["expires"]:
+            try:
+                return parsedate_to_datetime(morsel["expires"]).timestamp()
+            except (TypeError, ValueError):
+                pass
+        return 0
+
+    def _record_cookies(self, response):
+        """Pin the expiry of each Set-Cookie now; max-age is relative to receipt, not to export"""
+        now = time.time()
+        for morsel in response.cookies.values():
+            domain = (morsel["domain"] or response.url.host or "").lstrip(".")
+            self.cookie_expires[(morsel.key, domain)] = self._morsel_expires(morsel, now)
+
+    def export_cookies(self):
+        """Current cookies as dicts (name, value, domain, path, expires epoch or 0)"""
+        if self.session is None:
+            return list(self.pending_cookies)
+        now = time.time()
+        cookies = []
+        for morsel in self.session.cookie_jar:
+            # Cookies received outside request() are pinned the first time they are exported
+            key = (morsel.key, morsel["domain"].lstrip("."))
+            expires = self.cookie_expires.get(key)
+            if expires is None:
+                expires = self.cookie_expires[key] = self._morsel_expires(morsel, now)
+            cookies.append({"name": morsel.key, "value": morsel.value, "domain": morsel["domain"],
+                            "path": morsel["path"] or "/", "expires": expires})
+        return cookies
+
+    def import_cookies(self, cookies):
+        """Restore cookies from export_cookies, skipping expired ones"""
+        if self.session is not None and not self.session.closed:
+            self._apply_cookies(cookies)
+        else:
+            self.pending_cookies = list(cookies)
+
+    def _apply_cookies(self, cookies):
+        now = time.time()
+        for cookie in cookies:
+            if cookie["expires"] and cookie["expires"] <= now:
+                continue
+            self.cookie_expires[(cookie["name"], cookie["domain"].lstrip("."))] = cookie["expires"]
+            morsel = SimpleCookie()
+            morsel[cookie["name"]] = cookie["value"]
+            morsel[cookie["name"]]["domain"] = cookie["domain"]
+            morsel[cookie["name"]]["path"] = cookie["path"]
+            if cookie["expires"]:
+                morsel[cookie["name"]]["max-age"] = str(int(cookie["expires"] - now))
+            self.session.cookie_jar.update_cookies(morsel, URL(f"https://{cookie['domain'].lstrip('.')}{cookie['path']}"))
+
+    async def request(self, method, url, timeout=None, **kwargs):
+        """Perform a request and return (status, headers, body text)"""
+        session = await self._ensure_session()
+        request_timeout = aiohttp.ClientTimeout(total=timeout or self.timeout)
+        async with self.semaphore:
+            async with session.request(method, url, timeout=request_timeout, **kwargs) as response:
+                if response.cookies:
+                    self._record_cookies(response)
+                body = await response.text()
+                return response.status, response.headers, body
+
+    async def get(self, url, headers=None, timeout=None):
+        return await self.request("GET", url, timeout=timeout, headers=headers)
+
+    async def post(self, url, data=None, timeout=None):
+        return await self.request("POST", url, timeout=timeout, data=data)
+
+    async def close(self):
+        """Close pooled connections; must run on the loop that owns the session"""
+        if self.session and not self.session.closed:
+            await self.session.close()
+        if self.session is not None:
+            self.pending_cookies = self.export_cookies()
+        self.session = None
+        self.semaphore = None
+        self.loop = None
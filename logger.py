@@ -1,58 +1,426 @@
+import io
 import os
-from datetime import datetime
+import re
+import sys
+import glob
+import gzip
+import json
+import time
+import queue
+import atexit
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+SEGMENT_TIME_FORMAT = "%Y%m%d-%H%M%S"
+COMPRESSED_EXTENSIONS = {"gzip": ".gz", "zstd": ".zst"}
+
+def _segment_pattern(log_filename, log_format="text"):
+    """Regex matching rotated segments: <base>.<start>[_<end>]<ext>[.gz|.zst]"""
+    base, ext = os.path.splitext(log_filename)
+    if log_format == "jsonl":
+        ext = ".jsonl"
+    return re.compile(re.escape(os.path.basename(base)) + r"\.(\d{8}-\d{6})(?:_(\d{8}-\d{6}))?"
+                      + re.escape(ext) + r"(\.gz|\.zst)?$")
+
+def _parse_segment_time(value):
+    return time.mktime(time.strptime(value, SEGMENT_TIME_FORMAT))
+
+def _as_epoch(value):
+    return value.timestamp() if hasattr(value, "timestamp") else value
+
+def find_segments(log_filename="showdown_log.txt", start=None, end=None, log_format="text"):
+    """List rotated log segments (oldest first) that overlap [start, end]
+
+    start and end are datetimes or epoch seconds; None leaves that side open.
+    The open segment has no end time yet and always overlaps a later window.
+    """
+    start, end = _as_epoch(start), _as_epoch(end)
+    pattern = _segment_pattern(log_filename, log_format)
+    directory = os.path.dirname(log_filename) or "."
+    segments = []
+    for path in glob.glob(os.path.join(glob.escape(directory), "*")):
+        match = pattern.match(os.path.basename(path))
+        if not match:
+            continue
+        segment_start = _parse_segment_time(match.group(1))
+        segment_end = _parse_segment_time(match.group(2)) if match.group(2) else float("inf")
+        if (end is None or segment_start <= end) and (start is None or segment_end >= start):
+            segments.append((segment_start, path))
+    return [path for _, path in sorted(segments)]
+
+def open_segment(path):
+    """Open a plain, gzip or zstd log segment for reading text"""
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8")
+    if path.endswith(".zst"):
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to read .zst segments (pip install zstandard)")
+        return io.TextIOWrapper(zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True),
+                                encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
+
+def compress_segment(path, compression="gzip"):
+    """Compress a closed segment next to itself and remove the original"""
+    target = path + COMPRESSED_EXTENSIONS[compression]
+    temp_target = target + ".tmp"
+    with open(path, "rb") as source:
+        if compression == "zstd":
+            with open(temp_target, "wb") as raw:
+                with zstandard.ZstdCompressor(level=10).stream_writer(raw) as destination:
+                    shutil.copyfileobj(source, destination, 1024 * 1024)
+        else:
+            with gzip.open(temp_target, "wb", compresslevel=6) as destination:
+                shutil.copyfileobj(source, destination, 1024 * 1024)
+    os.replace(temp_target, target)
+    os.remove(path)
+    return target
 
 class Logger:
-    def __init__(self, log_filename="showdown_log.txt"):
+    def __init__(self, log_filename="showdown_log.txt", flush_interval=0.5, flush_lines=256, console=True,
+                 max_bytes=0, rotate_interval=0, compression="gzip", log_format="text",
+                 console_types=None, file_types=None):
         self.log_filename = log_filename
         self.log_file = None
         self.callbacks = []
-        
-    def add_callback(self, callback):
-        """Add a callback function to receive log messages"""
+        self.flush_interval = flush_interval  # Max seconds a written line waits for flush()
+        self.flush_lines = flush_lines        # Lines per write batch before a forced flush
+        self.console = console
+
+        # Per-sink log_type filters: None accepts every type, an empty set accepts none
+        self.console_types = self._type_set(console_types)
+        self.file_types = self._type_set(file_types)
+        self.callback_types = {}              # callback -> set of log types, or None for all
+        self.enabled_types = None             # Union over all sinks, checked by log_message
+        self._update_enabled_types()
+
+        # Rotation: 0 disables a limit; with both 0 everything goes to log_filename as before
+        self.max_bytes = max_bytes
+        self.rotate_interval = rotate_interval
+        self.log_format = log_format          # "text" or "jsonl" (one JSON object per line)
+        if compression == "zstd" and zstandard is None:
+            print("zstandard is not installed, compressing log segments with gzip instead")
+            compression = "gzip"
+        self.compression = compression        # "gzip", "zstd" or None
+        self.segment_path = None
+        self.segment_start = 0
+        self.segment_bytes = 0
+        self.compressor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="LogCompress")
+        self.compressing = set()              # Segment paths queued on the compressor, not yet done
+
+        # Producers only enqueue; the writer thread formats, prints, writes and runs callbacks
+        self.queue = queue.SimpleQueue()
+        self.file_lock = threading.Lock()
+        self.writer_thread = threading.Thread(target=self._writer_loop, name="LogWriter", daemon=True)
+        self.writer_thread.start()
+        atexit.register(self.shutdown)
+
+    @staticmethod
+    def _type_set(log_types):
+        return None if log_types is None else frozenset(log_types)
+
+    def _update_enabled_types(self):
+        """Recompute which log types at least one sink accepts"""
+        sinks = [self.file_types]
+        if self.console:
+            sinks.append(self.console_types)
+        sinks.extend(self.callback_types.get(callback) for callback in self.callbacks)
+        if any(log_types is None for log_types in sinks):
+            self.enabled_types = None
+        else:
+            self.enabled_types = frozenset().union(*sinks)
+
+    def is_enabled(self, log_type):
+        """Whether any sink wants log_type; check before building expensive messages"""
+        enabled_types = self.enabled_types
+        return enabled_types is None or log_type in enabled_types
+
+    def set_console_types(self, log_types):
+        """Limit terminal output to these log types (None = all)"""
+        self.console_types = self._type_set(log_types)
+        self._update_enabled_types()
+
+    def set_file_types(self, log_types):
+        """Limit the log file to these log types (None = all)"""
+        self.file_types = self._type_set(log_types)
+        self._update_enabled_types()
+
+    def add_callback(self, callback, log_types=None):
+        """Add a callback function to receive log messages (called on the writer thread)"""
+        self.callback_types[callback] = self._type_set(log_types)
         self.callbacks.append(callback)
-        
+        self._update_enabled_types()
+
     def remove_callback(self, callback):
         """Remove a callback function"""
         if callback in self.callbacks:
             self.callbacks.remove(callback)
-        
+            self.callback_types.pop(callback, None)
+            self._update_enabled_types()
+
+    def rotation_enabled(self):
+        return bool(self.max_bytes or self.rotate_interval)
+
+    def _segment_name(self, start, end=None):
+        base, ext = os.path.splitext(self.log_filename)
+        if self.log_format == "jsonl":
+            ext = ".jsonl"
+        name = f"{base}.{time.strftime(SEGMENT_TIME_FORMAT, time.localtime(start))}"
+        if end is not None:
+            name += f"_{time.strftime(SEGMENT_TIME_FORMAT, time.localtime(end))}"
+        return name + ext
+
+    def _open_segment(self):
+        """Open a new active segment (caller holds file_lock or owns the logger)"""
+        # Whole-second names must stay unique even when segments rotate quickly
+        self.segment_start = max(time.time(), int(self.segment_start) + 1)
+        self.segment_path = self._segment_name(self.segment_start)
+        self.segment_bytes = 0
+        self.log_file = open(self.segment_path, "a", encoding="utf-8")
+
+    def _close_segment(self):
+        """Close the active segment, stamp its end time and queue it for compression"""
+        if not self.log_file:
+            return
+        self.log_file.close()
+        self.log_file = None
+        self._finish_segment(self.segment_path, self.segment_start, time.time())
+
+    def _finish_segment(self, path, start, end):
+        closed_path = self._segment_name(start, max(end, start))
+        os.replace(path, closed_path)
+        if self.compression:
+            self._submit_compression(closed_path)
+
+    def _submit_compression(self, path):
+        """Queue a closed segment for compression unless it is already queued"""
+        if path in self.compressing:
+            return
+        self.compressing.add(path)
+        try:
+            self.compressor.submit(self._compress, path)
+        except RuntimeError:
+            self.compressing.discard(path)  # Shutting down; compressed on the next open_log_file()
+
+    def _compress(self, path):
+        try:
+            if os.path.exists(path):  # Gone if a scan raced the job that compressed it
+                compress_segment(path, self.compression)
+        except Exception as e:
+            print(f"Could not compress log segment {path}: {e}")
+        finally:
+            self.compressing.discard(path)
+
+    def _finish_stale_segments(self):
+        """Close segments left open by a previous run and compress any left uncompressed"""
+        pattern = _segment_pattern(self.log_filename, self.log_format)
+        for path in find_segments(self.log_filename, log_format=self.log_format):
+            match = pattern.match(os.path.basename(path))
+            if not match or match.group(3):
+                continue
+            if not match.group(2):
+                # Use the last write as the end time
+                self._finish_segment(path, _parse_segment_time(match.group(1)), os.path.getmtime(path))
+            elif self.compression:
+                # A reopen in the same process finds segments the compressor hasn't reached yet
+                self._submit_compression(path)
+
     def open_log_file(self):
         """Open the log file for writing"""
         try:
-            self.log_file = open(self.log_filename, "a", encoding="utf-8")
-            self.log_message(f"Logging to {self.log_filename}", "SYSTEM")
-            return True
+            with self.file_lock:
+                if self.rotation_enabled():
+                    self._finish_stale_segments()
+                    self._open_segment()
+                else:
+                    self.log_file = open(self.log_filename, "a", encoding="utf-8")
         except Exception as e:
             print(f"Could not open log file: {e}")
             return False
-            
+        self.log_message(f"Logging to {self.segment_path or self.log_filename}", "SYSTEM")
+        return True
+
     def close_log_file(self):
-        """Close the log file"""
-        if self.log_file:
-            self.log_file.close()
-            self.log_file = None
-            
-    def log_message(self, message, log_type="INFO"):
-        """Log message to file, terminal and registered callbacks"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        formatted_msg = f"[{timestamp}] [{log_type}] {message}"
-        
-        # Print to terminal
-        print(formatted_msg)
-        
-        # Write to log file
-        if self.log_file:
+        """Write out queued messages, then close the log file"""
+        self.flush()
+        with self.file_lock:
+            if self.log_file and self.rotation_enabled():
+                self._close_segment()
+            elif self.log_file:
+                self.log_file.close()
+                self.log_file = None
+
+    def log_message(self, message, log_type="INFO", room=None):
+        """Queue a message for the file, terminal and registered callbacks"""
+        enabled_types = self.enabled_types
+        if enabled_types is not None and log_type not in enabled_types:
+            return
+        self.queue.put((time.time(), message, log_type, room))
+
+    def flush(self, timeout=5.0):
+        """Block until every message queued so far has been written and flushed"""
+        if not self.writer_thread.is_alive():
+            return False
+        done = threading.Event()
+        self.queue.put(done)
+        return done.wait(timeout)
+
+    def shutdown(self):
+        """Flush queued messages and stop the writer thread"""
+        if self.writer_thread.is_alive():
+            self.flush()
+            self.queue.put(None)
+            self.writer_thread.join(timeout=5.0)
+        # Let queued segment compression finish
+        self.compressor.shutdown(wait=True)
+
+    def _next_batch(self, wait):
+        """Wait up to wait seconds (None = forever) for an item, then drain up to flush_lines more"""
+        try:
+            items = [self.queue.get(timeout=wait)]
+        except queue.Empty:
+            return []
+        while len(items) < self.flush_lines:
             try:
-                self.log_file.write(formatted_msg + "\n")
-                self.log_file.flush()
-            except:
-                pass
-        
-        # Call all registered callbacks
-        for callback in self.callbacks[:]:  # Use slice copy to avoid modification during iteration
+                items.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return items
+
+    def _flush_outputs(self):
+        with self.file_lock:
+            if self.log_file:
+                try:
+                    self.log_file.flush()
+                except Exception:
+                    pass
+        if self.console and sys.stdout:
             try:
-                callback(formatted_msg, log_type, timestamp)
-            except Exception as e:
-                # Remove callbacks that cause errors (likely from destroyed GUI elements)
-                print(f"Removing failed log callback: {e}")
-                self.callbacks.remove(callback)
\ No newline at end of file
+                sys.stdout.flush()
+            except Exception:
+                pass
+
+    def _rotate_if_due(self):
+        """Start a new segment once the active one is too large or too old"""
+        with self.file_lock:
+            if not self.log_file or not self.rotation_enabled():
+                return
+            too_big = self.max_bytes and self.segment_bytes >= self.max_bytes
+            too_old = self.rotate_interval and time.time() - self.segment_start >= self.rotate_interval
+            if too_big or too_old:
+                try:
+                    self._close_segment()
+                    self._open_segment()
+                except Exception as e:
+                    print(f"Could not rotate log file: {e}")
+
+    def _rotation_wait(self):
+        """Seconds until the active segment is due for time-based rotation, or None"""
+        if not self.rotate_interval or not self.log_file:
+            return None
+        return max(0.0, self.segment_start + self.rotate_interval - time.time())
+
+    def _format_json(self, created, message, log_type, room):
+        timestamp = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(created)) + f".{int(created * 1000) % 1000:03d}"
+        return json.dumps({"timestamp": timestamp, "log_type": log_type, "room": room, "message": message},
+                          ensure_ascii=False)
+
+    def _writer_loop(self):
+        """Format and write queued messages in batches until shutdown() sends None"""
+        last_second = None
+        timestamp = ""
+        last_flush = time.monotonic()
+        pending_flush = False
+
+        while True:
+            # Sleep until a message arrives, written data is due to be flushed or the segment to rotate
+            wait = self.flush_interval if pending_flush else None
+            rotation_wait = self._rotation_wait()
+            if rotation_wait is not None and (wait is None or rotation_wait < wait):
+                wait = rotation_wait
+            items = self._next_batch(wait)
+            if not items:
+                self._rotate_if_due()  # An idle logger still rotates on time
+            console_lines = []
+            file_lines = []  # Text, or JSON when log_format is "jsonl"
+            markers = []
+            stop = False
+            for item in items:
+                if item is None:
+                    stop = True
+                    continue
+                if isinstance(item, threading.Event):
+                    markers.append(item)
+                    continue
+
+                created, message, log_type, room = item
+                console_types = self.console_types
+                file_types = self.file_types
+                to_console = self.console and (console_types is None or log_type in console_types)
+                to_file = file_types is None or log_type in file_types
+
+                second = int(created)
+                if second != last_second:  # strftime once per second, not once per line
+                    last_second = second
+                    timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+                if room:
+                    formatted_msg = f"[{timestamp}] [{log_type}] [{room}] {message}"
+                else:
+                    formatted_msg = f"[{timestamp}] [{log_type}] {message}"
+                if to_console:
+                    console_lines.append(formatted_msg)
+                if to_file:
+                    if self.log_format == "jsonl":
+                        file_lines.append(self._format_json(created, message, log_type, room))
+                    else:
+                        file_lines.append(formatted_msg)
+
+                # Call all registered callbacks
+                for callback in self.callbacks[:]:  # Use slice copy to avoid modification during iteration
+                    callback_types = self.callback_types.get(callback)
+                    if callback_types is not None and log_type not in callback_types:
+                        continue
+                    try:
+                        callback(formatted_msg, log_type, timestamp)
+                    except Exception as e:
+                        # Remove callbacks that cause errors (likely from destroyed GUI elements)
+                        print(f"Removing failed log callback: {e}")
+                        self.remove_callback(callback)
+
+            # Print to terminal
+            if console_lines and sys.stdout:
+                try:
+                    sys.stdout.write("\n".join(console_lines) + "\n")
+                except Exception:
+                    pass
+                pending_flush = True
+            # Write to log file
+            if file_lines:
+                file_text = "\n".join(file_lines) + "\n"
+                with self.file_lock:
+                    if self.log_file:
+                        try:
+                            self.log_file.write(file_text)
+                            # Rotation limits are in bytes; names and moves like "Nidoran♂" aren't ASCII
+                            self.segment_bytes += len(file_text.encode("utf-8"))
+                        except Exception:
+                            pass
+                pending_flush = True
+                self._rotate_if_due()
+
+            now = time.monotonic()
+            if pending_flush and (markers or stop or len(items) >= self.flush_lines
+                                  or now - last_flush >= self.flush_interval):
+                self._flush_outputs()
+                pending_flush = False
+                last_flush = now
+
+            for marker in markers:
+                marker.set()
+            if stop:
+                return
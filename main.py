@@ -1,64 +1,101 @@
+import time
+# Taken before the remaining imports so the cold-start time includes them
+STARTED = time.perf_counter()
+
+import sys
+import signal
+import struct
 import asyncio
+import argparse
 import threading
-import tkinter as tk
 
 from config import Config
-from battle_state import BattleState
 from pokemon_api import PokemonAPI
-from battle_parser import BattleParser
+from http_session import HttpSession
+from battle_session import SessionRegistry
+from emulator_bridge import EmulatorBridge
 from showdown_client import ShowdownClient
 from logger import Logger
-from gui import ShowdownGUI
+from token_store import TokenStore
 
 class PokemonShowdownLogger:
-    def __init__(self):
+    LOG_TYPES_WITHOUT_RAW = ("INFO", "SYSTEM", "ERROR", "BATTLE", "BATTLE_STATE")
+    
+    def __init__(self, headless=False, raw_log=True):
         # Initialize components
         self.config = Config()
-        self.battle_state = BattleState()
-        self.pokemon_api = PokemonAPI()
-        self.logger = Logger()
+        self.headless = headless
+        # Daily or 50 MB gzip-compressed segments instead of one ever-growing file
+        self.logger = Logger(max_bytes=50 * 1024 * 1024, rotate_interval=24 * 60 * 60)
+        if not raw_log:
+            self.logger.set_file_types(self.LOG_TYPES_WITHOUT_RAW)
+        if headless:
+            # Server lines would drown out everything else on a daemon's stdout
+            self.logger.set_console_types(self.LOG_TYPES_WITHOUT_RAW)
+        self.http = HttpSession()
+        self.pokemon_api = PokemonAPI(http=self.http)
+        self.token_store = TokenStore()
         self.client = None
         
-        # Setup logger callback
-        self.logger.add_callback(self.on_log_message)
+        # Shared memory read by PokemonBattleData.lua in BizHawk
+        try:
+            self.bridge = EmulatorBridge()
+        except OSError as e:
+            self.bridge = None
+            self.logger.log_message(f"Emulator bridge unavailable: {e}", "ERROR")
         
-        # Initialize battle parser with dependencies
-        self.battle_parser = BattleParser(
-            self.battle_state, 
-            self.pokemon_api, 
-            self.logger.log_message
-        )
+        # One BattleState/BattleParser pair per battle room
+        self.sessions = SessionRegistry(self.pokemon_api, self.logger.log_message,
+                                        turn_callback=self.publish_turn if self.bridge else None,
+                                        log_enabled=self.logger.is_enabled)
+        self.active_session = None  # Battle shown in the Battle State tab
         
-        # Load credentials and setup GUI
-        username, password = self.config.load_credentials()
-        self.gui = ShowdownGUI(self.start_logging, self.stop_logging)
-        self.gui.set_credentials(username, password)
+        # Load credentials and setup GUI (tkinter is only imported when it is used)
+        self.gui = None
+        if not headless:
+            from gui import ShowdownGUI
+            username, password = self.config.load_credentials()
+            self.gui = ShowdownGUI(self.start_logging, self.stop_logging, has_saved_session=self.has_saved_session)
+            self.gui.set_credentials(username, password, self.config.load_remember_password())
+            self.logger.add_callback(self.on_log_message)
         
         # Threading
         self.running = False
         self.connection_thread = None
         self.connection_task = None
         self.loop = None
+        self.connect_started = None
         
+    def has_saved_session(self, username):
+        """Whether a saved login session can stand in for the password"""
+        return self.token_store.load(username) is not None
+        
+    def gui_call(self, callback):
+        """Run callback on the Tk thread; no-op when headless"""
+        if self.gui:
+            self.gui.root.after(0, callback)
+            
     def on_log_message(self, formatted_msg, log_type, timestamp):
-        """Handle log messages from the logger"""
-        # Check if GUI is still valid before updating
+        """Handle log messages from the logger (runs on the logger's writer thread)"""
+        # Only queue here; the GUI applies updates on its own thread at a fixed rate
+        self.gui.add_log_message(formatted_msg, log_type, timestamp)
+        
+        # Redraw the battle state on the next GUI tick, however many lines this turn logs
+        if log_type == "BATTLE_STATE" and self.active_session:
+            self.gui.mark_battle_state_dirty(self.active_session.battle_state.get_state_display)
+            
+    def publish_turn(self, battle_state, turn):
+        """Send a completed turn to the emulator (it mirrors one battle at a time)"""
         try:
-            if hasattr(self.gui, 'root') and self.gui.root.winfo_exists():
-                # Update GUI logs
-                self.gui.add_log_message(formatted_msg, log_type, timestamp)
-                
-                # Update battle state display if it's a battle state message
-                if log_type == "BATTLE_STATE":
-                    self.gui.update_battle_state_display(self.battle_state.get_state_display())
-        except tk.TclError:
-            # GUI has been destroyed, remove this callback
-            self.logger.remove_callback(self.on_log_message)
+            self.bridge.publish(battle_state, turn)
+        except (ValueError, struct.error) as e:
+            self.logger.log_message(f"Failed to publish turn {turn} to emulator: {e}", "ERROR")
             
-    async def handle_message(self, line):
+    async def handle_message(self, line, room=""):
         """Handle messages from the WebSocket client"""
         # Log all messages
-        self.logger.log_message(line, "RAW")
+        if self.logger.is_enabled("RAW"):
+            self.logger.log_message(line, "RAW", room)
         
         # Handle connection status updates
         if line.startswith('|updateuser|'):
@@ -66,37 +103,43 @@ class PokemonShowdownLogger:
             if len(parts) >= 3:
                 username = parts[2]
                 if username and username != ' ':  # Successfully logged in
-                    self.gui.root.after(0, lambda: self.gui.set_status("Connected", "green"))
+                    self.gui_call(lambda: self.gui.set_status("Connected", "green"))
                     self.logger.log_message(f"Successfully connected and logged in as {username}", "SYSTEM")
+                    if self.headless and self.connect_started is not None:
+                        self.logger.log_message(f"Logged in {time.perf_counter() - self.connect_started:.2f}s after connecting", "SYSTEM")
+                        self.connect_started = None
         
-        # Parse battle-specific messages
-        self.battle_parser.parse_gen1_battle_data(line)
+        # Parse battle-specific messages in the room's own session
+        session = self.sessions.route(line, room)
+        if session is None:
+            return
+        self.active_session = session
         
         # Handle special events
-        if '|start|' in line:
-            self.logger.log_message("BATTLE STARTED!", "BATTLE")
-            self.battle_state.reset_all()
-            
-        elif line.startswith('>battle-gen1ou-') or line.startswith('>battle-'):
-            battle_room = line[1:]  # Remove the '>' prefix
-            self.logger.log_message(f"Entering battle room: {battle_room}", "BATTLE")
+        if line == '|start' or line.startswith('|start|'):
+            self.logger.log_message("BATTLE STARTED!", "BATTLE", room)
+            session.battle_state.reset_all()
             
+    def open_session(self, username, password):
+        """Open the log file and create the client; returns False if logging can't start"""
+        if not self.logger.open_log_file():
+            return False
+        self.client = ShowdownClient(username, password, self.handle_message, http=self.http,
+                                     log_callback=self.logger.log_message, token_store=self.token_store)
+        self.client.start()
+        self.running = True
+        return True
+        
     def start_logging(self, username, password):
         """Start the logging process"""
         # Save credentials
-        self.config.save_credentials(username, password)
+        self.config.save_credentials(username, password, self.gui.remember_password())
         
-        # Open log file
-        if not self.logger.open_log_file():
+        if not self.open_session(username, password):
             self.gui.connection_failed()
             return
         
-        # Initialize client
-        self.client = ShowdownClient(username, password, self.handle_message)
-        self.client.start()
-        
         # Start connection in separate thread
-        self.running = True
         self.connection_thread = threading.Thread(target=self.run_connection)
         self.connection_thread.daemon = True
         self.connection_thread.start()
@@ -149,12 +192,12 @@ class PokemonShowdownLogger:
             except Exception as e:
                 if self.running:  # Only log if we're still supposed to be running
                     self.logger.log_message(f"Connection error: {str(e)}", "ERROR")
-                    self.gui.root.after(0, self.gui.connection_failed)
+                    self.gui_call(lambda: self.gui.connection_failed())
                     
         except Exception as e:
             if self.running:  # Only log if we're still supposed to be running
                 self.logger.log_message(f"Connection setup error: {str(e)}", "ERROR")
-                self.gui.root.after(0, self.gui.connection_failed)
+                self.gui_call(lambda: self.gui.connection_failed())
         finally:
             # Clean up the loop
             if self.loop and not self.loop.is_closed():
@@ -167,6 +210,9 @@ class PokemonShowdownLogger:
                     # Wait for tasks to be cancelled
                     if pending:
                         self.loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+                    
+                    # Close pooled HTTP connections on the loop that owns them
+                    self.loop.run_until_complete(self.http.close())
                         
                     self.loop.close()
                 except Exception:
@@ -174,6 +220,8 @@ class PokemonShowdownLogger:
         
     def run(self):
         """Run the application"""
+        if self.headless:
+            return self.run_headless()
         try:
             self.gui.run()
         except KeyboardInterrupt:
@@ -183,7 +231,73 @@ class PokemonShowdownLogger:
         finally:
             # Ensure cleanup
             self.stop_logging()
+            if self.bridge:
+                self.bridge.close()
+        return 0
+                
+    def run_headless(self):
+        """Run without a GUI, with the client on the main thread's event loop"""
+        username, password = self.config.load_credentials()
+        if not username or (not password and not self.has_saved_session(username)):
+            print("No credentials: set SHOWDOWN_USERNAME and SHOWDOWN_PASSWORD or save them in the config file")
+            return 1
+        if not self.open_session(username, password):
+            return 1
+        ok = False
+        try:
+            ok = asyncio.run(self.serve(username))
+        except KeyboardInterrupt:
+            print("Application interrupted by user")
+        finally:
+            self.stop_logging()
+            if self.bridge:
+                self.bridge.close()
+        return 0 if ok else 1
+        
+    async def serve(self, username):
+        """Connect and listen until the connection ends or SIGTERM/SIGINT arrives"""
+        self.loop = asyncio.get_running_loop()
+        self.connection_task = asyncio.create_task(self.client.connect_and_listen())
+        
+        shutdown = []
+        def request_shutdown():
+            if not shutdown:
+                shutdown.append(True)
+                self.logger.log_message("Shutdown requested", "SYSTEM")
+                self.client.stop()
+                self.connection_task.cancel()
+                
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            try:
+                self.loop.add_signal_handler(sig, request_shutdown)
+            except (NotImplementedError, AttributeError, ValueError):
+                # Windows: no loop signal handlers, hop onto the loop from the handler instead
+                signal.signal(sig, lambda signum, frame: self.loop.call_soon_threadsafe(request_shutdown))
+                
+        self.connect_started = time.perf_counter()
+        self.logger.log_message(f"Headless logger for {username} ready in {1000 * (self.connect_started - STARTED):.0f} ms", "SYSTEM")
+        try:
+            await self.connection_task
+            return True
+        except asyncio.CancelledError:
+            print("Connection task was cancelled")
+            return bool(shutdown)
+        except Exception as e:
+            self.logger.log_message(f"Connection error: {str(e)}", "ERROR")
+            return False
+        finally:
+            # Close pooled HTTP connections on the loop that owns them
+            await self.http.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Pokemon Showdown Gen 1 battle logger")
+    parser.add_argument("--headless", action="store_true",
+                        help="run without the GUI; credentials come from SHOWDOWN_USERNAME/SHOWDOWN_PASSWORD or the config file")
+    parser.add_argument("--no-raw", action="store_true", help="don't write raw server lines to the log file")
+    args = parser.parse_args()
+    
+    app = PokemonShowdownLogger(headless=args.headless, raw_log=not args.no_raw)
+    return app.run()
 
 if __name__ == "__main__":
-    app = PokemonShowdownLogger()
-    app.run()
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,118 @@
+import os
+import json
+import time
+import asyncio
+
+class PokedexCache:
+    """Persistent, species-indexed copy of Showdown's pokedex.json"""
+
+    FORMAT_VERSION = 1
+    STAT_ORDER = ("hp", "atk", "def", "spa", "spd", "spe")
+    MAX_AGE = 7 * 24 * 60 * 60  # Re-validate the cache once a week
+
+    def __init__(self, cache_file="pokedex_cache.json",
+                 source_url="https://play.pokemonshowdown.com/data/pokedex.json"):
+        self.cache_file = cache_file
+        self.source_url = source_url
+        self.species = None  # {species_id: [hp, atk, def, spa, spd, spe]}, loaded lazily
+        self.etag = ""
+        self.fetched_at = 0
+
+    @staticmethod
+    def normalize(name):
+        """Convert a Pokemon name to Showdown's species ID (e.g. "Mr. Mime" -> "mrmime")"""
+        name = name.lower().replace("♂", "m").replace("♀", "f")
+        return "".join(char for char in name if char.isalnum())
+
+    def load(self):
+        """Load the index from disk, leaving it empty if missing or outdated"""
+        self.species = {}
+        if not os.path.exists(self.cache_file):
+            return False
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != self.FORMAT_VERSION:
+                return False
+            self.species = data.get("species", {})
+            self.etag = data.get("etag", "")
+            self.fetched_at = data.get("fetched_at", 0)
+            return True
+        except (OSError, ValueError) as e:
+            print(f"Could not load Pokedex cache: {e}")
+            return False
+
+    def save(self):
+        """Atomically write the index to disk"""
+        data = {
+            "version": self.FORMAT_VERSION,
+            "etag": self.etag,
+            "fetched_at": self.fetched_at,
+            "stat_order": list(self.STAT_ORDER),
+            "species": self.species
+        }
+        tmp_file = self.cache_file + ".tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp_file, self.cache_file)
+
+    def is_loaded(self):
+        return self.species is not None
+
+    def is_stale(self):
+        """Check whether the index is empty or due for re-validation"""
+        if self.species is None:
+            self.load()
+        return not self.species or time.time() - self.fetched_at > self.MAX_AGE
+
+    def get_base_stats(self, pokemon_name):
+        """Return the base stat list for a Pokemon, or None if it isn't indexed"""
+        if self.species is None:
+            self.load()
+        return self.species.get(self.normalize(pokemon_name))
+
+    def import_pokedex(self, pokedex_data, etag=""):
+        """Build the compact index from a full pokedex.json dict and persist it"""
+        species = {}
+        for species_id, entry in pokedex_data.items():
+            base_stats = entry.get("baseStats")
+            if base_stats:
+                species[species_id] = [base_stats.get(stat, 0) for stat in self.STAT_ORDER]
+        self.species = species
+        self.etag = etag
+        self.fetched_at = time.time()
+        self.save()
+        return len(species)
+
+    def import_file(self, path):
+        """Import a pokedex.json that was downloaded separately"""
+        with open(path, "r", encoding="utf-8") as f:
+            return self.import_pokedex(json.load(f))
+
+    def import_text(self, body, etag=""):
+        """Import the raw pokedex.json response body"""
+        return self.import_pokedex(json.loads(body), etag)
+
+    async def refresh(self, http):
+        """Re-validate the index against the server using its ETag"""
+        if self.species is None:
+            self.load()
+
+        headers = {}
+        if self.etag and self.species:
+            headers["If-None-Match"] = self.etag
+
+        status, response_headers, body = await http.get(self.source_url, headers=headers)
+        if status == 304:
+            self.fetched_at = time.time()
+            self.save()
+            return False
+        if status == 200:
+            # Parsing several MB of JSON would stall the event loop, so do it on a worker thread
+            loop = asyncio.get_running_loop()
+            count = await loop.run_in_executor(None, self.import_text, body, response_headers.get("ETag", ""))
+            print(f"Pokedex cache refreshed ({count} species)")
+            return True
+
+        print(f"Pokedex refresh failed with status {status}")
+        return False
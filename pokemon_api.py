@@ -1,9 +1,18 @@
-import requests
 import math
+import asyncio
+from gen1_data import SPECIES_DATA, SPECIES_SPECIAL
+from pokedex_cache import PokedexCache
+from http_session import HttpSession
+
+# Showdown species ID ("mrmime", "nidoranm") -> Gen 1 species ID
+GEN1_SPECIES_IDS = {PokedexCache.normalize(name): species_id for name, species_id in SPECIES_DATA.items()}
 
 class PokemonAPI:
-    def __init__(self):
+    def __init__(self, pokedex=None, http=None):
         self.api_url = "https://play.pokemonshowdown.com/data/pokedex.json"
+        self.pokedex = pokedex or PokedexCache(source_url=self.api_url)
+        self.http = http or HttpSession()
+        self._refresh_future = None
         
     def get_pokemon_name_from_line(self, line):
         """Extract Pokemon name from a battle line"""
@@ -22,32 +31,58 @@ class PokemonAPI:
                         return name_part.lower()
         return None
 
+    def calculate_max_hp(self, base_hp, level=100):
+        """Calculate Gen 1 max HP with max IV and EV"""
+        # Gen 1 HP formula: floor((((Base + IV) × 2 + floor(ceil(sqrt(EV)) ÷ 4)) × Level) ÷ 100) + Level + 10
+        max_iv = 15  # Gen 1 max IV
+        max_ev = 65535  # Gen 1 theoretical max EV
+        
+        # Calculate the EV component: floor(ceil(sqrt(EV)) / 4)
+        ev_component = math.floor(math.ceil(math.sqrt(max_ev)) / 4)
+        
+        # Gen 1 HP formula
+        return math.floor((((base_hp + max_iv) * 2 + ev_component) * level) / 100) + level + 10
+
+    def calculate_stat(self, base_stat, level=100):
+        """Calculate a Gen 1 attack, defense, speed or special stat with max IV and EV"""
+        ev_component = math.floor(math.ceil(math.sqrt(65535)) / 4)
+        return math.floor((((base_stat + 15) * 2 + ev_component) * level) / 100) + 5
+
+    def get_cached_battle_stats(self, pokemon_name, level=100):
+        """Look up (attack, defense, speed, special) from the local Pokedex cache, or None"""
+        base_stats = self.pokedex.get_base_stats(pokemon_name)
+        species_id = GEN1_SPECIES_IDS.get(PokedexCache.normalize(pokemon_name))
+        if not base_stats or species_id is None:
+            return None
+        # pokedex.json splits Special into Sp. Atk and Sp. Def, neither of which is the Gen 1 stat
+        _, attack, defense, _, _, speed = base_stats
+        special = SPECIES_SPECIAL[species_id]
+        return tuple(self.calculate_stat(base_stat, level) for base_stat in (attack, defense, speed, special))
+
+    def get_cached_stats(self, pokemon_name, level=100):
+        """Look up max HP from the local Pokedex cache without any network access"""
+        base_stats = self.pokedex.get_base_stats(pokemon_name)
+        if base_stats:
+            base_hp = base_stats[0]
+            return self.calculate_max_hp(base_hp, level), base_hp
+        return None, None
+
+    async def refresh_pokedex(self):
+        """Refresh the local Pokedex cache, sharing one download between concurrent callers"""
+        if self._refresh_future is None or self._refresh_future.done():
+            self._refresh_future = asyncio.ensure_future(self.pokedex.refresh(self.http))
+        return await asyncio.shield(self._refresh_future)
+
     async def query_pokemon_stats(self, pokemon_name, level=100):
-        """Query Pokemon Showdown for Pokemon base stats and calculate max HP"""
+        """Query Pokemon base stats and calculate max HP, downloading the Pokedex only if needed"""
         try:
-            response = requests.get(self.api_url, timeout=5)
-            if response.status_code == 200:
-                pokedex_data = response.json()
-                
-                pokemon_key = pokemon_name.lower().replace(' ', '').replace('-', '')
-                
-                if pokemon_key in pokedex_data:
-                    pokemon = pokedex_data[pokemon_key]
-                    base_hp = pokemon.get('baseStats', {}).get('hp', 50)
-                    
-                    # Gen 1 HP formula: floor((((Base + IV) × 2 + floor(ceil(sqrt(EV)) ÷ 4)) × Level) ÷ 100) + Level + 10
-                    max_iv = 15  # Gen 1 max IV
-                    max_ev = 65535  # Gen 1 theoretical max EV
-                    
-                    # Calculate the EV component: floor(ceil(sqrt(EV)) / 4)
-                    ev_component = math.floor(math.ceil(math.sqrt(max_ev)) / 4)
-                    
-                    # Gen 1 HP formula
-                    max_hp = math.floor((((base_hp + max_iv) * 2 + ev_component) * level) / 100) + level + 10
-                    
-                    return max_hp, base_hp
+            max_hp, base_hp = self.get_cached_stats(pokemon_name, level)
+            if max_hp is None and self.pokedex.is_stale():
+                await self.refresh_pokedex()
+                max_hp, base_hp = self.get_cached_stats(pokemon_name, level)
+            return max_hp, base_hp
                     
         except Exception as e:
             print(f"Error querying Pokemon stats for {pokemon_name}: {str(e)}")
         
-        return None, None
\ No newline at end of file
+        return None, None
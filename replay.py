@@ -0,0 +1,230 @@
+"""Offline batch parsing of Showdown replay logs.
+
+Streams raw "|"-delimited protocol logs (one battle per file) through
+BattleParser without the GUI or a websocket and writes one JSON record per
+completed turn.
+
+    python replay.py replays/ "archive/2024-*/*.log" --output turns.jsonl --workers 8
+    python replay.py replays/ --output turns.parquet   # or turns.npz
+"""
+import os
+import sys
+import glob
+import json
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+from battle_state import BattleState
+from battle_parser import BattleParser
+from pokemon_api import PokemonAPI
+from turn_export import TurnColumns
+
+class ReplayIngestor:
+    """Parse replay files into per-turn BattleState snapshot records"""
+
+    def __init__(self, pokemon_api=None, log_callback=None, log_enabled=None):
+        self.pokemon_api = pokemon_api or PokemonAPI()
+        self.log = log_callback or (lambda message, log_type="INFO", room=None: None)
+        # Without a sink nothing is printed, so the parser can skip building its messages
+        self.log_enabled = log_enabled or (lambda log_type: log_callback is not None)
+        self.files_parsed = 0
+        self.lines_parsed = 0
+        self.turns_emitted = 0
+
+    @staticmethod
+    def iter_replay_files(paths, pattern="*.log"):
+        """Expand files, directories (recursively, matching pattern) and glob expressions"""
+        for path in paths:
+            if os.path.isdir(path):
+                matches = glob.glob(os.path.join(path, "**", pattern), recursive=True)
+            elif os.path.isfile(path):
+                matches = [path]
+            else:
+                matches = glob.glob(path, recursive=True)
+            for match in sorted(matches):
+                if os.path.isfile(match):
+                    yield match
+
+    @staticmethod
+    def snapshot_pokemon(pokemon):
+        return {
+            "species": pokemon.species_name,
+            "currentHP": pokemon.currentHP,
+            "maxHP": pokemon.maxHP,
+            "moves": [name for name in pokemon.move_names if name],
+            "movesPP": [pp for pp in pokemon.movesPP if pp > 0]
+        }
+
+    def make_record(self, replay_id, battle_state, turn):
+        """Build the structured record for one completed turn"""
+        return {
+            "replay": replay_id,
+            "turn": int(turn) if str(turn).isdigit() else turn,
+            "state": battle_state.state.as_dict(),
+            "player": self.snapshot_pokemon(battle_state.player_pokemon),
+            "enemy": self.snapshot_pokemon(battle_state.enemy_pokemon)
+        }
+
+    def _new_battle(self, path):
+        """Create a fresh BattleState/BattleParser pair for one replay file"""
+        replay_id = os.path.splitext(os.path.basename(path))[0]
+        log = lambda message, log_type="INFO": self.log(message, log_type, replay_id)
+        battle_state = BattleState(log, log_enabled=self.log_enabled)
+        return replay_id, BattleParser(battle_state, self.pokemon_api, log, log_enabled=self.log_enabled)
+
+    def _iter_lines(self, path):
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                self.lines_parsed += 1
+                yield line.rstrip("\r\n")
+        self.files_parsed += 1
+
+    def parse_replay(self, path):
+        """Stream one replay file, yielding a record for each completed turn"""
+        replay_id, battle_parser = self._new_battle(path)
+
+        pending = []
+        battle_parser.add_turn_callback(
+            lambda state, turn: pending.append(self.make_record(replay_id, state, turn))
+        )
+
+        for line in self._iter_lines(path):
+            battle_parser.parse_gen1_battle_data(line)
+            if pending:
+                self.turns_emitted += len(pending)
+                yield from pending
+                pending.clear()
+
+    def parse_replay_columns(self, path, columns):
+        """Parse one replay file straight into typed column buffers"""
+        replay_id, battle_parser = self._new_battle(path)
+        rows_before = len(columns)
+        battle_parser.add_turn_callback(
+            lambda state, turn: columns.append_turn(replay_id, turn, state)
+        )
+        for line in self._iter_lines(path):
+            battle_parser.parse_gen1_battle_data(line)
+        self.turns_emitted += len(columns) - rows_before
+
+    def iter_records(self, paths, pattern="*.log"):
+        for path in self.iter_replay_files(paths, pattern):
+            yield from self.parse_replay(path)
+
+def format_record(record):
+    return json.dumps(record, separators=(",", ":")) + "\n"
+
+def write_records(records, output):
+    for record in records:
+        output.write(format_record(record))
+
+# Each worker process keeps its own ingestor (and so its own BattleStates)
+_worker_ingestor = None
+
+def _init_worker():
+    global _worker_ingestor
+    _worker_ingestor = ReplayIngestor()
+
+def _parse_replay_worker(path):
+    """Parse one replay in a worker; returns (serialized records, lines, turns)"""
+    ingestor = _worker_ingestor
+    lines_before, turns_before = ingestor.lines_parsed, ingestor.turns_emitted
+    chunk = "".join(format_record(record) for record in ingestor.parse_replay(path))
+    return chunk, ingestor.lines_parsed - lines_before, ingestor.turns_emitted - turns_before
+
+def _parse_replay_columns_worker(path):
+    """Parse one replay in a worker into its own column buffers"""
+    ingestor = _worker_ingestor
+    lines_before = ingestor.lines_parsed
+    columns = TurnColumns()
+    ingestor.parse_replay_columns(path, columns)
+    return columns, ingestor.lines_parsed - lines_before
+
+def run_columns(paths, pattern, workers, log_callback=None):
+    """Parse replays into one TurnColumns buffer; returns (columns, replays, lines)"""
+    files = list(ReplayIngestor.iter_replay_files(paths, pattern))
+    if workers <= 1:
+        ingestor = ReplayIngestor(log_callback=log_callback)
+        columns = TurnColumns()
+        for path in files:
+            ingestor.parse_replay_columns(path, columns)
+        return columns, len(files), ingestor.lines_parsed
+
+    columns = TurnColumns()
+    total_lines = 0
+    chunksize = max(1, len(files) // (workers * 16))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        for replay_columns, lines in executor.map(_parse_replay_columns_worker, files, chunksize=chunksize):
+            columns.extend(replay_columns)
+            total_lines += lines
+    return columns, len(files), total_lines
+
+def run_serial(paths, pattern, output, log_callback=None):
+    """Parse replays in this process; returns (replays, lines, turns)"""
+    ingestor = ReplayIngestor(log_callback=log_callback)
+    write_records(ingestor.iter_records(paths, pattern), output)
+    return ingestor.files_parsed, ingestor.lines_parsed, ingestor.turns_emitted
+
+def run_parallel(paths, pattern, output, workers):
+    """Shard replay files across a process pool, writing results in input order"""
+    files = list(ReplayIngestor.iter_replay_files(paths, pattern))
+    chunksize = max(1, len(files) // (workers * 16))
+    total_lines = total_turns = 0
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        for chunk, lines, turns in executor.map(_parse_replay_worker, files, chunksize=chunksize):
+            output.write(chunk)
+            total_lines += lines
+            total_turns += turns
+    return len(files), total_lines, total_turns
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Parse Showdown replay logs into per-turn battle state records")
+    parser.add_argument("paths", nargs="+", help="replay files, directories or glob patterns")
+    parser.add_argument("--pattern", default="*.log", help="file pattern used when scanning directories")
+    parser.add_argument("--output", "-o", help="output file (default: JSON lines on stdout)")
+    parser.add_argument("--format", "-f", choices=["jsonl", "npz", "parquet"],
+                        help="output format (default: from the output file extension, else jsonl)")
+    parser.add_argument("--pokedex", help="import a downloaded pokedex.json into the local Pokedex cache first")
+    parser.add_argument("--verbose", "-v", action="store_true", help="print parser log messages to stderr (serial mode only)")
+    parser.add_argument("--workers", "-j", type=int, default=1, help="worker processes (0 = one per CPU core)")
+    args = parser.parse_args(argv)
+
+    if args.pokedex:
+        count = PokemonAPI().pokedex.import_file(args.pokedex)
+        print(f"Imported {count} species into the Pokedex cache", file=sys.stderr)
+
+    log_callback = None
+    if args.verbose:
+        log_callback = lambda message, log_type="INFO", room=None: print(f"[{log_type}] [{room}] {message}", file=sys.stderr)
+
+    workers = args.workers or os.cpu_count() or 1
+    file_format = args.format
+    if file_format is None:
+        extension = os.path.splitext(args.output or "")[1].lstrip(".")
+        file_format = extension if extension in ("npz", "parquet") else "jsonl"
+
+    start = time.perf_counter()
+    if file_format != "jsonl":
+        if not args.output:
+            parser.error(f"--output is required for {file_format} export")
+        columns, replays, lines = run_columns(args.paths, args.pattern, workers, log_callback)
+        columns.write(args.output, file_format)
+        turns = len(columns)
+    else:
+        output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+        try:
+            if workers > 1:
+                replays, lines, turns = run_parallel(args.paths, args.pattern, output, workers)
+            else:
+                replays, lines, turns = run_serial(args.paths, args.pattern, output, log_callback)
+        finally:
+            if args.output:
+                output.close()
+    elapsed = max(time.perf_counter() - start, 1e-9)
+
+    print(f"Parsed {replays} replays, {lines} lines, {turns} turns in {elapsed:.2f}s with {workers} worker(s) "
+          f"({replays / elapsed:.1f} replays/sec, {lines / elapsed:,.0f} lines/sec)",
+          file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+import json
+
+import gen1_data
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson parses |request| payloads several times faster; its errors subclass ValueError too
+json_loads = orjson.loads if orjson else json.loads
+
+_move_info = gen1_data.MOVE_INFO_BY_ID.get
+_NO_MOVE = (0, 0, "")
+
+class PartyMember:
+    """One Pokemon of the player's side as described by a |request|"""
+
+    __slots__ = (
+        "ident", "name", "species_name", "level", "currentHP", "maxHP", "status", "active",
+        "attack", "defense", "speed", "special", "moves", "move_names", "max_pp"
+    )
+
+    def __init__(self, data):
+        self.ident = ident = data.get("ident", "")
+        # Same key the switch parser uses for party slots ("p1: Alakazam" -> "alakazam")
+        self.name = ident.split(':')[-1].strip().lower()
+
+        # "Alakazam", "Tauros, L74, M"
+        self.species_name, _, details = data.get("details", "").partition(", ")
+        self.level = 100
+        if details:
+            for detail in details.split(", "):
+                if detail[:1] == "L" and detail[1:].isdigit():
+                    self.level = int(detail[1:])
+
+        # "270/323 par", "0 fnt"
+        hp, _, self.status = data.get("condition", "").partition(" ")
+        current_hp, _, max_hp = hp.partition("/")
+        self.currentHP = int(current_hp) if current_hp.isdigit() else 0
+        self.maxHP = int(max_hp) if max_hp.isdigit() else 0
+        self.active = bool(data.get("active", False))
+
+        # Gen 1 has a single Special stat; Showdown reports it as both spa and spd
+        stats = data.get("stats", {})
+        self.attack = stats.get("atk", 0)
+        self.defense = stats.get("def", 0)
+        self.speed = stats.get("spe", 0)
+        self.special = stats.get("spa", 0)
+
+        move_infos = [_move_info(move_id, _NO_MOVE) for move_id in data.get("moves", ())[:4]]
+        move_infos += [_NO_MOVE] * (4 - len(move_infos))
+        self.moves = [move_info[0] for move_info in move_infos]
+        self.max_pp = [move_info[1] for move_info in move_infos]
+        self.move_names = [move_info[2] for move_info in move_infos]
+
+class RequestSnapshot:
+    """The player's side from the latest |request|, diffed against the previous one
+
+    Members whose condition, active flag and moves are unchanged keep their
+    PartyMember (details and stats are fixed for the battle); only changed ones
+    are rebuilt and queued in pending until BattleState.apply_player_request takes them.
+    """
+
+    def __init__(self):
+        self.payload = None
+        self.members = []          # PartyMember per side slot, in Showdown's order
+        self.raw_members = {}      # ident -> (diff key, PartyMember) from the last request
+        self.active_pp = {}        # Gen 1 move id -> exact PP left for the active Pokemon
+        self.pending = {}          # name -> PartyMember changed since the last apply
+        self.dirty = False
+
+    def active_member(self):
+        for member in self.members:
+            if member.active:
+                return member
+        return None
+
+    def update(self, payload):
+        """Parse a |request| payload; returns the changed members, or None if it was a repeat"""
+        if payload == self.payload:
+            return None
+        data = json_loads(payload)
+        self.payload = payload
+
+        side_pokemon = data.get("side", {}).get("pokemon", [])
+        members = []
+        raw_members = {}
+        changed = []
+        for raw in side_pokemon:
+            ident = raw.get("ident", "")
+            key = (raw.get("condition"), raw.get("active"), raw.get("moves"))
+            previous = self.raw_members.get(ident)
+            if previous is not None and previous[0] == key:
+                member = previous[1]
+            else:
+                member = PartyMember(raw)
+                changed.append(member)
+                self.pending[member.name] = member
+            members.append(member)
+            raw_members[ident] = (key, member)
+        self.members = members
+        self.raw_members = raw_members
+
+        active = data.get("active")
+        if active:
+            active_pp = {}
+            for move in active[0].get("moves", ()):
+                move_info = _move_info(move.get("id", ""))
+                if move_info is not None and "pp" in move:
+                    active_pp[move_info[0]] = move["pp"]
+            self.active_pp = active_pp
+        self.dirty = True
+        return changed
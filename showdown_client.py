@@ -1,76 +1,324 @@
+import os
+import time
+import random
 import asyncio
 import websockets
 import json
-import requests
+from http_session import HttpSession
+
+class FrameLane:
+    """Bounded queue of received frames plus its depth and latency counters"""
+    
+    def __init__(self, name, maxsize, drop_when_full):
+        self.name = name
+        self.queue = asyncio.Queue(maxsize)
+        self.drop_when_full = drop_when_full
+        self.frames = 0
+        self.dropped = 0
+        self.max_depth = 0
+        self.wait_total = 0.0   # Seconds between receive and the consumer picking the frame up
+        self.wait_max = 0.0
+        self.handle_total = 0.0  # Seconds spent in handle_message
+        self.handle_max = 0.0
+        
+    async def put(self, message):
+        """Queue a frame, waiting for space or dropping it when the lane is full"""
+        item = (time.perf_counter(), message)
+        if self.drop_when_full:
+            try:
+                self.queue.put_nowait(item)
+            except asyncio.QueueFull:
+                self.dropped += 1
+                return
+        else:
+            await self.queue.put(item)
+        depth = self.queue.qsize()
+        if depth > self.max_depth:
+            self.max_depth = depth
+            
+    def record(self, wait, handle):
+        self.frames += 1
+        self.wait_total += wait
+        self.handle_total += handle
+        if wait > self.wait_max:
+            self.wait_max = wait
+        if handle > self.handle_max:
+            self.handle_max = handle
+            
+    def summary(self):
+        frames = self.frames or 1
+        return (f"{self.name}: {self.frames} frames, depth {self.queue.qsize()} (max {self.max_depth}), "
+                f"{self.dropped} dropped, queue wait avg {1000 * self.wait_total / frames:.2f} ms "
+                f"max {1000 * self.wait_max:.2f} ms, handling avg {1000 * self.handle_total / frames:.2f} ms "
+                f"max {1000 * self.handle_max:.2f} ms")
 
 class ShowdownClient:
-    def __init__(self, username, password, message_handler):
+    SERVERS = [
+        "wss://sim3.psim.us/showdown/websocket",
+        "wss://sim2.psim.us/showdown/websocket", 
+        "wss://sim.psim.us/showdown/websocket",
+        "wss://sim.smogon.com/showdown/websocket"
+    ]
+    LOGIN_URL = "https://play.pokemonshowdown.com/~~showdown/action.php"
+    
+    def __init__(self, username, password, message_handler, http=None, log_callback=None,
+                 initial_attempts=3, backoff_base=1.0, backoff_max=60.0,
+                 connect_stagger=0.25, connect_timeout=10.0, latency_file="server_latency.json",
+                 battle_queue_size=1024, other_queue_size=256, token_store=None):
         self.username = username
         self.password = password
         self.message_handler = message_handler
+        self.http = http or HttpSession()
+        self.token_store = token_store  # Saved login session, used instead of the password when valid
+        self.warm_task = None
+        self.log = log_callback or (lambda message, log_type="INFO": print(message))
         self.websocket = None
         self.challstr = ""
         self.assertion = ""
         self.connected = False
         self.running = False
         
+        # Reconnect supervisor
+        self.initial_attempts = initial_attempts  # Passes over all servers before the first connection fails
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.server_latency = {}  # uri -> last connect time in seconds, None after a failure
+        self.connect_stagger = connect_stagger  # Head start each server gets over the next one
+        self.connect_timeout = connect_timeout
+        self.latency_file = latency_file
+        
+        # Receive pipeline: battle and global frames are never dropped and get their own consumer,
+        # other rooms (chat, lobby) are dropped when their lane is full
+        self.battle_queue_size = battle_queue_size
+        self.other_queue_size = other_queue_size
+        self.lanes = None
+        self.ever_connected = False
+        self.logged_in = False
+        self.disconnected_at = None  # perf_counter() when the last connection dropped
+        
+        # Battle room -> [log lines delivered, last line], for rejoining after a reconnect
+        self.rooms = {}
+        self.load_server_latency()
+        
+    def load_server_latency(self):
+        """Load connect times saved by a previous run so the fastest server is tried first"""
+        if not self.latency_file or not os.path.exists(self.latency_file):
+            return
+        try:
+            with open(self.latency_file, "r", encoding="utf-8") as f:
+                saved = json.load(f)
+            self.server_latency.update({uri: latency for uri, latency in saved.items() if uri in self.SERVERS})
+        except (OSError, ValueError, AttributeError) as e:
+            print(f"Could not load server latency cache: {e}")
+            
+    def save_server_latency(self):
+        """Atomically write the per-server connect times"""
+        if not self.latency_file:
+            return
+        try:
+            tmp_file = self.latency_file + ".tmp"
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(self.server_latency, f)
+            os.replace(tmp_file, self.latency_file)
+        except OSError as e:
+            print(f"Could not save server latency cache: {e}")
+            
+    def ranked_servers(self):
+        """Servers by health: fastest successful connect first, then untried, then failed"""
+        def rank(item):
+            index, uri = item
+            latency = self.server_latency.get(uri, -1)
+            if latency is None:
+                return (2, index)
+            if latency < 0:
+                return (1, index)
+            return (0, latency)
+        return [uri for index, uri in sorted(enumerate(self.SERVERS), key=rank)]
+        
+    def backoff_delay(self, attempt):
+        """Exponential backoff with jitter, capped at backoff_max"""
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return random.uniform(delay / 2, delay)
+        
     async def connect_and_listen(self):
-        """Connect to Pokemon Showdown and listen for messages"""
-        servers = [
-            "wss://sim3.psim.us/showdown/websocket",
-            "wss://sim2.psim.us/showdown/websocket", 
-            "wss://sim.psim.us/showdown/websocket",
-            "wss://sim.smogon.com/showdown/websocket"
-        ]
-        
-        for server_uri in servers:
-            if not self.running:  # Check if we should stop
+        """Connect to Pokemon Showdown and listen for messages, reconnecting until stopped"""
+        attempt = 0
+        while self.running:
+            if await self.connect_once():
+                # Connected and later dropped: start backing off from scratch
+                attempt = 0
+            else:
+                attempt += 1
+                if not self.ever_connected and attempt >= self.initial_attempts:
+                    break
+            if not self.running:
                 return
                 
+            delay = self.backoff_delay(attempt)
+            print(f"Reconnecting in {delay:.1f}s...")
             try:
-                print(f"Connecting to {server_uri}...")
-                
-                async with websockets.connect(server_uri) as websocket:
-                    self.websocket = websocket
-                    print(f"Connected to {server_uri}")
-                    self.connected = True
-                    
-                    try:
-                        # Listen for messages
-                        async for message in websocket:
-                            if not self.running:
-                                break
-                            await self.handle_message(message)
-                    except asyncio.CancelledError:
-                        print("WebSocket connection cancelled")
-                        break
-                    except websockets.exceptions.ConnectionClosed:
-                        print("WebSocket connection closed")
-                        break
-                    return
-                    
+                await asyncio.sleep(delay)
             except asyncio.CancelledError:
-                print("Connection attempt cancelled")
+                print("Reconnect cancelled")
                 return
-            except Exception as e:
-                if self.running:  # Only log errors if we're still supposed to be running
-                    print(f"Failed to connect to {server_uri}: {str(e)}")
-                continue
         
         if self.running:  # Only raise exception if we're still supposed to be running
             raise Exception("Failed to connect to any Pokemon Showdown server")
             
+    async def open_websocket(self, server_uri):
+        """Open one server's websocket, recording how long the handshake took"""
+        print(f"Connecting to {server_uri}...")
+        connect_started = time.perf_counter()
+        try:
+            websocket = await websockets.connect(server_uri, open_timeout=self.connect_timeout)
+        except Exception as e:
+            self.server_latency[server_uri] = None
+            if self.running:  # Only log errors if we're still supposed to be running
+                print(f"Failed to connect to {server_uri}: {str(e)}")
+            raise
+        self.server_latency[server_uri] = time.perf_counter() - connect_started
+        return server_uri, websocket
+        
+    async def race_connect(self):
+        """Happy-eyeballs connect: start servers in health order, each connect_stagger after
+        the previous one (or as soon as it fails), keep the first handshake to finish and
+        cancel the rest. Returns (uri, websocket), or None if every server failed."""
+        pending = set()
+        servers = self.ranked_servers()
+        winner = None
+        try:
+            while winner is None and (servers or pending):
+                if servers:
+                    pending.add(asyncio.create_task(self.open_websocket(servers.pop(0))))
+                timeout = self.connect_stagger if servers else None
+                done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception():
+                        continue
+                    if winner is None:
+                        winner = task.result()
+                    else:
+                        # Two handshakes finished in the same step; keep the first
+                        await task.result()[1].close()
+        finally:
+            for task in pending:
+                task.cancel()
+            # A cancelled attempt keeps its previous latency; it was only slower than the winner
+            for result in await asyncio.gather(*pending, return_exceptions=True):
+                if isinstance(result, tuple):
+                    await result[1].close()
+        self.save_server_latency()
+        return winner
+        
+    async def warm_login_connection(self):
+        """Open the pooled HTTPS connection to the login server while the websocket connects,
+        so the login request after |challstr| skips the TCP and TLS handshakes"""
+        try:
+            await self.http.request("HEAD", self.LOGIN_URL)
+        except Exception:
+            pass
+            
+    async def connect_once(self):
+        """Connect to the first server to answer and listen; returns True if one connected"""
+        if self.warm_task is None or self.warm_task.done():
+            self.warm_task = asyncio.create_task(self.warm_login_connection())
+        try:
+            winner = await self.race_connect()
+        except asyncio.CancelledError:
+            print("Connection attempt cancelled")
+            self.running = False
+            return False
+        if winner is None:
+            return False
+            
+        server_uri, websocket = winner
+        self.websocket = websocket
+        print(f"Connected to {server_uri} in {1000 * self.server_latency[server_uri]:.0f} ms")
+        self.connected = True
+        self.ever_connected = True
+        self.logged_in = False
+        
+        battle_lane = FrameLane("battle", self.battle_queue_size, drop_when_full=False)
+        other_lane = FrameLane("other rooms", self.other_queue_size, drop_when_full=True)
+        self.lanes = (battle_lane, other_lane)
+        consumers = [asyncio.create_task(self.consume_frames(lane)) for lane in self.lanes]
+        try:
+            try:
+                await self.read_frames(websocket, battle_lane, other_lane)
+            except websockets.exceptions.ConnectionClosed:
+                print("WebSocket connection closed")
+            # Let the consumers finish what was already received
+            for lane in self.lanes:
+                await lane.queue.put(None)
+            await asyncio.gather(*consumers)
+        except asyncio.CancelledError:
+            print("WebSocket connection cancelled")
+            self.running = False
+            return True
+        finally:
+            for task in consumers:
+                task.cancel()
+            self.connected = False
+            self.websocket = None
+            await websocket.close()
+            for lane in self.lanes:
+                self.log(f"Receive pipeline {lane.summary()}", "SYSTEM")
+        if self.running:
+            self.disconnected_at = time.perf_counter()
+            self.log(f"Disconnected from {server_uri}", "SYSTEM")
+        return True
+        
+    async def read_frames(self, websocket, battle_lane, other_lane):
+        """Only receive frames and queue them, so slow parsing never stalls the socket"""
+        async for message in websocket:
+            if not self.running:
+                break
+            if message.startswith('>') and not message.startswith('>battle-'):
+                await other_lane.put(message)
+            else:
+                await battle_lane.put(message)
+                
+    async def consume_frames(self, lane):
+        """Handle one lane's frames in order until the None sentinel"""
+        while True:
+            item = await lane.queue.get()
+            if item is None:
+                return
+            received, message = item
+            started = time.perf_counter()
+            await self.handle_message(message)
+            lane.record(started - received, time.perf_counter() - started)
+            
+    def queue_depths(self):
+        """Frames waiting in each receive lane"""
+        if not self.lanes:
+            return {}
+        return {lane.name: lane.queue.qsize() for lane in self.lanes}
+        
     async def handle_message(self, message):
         """Handle incoming messages from the server"""
         try:
             lines = message.strip().split('\n')
             
+            # Frames for a room start with ">roomid"; frames without one belong to the global room
+            room = ""
+            if lines and lines[0].startswith('>'):
+                room = lines[0][1:].strip()
+                lines = lines[1:]
+                
+            # Rejoining a battle resends its whole log; skip what was already delivered
+            if room in self.rooms and lines and lines[0] == '|init|battle':
+                lines = self.skip_replayed_lines(room, lines)
+            
             for line in lines:
                 if not line:
                     continue
                 
                 # Pass message to handler
-                await self.message_handler(line)
+                await self.message_handler(line, room)
+                
+                if room.startswith('battle-'):
+                    self.track_room(room, line)
                 
                 # Handle authentication
                 if line.startswith('|challstr|'):
@@ -87,54 +335,125 @@ class ShowdownClient:
                         if username == self.username:
                             print(f"Successfully logged in as {username}")
                             self.connected = True
+                        if len(parts) >= 4 and parts[3] == '1' and not self.logged_in:
+                            self.logged_in = True
+                            await self.resume_session()
                             
         except Exception as e:
             print(f"Error handling message: {str(e)}")
             
-    async def login(self):
-        """Login to Pokemon Showdown"""
-        try:
-            login_url = "https://play.pokemonshowdown.com/~~showdown/action.php"
+    def track_room(self, room, line):
+        """Remember open battle rooms and how many lines of each one's log were delivered"""
+        if line == '|init|battle':
+            self.rooms[room] = [0, None]  # A fresh log: [lines delivered, last line]
+        elif line == '|deinit' or line == '|tie' or line.startswith(('|noinit|', '|win|', '|tie|')):
+            # Closed or finished: nothing left to rejoin
+            self.rooms.pop(room, None)
+            return
+        progress = self.rooms.get(room)
+        # Requests are sent to the player only, so a resent log doesn't contain them
+        if progress is not None and not line.startswith('|request|'):
+            progress[0] += 1
+            progress[1] = line
             
-            data = {
-                'act': 'login',
-                'name': self.username,
-                'pass': self.password,
-                'challstr': self.challstr
-            }
+    def skip_replayed_lines(self, room, lines):
+        """Drop the part of a resent battle log that was already delivered, partial turn included"""
+        delivered, last_line = self.rooms[room]
+        seen = 0
+        for index, line in enumerate(lines):
+            if line and not line.startswith('|request|'):
+                seen += 1
+                if seen == delivered:
+                    if line != last_line:
+                        break  # Not the log we followed; deliver all of it
+                    print(f"Skipped {index + 1} already-parsed lines in {room}")
+                    return lines[index + 1:]
+        return lines
+        
+    async def resume_session(self):
+        """After a reconnect's login, rejoin open battles and log how long the outage lasted"""
+        if self.disconnected_at is None:
+            return
+        for room in self.rooms:
+            await self.websocket.send(f"|/join {room}")
+        self.log(f"Resumed {time.perf_counter() - self.disconnected_at:.2f}s after disconnect, "
+                 f"rejoined {len(self.rooms)} battle room(s)", "SYSTEM")
+        self.disconnected_at = None
             
-            print(f"Attempting login for user: {self.username}")
+    async def request_assertion(self, data, require_login=False):
+        """POST to the login server; returns the assertion, or None"""
+        status, headers, response_text = await self.http.post(self.LOGIN_URL, data=data)
+        
+        if status != 200:
+            print(f"Login request failed with status {status}")
+            return None
             
-            response = requests.post(login_url, data=data)
+        if response_text.startswith(']'):
+            response_text = response_text[1:]
             
-            if response.status_code == 200:
-                response_text = response.text
-                
-                if response_text.startswith(']'):
-                    response_text = response_text[1:]
-                    
-                try:
-                    login_data = json.loads(response_text)
+        try:
+            login_data = json.loads(response_text)
+        except json.JSONDecodeError as e:
+            print(f"Failed to parse login response: {e}")
+            return None
+            
+        if not isinstance(login_data, dict):
+            return None
+        if require_login and not login_data.get('loggedin'):
+            return None
+        assertion = login_data.get('assertion')
+        if assertion:
+            # Errors come back as ";;message" in place of an assertion
+            if assertion.startswith(';;') or "invalid login key" in assertion.lower() or "error" in assertion.lower():
+                print(f"Login assertion contains error: {assertion}")
+                return None
+            return assertion
+        if 'error' in login_data:
+            print(f"Login failed: {login_data['error']}")
+        return None
+            
+    async def login(self):
+        """Login to Pokemon Showdown"""
+        try:
+            assertion = None
+            have_session = bool(self.assertion)
+            if not have_session and self.token_store:
+                saved = self.token_store.load(self.username)
+                if saved:
+                    self.http.import_cookies(saved["cookies"])
+                    have_session = True
                     
-                    if 'assertion' in login_data and login_data['assertion']:
-                        self.assertion = login_data['assertion']
-                        
-                        if "invalid login key" in self.assertion.lower() or "error" in self.assertion.lower():
-                            print(f"Login assertion contains error: {self.assertion}")
-                            return
-                        
-                        login_command = f"|/trn {self.username},0,{self.assertion}"
-                        await self.websocket.send(login_command)
-                        print("Login command sent")
-                        
-                    elif 'error' in login_data:
-                        print(f"Login failed: {login_data['error']}")
-                        
-                except json.JSONDecodeError as e:
-                    print(f"Failed to parse login response: {e}")
+            if have_session:
+                # Assertions are signed for one challstr, so after a reconnect or restart ask the
+                # login server for a new one with the session cookie before resending the password
+                assertion = await self.request_assertion({'act': 'upkeep', 'challstr': self.challstr},
+                                                         require_login=True)
+                if assertion:
+                    print("Re-authenticated with the existing login session")
                     
-            else:
-                print(f"Login request failed with status {response.status_code}")
+            if not assertion:
+                if not self.password:
+                    print("No saved login session and no password; enter the password to log in")
+                    return
+                print(f"Attempting login for user: {self.username}")
+                assertion = await self.request_assertion({
+                    'act': 'login',
+                    'name': self.username,
+                    'pass': self.password,
+                    'challstr': self.challstr
+                })
+            if not assertion:
+                return
+                
+            self.assertion = assertion
+            login_command = f"|/trn {self.username},0,{self.assertion}"
+            await self.websocket.send(login_command)
+            print("Login command sent")
+            
+            if self.token_store:
+                cookies = [cookie for cookie in self.http.export_cookies()
+                           if cookie["domain"].endswith("pokemonshowdown.com")]
+                self.token_store.save(self.username, cookies)
                 
         except Exception as e:
             print(f"Login error: {str(e)}")
@@ -0,0 +1,102 @@
+import os
+import sys
+import json
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from battle_state import BattleState, Party
+from gen1_data import MOVE_INFO, SPECIES_DATA, SPECIES_TYPES
+
+def request_payload(tauros_condition):
+    return json.dumps({"side": {"pokemon": [
+        {"ident": "p1: Starmie", "details": "Starmie", "condition": "323/323", "active": True,
+         "stats": {"atk": 248, "def": 268, "spa": 298, "spd": 298, "spe": 328},
+         "moves": ["psychic", "thunderbolt", "recover", "thunderwave"]},
+        {"ident": "p1: Tauros", "details": "Tauros", "condition": tauros_condition,
+         "stats": {"atk": 298, "def": 288, "spa": 238, "spd": 238, "spe": 318},
+         "moves": ["bodyslam", "hyperbeam", "blizzard", "earthquake"]}
+    ]}})
+
+def test_fainted_member_keeps_max_hp():
+    battle_state = BattleState()
+    battle_state.player_request.update(request_payload("353/353"))
+    battle_state.apply_player_request()
+
+    battle_state.player_request.update(request_payload("0 fnt"))
+    battle_state.apply_player_request()
+
+    tauros = battle_state.player_party.slots[battle_state.player_party.index("tauros")]
+    assert tauros.currentHP == 0
+    assert tauros.maxHP == 353
+    assert tauros.status == "fnt"
+
+def test_pack_record_layout():
+    party = Party()
+    index = party.claim("starmie", SPECIES_DATA["Starmie"])
+    pokemon = party.slots[index]
+    pokemon.currentHP, pokemon.maxHP = 300, 323
+    pokemon.status = "par"
+    pokemon.moves = [MOVE_INFO["Psychic"][0], MOVE_INFO["Thunderbolt"][0], MOVE_INFO["Recover"][0], 0]
+    pokemon.movesPP = [16, 24, 32, 0]
+    pokemon.attack, pokemon.defense, pokemon.speed, pokemon.special = 248, 268, 328, 298
+
+    expected = (
+        bytes((SPECIES_DATA["Starmie"],)) + (300).to_bytes(2, "big") + bytes((100, 0x40))
+        + bytes(SPECIES_TYPES[SPECIES_DATA["Starmie"]]) + b"\0"
+        + bytes(pokemon.moves) + b"\0\0" + b"\0\0\0"
+        + b"\xff" * 10 + b"\xff\xff"
+        + bytes((16 | 0xC0, 24 | 0xC0, 32 | 0xC0, 0))
+        + bytes((100,)) + b"".join(stat.to_bytes(2, "big") for stat in (323, 248, 268, 328, 298))
+    )
+    assert len(expected) == Party.RECORD.size == 44
+    assert party.pack_record(index) == expected
+
+def test_pack_record_status_bits():
+    party = Party()
+    pokemon = party.slots[party.claim("snorlax", SPECIES_DATA["Snorlax"])]
+    for status, bits in (("slp", 0x07), ("psn", 0x08), ("tox", 0x08), ("brn", 0x10), ("frz", 0x20),
+                         ("par", 0x40), ("", 0x00), ("fnt", 0x00)):
+        pokemon.status = status
+        assert party.pack_record(0)[4] == bits
+
+def test_pack_record_clamps_out_of_range_values():
+    party = Party()
+    pokemon = party.slots[party.claim("chansey", SPECIES_DATA["Chansey"])]
+    pokemon.currentHP = 70000
+    pokemon.maxHP = 703
+    pokemon.moves = [MOVE_INFO["Soft-Boiled"][0], 0, 0, 0]
+    pokemon.movesPP = [99, 0, 0, 0]
+    pokemon.attack = -5
+
+    record = party.pack_record(0)
+    assert len(record) == 44
+    assert record[1:3] == b"\xff\xff"
+    assert record[0x1D] == 0xFF  # 6-bit PP at its maximum, plus both PP Up bits
+    assert record[0x22:0x24] == (703).to_bytes(2, "big")
+    assert record[0x24:0x26] == b"\0\0"
+
+def test_unclaimed_slots_pack_as_zeros():
+    party = Party()
+    party.claim("tauros", SPECIES_DATA["Tauros"])
+    packed = party.pack()
+    assert len(packed) == Party.SIZE * 44
+    assert packed[44:] == bytes(5 * 44)
+
+def test_seventh_member_recycles_oldest_slot():
+    party = Party()
+    team = ("alakazam", "chansey", "tauros", "snorlax", "exeggutor", "starmie")
+    for name in team:
+        party.claim(name, SPECIES_DATA[name.capitalize()])
+    party.slots[0].moves = [MOVE_INFO["Psychic"][0], 0, 0, 0]
+
+    index = party.claim("zapdos", SPECIES_DATA["Zapdos"])
+    assert index == 0
+    assert party.index("alakazam") == -1
+    assert party.find_species(SPECIES_DATA["Alakazam"]) == -1
+    assert party.find_species(SPECIES_DATA["Zapdos"]) == 0
+    assert party.slots[0].nickname == "zapdos"
+    assert party.slots[0].moves == [0, 0, 0, 0]
+    assert party.index("chansey") == 1
+
+    # The next new name takes the next oldest slot
+    assert party.claim("rhydon", SPECIES_DATA["Rhydon"]) == 1
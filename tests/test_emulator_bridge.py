@@ -0,0 +1,81 @@
+import os
+import re
+import sys
+import struct
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from battle_state import BattleState
+from emulator_bridge import EmulatorBridge
+from gen1_data import MOVE_INFO, SPECIES_DATA, SPECIES_TYPES
+
+def lua_bridge_constants():
+    """BRIDGE = {...} from PokemonBattleData.lua as {name: int}"""
+    with open(os.path.join(ROOT, "PokemonBattleData.lua"), encoding="utf-8") as f:
+        block = re.search(r"local BRIDGE = \{(.*?)\n\}", f.read(), re.S).group(1)
+    return {name: int(value, 0) for name, value in re.findall(r"(\w+) = (0x[0-9A-Fa-f]+|\d+)", block)}
+
+def test_layout_matches_lua_script():
+    constants = lua_bridge_constants()
+    assert constants["SIZE"] == EmulatorBridge.SIZE == 776
+    assert constants["RNG_OFFSET"] == EmulatorBridge.RNG_OFFSET
+    assert constants["RNG_SIDE_SIZE"] == EmulatorBridge.RNG_SIDE.size
+    assert constants["POKEMON_OFFSET"] == EmulatorBridge.POKEMON_OFFSET
+    assert constants["PARTY_OFFSET"] == EmulatorBridge.PARTY_OFFSET
+    assert constants["PARTY_SIZE"] == EmulatorBridge.PARTY_SIZE
+    assert constants["PARTY_NICKS_OFFSET"] == constants["PARTY_RECORDS_OFFSET"] + 6 * 44
+    assert constants["TAIL_OFFSET"] == EmulatorBridge.TAIL_OFFSET
+
+def test_publish_layout(tmp_path):
+    battle_state = BattleState()
+    battle_state.update_player_pokemon("moo", 300, 353, species_name="Tauros", status="par")
+    battle_state.update_enemy_pokemon("starmie", 100, 100, species_name="Starmie")
+    enemy = battle_state.enemy_pokemon
+    enemy.moves[0] = MOVE_INFO["Psychic"][0]
+    enemy.movesPP[0] = 15
+    enemy.attack, enemy.defense, enemy.speed, enemy.special = 249, 269, 329, 299
+
+    bridge = EmulatorBridge(path=str(tmp_path / "bridge.bin"))
+    try:
+        sequence = bridge.publish(battle_state, "7")
+        data = bytes(bridge.buffer[:EmulatorBridge.SIZE])
+    finally:
+        bridge.close()
+
+    head, turn, _ = EmulatorBridge.HEADER.unpack_from(data)
+    tail, = struct.unpack_from("<I", data, EmulatorBridge.TAIL_OFFSET)
+    assert head == tail == sequence == 1
+    assert turn == 7
+
+    # Active Pokemon blocks: player, then enemy
+    player = EmulatorBridge.POKEMON.unpack_from(data, EmulatorBridge.POKEMON_OFFSET)
+    assert player[0] == SPECIES_DATA["Tauros"]
+    assert player[2:4] == SPECIES_TYPES[SPECIES_DATA["Tauros"]]
+    assert player[4:6] == (300, 353)
+    enemy_block = EmulatorBridge.POKEMON.unpack_from(data, EmulatorBridge.POKEMON_OFFSET + EmulatorBridge.POKEMON.size)
+    assert enemy_block[0] == SPECIES_DATA["Starmie"]
+    assert enemy_block[1] == 100
+    assert enemy_block[2:4] == SPECIES_TYPES[SPECIES_DATA["Starmie"]]
+    assert enemy_block[6] == MOVE_INFO["Psychic"][0]
+    assert enemy_block[10] == 15
+    assert enemy_block[14:18] == (249, 269, 329, 299)
+    assert enemy_block[18].rstrip(b"\0") == b"STARMIE"
+
+    # Party blocks: count, active slot, six records as in WRAM, six nicknames
+    for offset, party in ((EmulatorBridge.PARTY_OFFSET, battle_state.player_party),
+                          (EmulatorBridge.PARTY_OFFSET + EmulatorBridge.PARTY_SIZE, battle_state.enemy_party)):
+        assert data[offset:offset + 2] == bytes((1, 0))
+        assert data[offset + 2:offset + 2 + 6 * 44] == party.pack()
+        nicknames = data[offset + 2 + 6 * 44:offset + EmulatorBridge.PARTY_SIZE]
+        assert nicknames[:11].rstrip(b"\0") == party.slots[0].species_name.upper().encode("ascii")
+        assert nicknames[11:] == bytes(5 * 11)
+
+def test_no_active_slot_before_first_switch(tmp_path):
+    bridge = EmulatorBridge(path=str(tmp_path / "bridge.bin"))
+    try:
+        bridge.publish(BattleState(), "0")
+        data = bytes(bridge.buffer[:EmulatorBridge.SIZE])
+    finally:
+        bridge.close()
+    assert data[EmulatorBridge.PARTY_OFFSET:EmulatorBridge.PARTY_OFFSET + 2] == bytes((0, 0xFF))
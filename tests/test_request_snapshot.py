@@ -0,0 +1,73 @@
+import os
+import sys
+import json
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gen1_data import MOVE_INFO
+from request_snapshot import RequestSnapshot
+
+def request_payload(starmie_condition="323/323", tauros_condition="353/353", psychic_pp=16):
+    return json.dumps({
+        "active": [{"moves": [{"move": "Psychic", "id": "psychic", "pp": psychic_pp, "maxpp": 16},
+                              {"move": "Recover", "id": "recover", "pp": 32, "maxpp": 32}]}],
+        "side": {"pokemon": [
+            {"ident": "p1: Starmie", "details": "Starmie", "condition": starmie_condition, "active": True,
+             "stats": {"atk": 248, "def": 268, "spa": 298, "spd": 298, "spe": 328},
+             "moves": ["psychic", "recover"]},
+            {"ident": "p1: Moo", "details": "Tauros, L74, M", "condition": tauros_condition,
+             "stats": {"atk": 228, "def": 220, "spa": 184, "spd": 184, "spe": 243},
+             "moves": ["bodyslam", "hyperbeam"]}
+        ]}
+    })
+
+def test_first_request_parses_every_member():
+    snapshot = RequestSnapshot()
+    changed = snapshot.update(request_payload(starmie_condition="270/323 par"))
+    assert [member.name for member in changed] == ["starmie", "moo"]
+
+    starmie, tauros = snapshot.members
+    assert snapshot.active_member() is starmie
+    assert (starmie.currentHP, starmie.maxHP, starmie.status) == (270, 323, "par")
+    assert (starmie.attack, starmie.defense, starmie.speed, starmie.special) == (248, 268, 328, 298)
+    assert starmie.moves[:2] == [MOVE_INFO["Psychic"][0], MOVE_INFO["Recover"][0]]
+    assert starmie.moves[2:] == [0, 0]
+    assert (tauros.species_name, tauros.level) == ("Tauros", 74)
+    assert snapshot.active_pp == {MOVE_INFO["Psychic"][0]: 16, MOVE_INFO["Recover"][0]: 32}
+
+def test_repeated_payload_is_ignored():
+    snapshot = RequestSnapshot()
+    snapshot.update(request_payload())
+    snapshot.pending.clear()
+    assert snapshot.update(request_payload()) is None
+    assert snapshot.pending == {}
+
+def test_only_changed_members_are_rebuilt():
+    snapshot = RequestSnapshot()
+    snapshot.update(request_payload())
+    starmie, tauros = snapshot.members
+    snapshot.pending.clear()
+
+    changed = snapshot.update(request_payload(starmie_condition="200/323", psychic_pp=15))
+    assert [member.name for member in changed] == ["starmie"]
+    assert list(snapshot.pending) == ["starmie"]
+    assert snapshot.members[0] is not starmie
+    assert snapshot.members[1] is tauros
+    assert snapshot.active_pp[MOVE_INFO["Psychic"][0]] == 15
+
+def test_pp_change_alone_updates_active_pp_without_rebuilding():
+    snapshot = RequestSnapshot()
+    snapshot.update(request_payload())
+    members = list(snapshot.members)
+    snapshot.pending.clear()
+
+    assert snapshot.update(request_payload(psychic_pp=14)) == []
+    assert snapshot.members == members
+    assert snapshot.active_pp[MOVE_INFO["Psychic"][0]] == 14
+    assert snapshot.dirty
+
+def test_fainted_member_has_no_max_hp():
+    snapshot = RequestSnapshot()
+    snapshot.update(request_payload(tauros_condition="0 fnt"))
+    tauros = snapshot.members[1]
+    assert (tauros.currentHP, tauros.maxHP, tauros.status) == (0, 0, "fnt")
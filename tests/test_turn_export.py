@@ -0,0 +1,26 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from battle_parser import BattleParser
+from battle_state import BattleState
+from gen1_data import SPECIES_DATA
+from pokedex_cache import PokedexCache
+from pokemon_api import PokemonAPI
+from turn_export import TurnColumns
+
+def test_nicknamed_switch_in_exports_species(tmp_path):
+    battle_state = BattleState()
+    pokedex = PokedexCache(cache_file=str(tmp_path / "pokedex_cache.json"))
+    parser = BattleParser(battle_state, PokemonAPI(pokedex=pokedex), lambda message, log_type="INFO": None)
+    parser.parse_gen1_battle_data("|player|p1|me|1")
+    parser.parse_gen1_battle_data("|switch|p1a: Moo|Tauros|353/353")
+    parser.parse_gen1_battle_data("|switch|p2a: Starmie|Starmie|100/100")
+
+    columns = TurnColumns()
+    columns.append_turn("replay", "1", battle_state)
+
+    assert battle_state.player_pokemon.species_name != "Tauros"
+    assert columns.columns["playerSpecies"][0] == SPECIES_DATA["Tauros"]
+    assert columns.columns["enemySpecies"][0] == SPECIES_DATA["Starmie"]
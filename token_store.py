@@ -0,0 +1,110 @@
+import os
+import json
+import time
+
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+except ImportError:
+    Fernet = None
+
+class TokenStore:
+    """Encrypted on-disk copy of the login server session cookies and their expiry
+
+    Restarts hand the saved session cookie to act=upkeep instead of posting the
+    password again. Assertions themselves are not kept: each is signed for the
+    challstr of one websocket connection and is useless on the next.
+
+    The store is encrypted with a Fernet key kept in key_file; that guards
+    against the store being copied or committed on its own, not against someone
+    who can read both files. Without the optional cryptography package nothing
+    is written and every start does a full login.
+    """
+
+    FORMAT_VERSION = 1
+    DEFAULT_MAX_AGE = 14 * 24 * 60 * 60  # When the login server doesn't say how long the session lasts
+
+    def __init__(self, store_file="showdown_session.bin", key_file="showdown_session.key"):
+        self.store_file = store_file
+        self.key_file = key_file
+        self.fernet = None
+
+    @staticmethod
+    def available():
+        return Fernet is not None
+
+    @staticmethod
+    def normalize(username):
+        """Showdown user ID: lowercase letters and digits only"""
+        return "".join(char for char in username.lower() if char.isalnum())
+
+    def _cipher(self, create):
+        """Load the key, creating it (readable by this user only) when create is set
+
+        A truncated or corrupt key file counts as missing; the store encrypted with
+        it can't be read any more, so it is dropped as well.
+        """
+        if self.fernet is None:
+            if os.path.exists(self.key_file):
+                with open(self.key_file, "rb") as f:
+                    key = f.read().strip()
+                try:
+                    self.fernet = Fernet(key)
+                    return self.fernet
+                except ValueError:
+                    print("Login session key is unreadable, starting over with a new one")
+                    os.remove(self.key_file)
+                    self.clear()
+            if create:
+                key = Fernet.generate_key()
+                fd = os.open(self.key_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+                with os.fdopen(fd, "wb") as f:
+                    f.write(key)
+                self.fernet = Fernet(key)
+        return self.fernet
+
+    def load(self, username):
+        """Return the saved session for username if it hasn't expired, else None"""
+        if not self.available() or not os.path.exists(self.store_file):
+            return None
+        try:
+            cipher = self._cipher(create=False)
+            if cipher is None:
+                return None
+            with open(self.store_file, "rb") as f:
+                data = json.loads(cipher.decrypt(f.read()))
+        except (OSError, ValueError, InvalidToken) as e:
+            print(f"Could not load saved login session: {e}")
+            return None
+        if data.get("version") != self.FORMAT_VERSION or data.get("userid") != self.normalize(username):
+            return None
+        if data.get("expires", 0) <= time.time():
+            return None
+        return data
+
+    def save(self, username, cookies):
+        """Encrypt and atomically write the session; expiry comes from the cookies"""
+        if not self.available():
+            return False
+        expiries = [cookie["expires"] for cookie in cookies if cookie["expires"]]
+        data = {
+            "version": self.FORMAT_VERSION,
+            "userid": self.normalize(username),
+            "cookies": cookies,
+            "expires": min(expiries) if expiries else time.time() + self.DEFAULT_MAX_AGE,
+            "saved_at": time.time()
+        }
+        try:
+            token = self._cipher(create=True).encrypt(json.dumps(data, separators=(",", ":")).encode("utf-8"))
+            tmp_file = self.store_file + ".tmp"
+            with open(tmp_file, "wb") as f:
+                f.write(token)
+            os.replace(tmp_file, self.store_file)
+            return True
+        except OSError as e:
+            print(f"Could not save login session: {e}")
+            return False
+
+    def clear(self):
+        """Forget the saved session (the key is kept for the next one)"""
+        if os.path.exists(self.store_file):
+            os.remove(self.store_file)
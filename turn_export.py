@@ -0,0 +1,122 @@
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+class TurnColumns:
+    """Typed per-turn column buffers of BattleState snapshots for binary export"""
+
+    FLAG_FIELDS = (
+        "playerFirst", "flinched",
+        "playerStatDownEffect", "playerFullyParalyzed", "playerHitConfuse", "playerStatused",
+        "playerWokeUp", "playerSnappedOut", "playerFainted",
+        "enemyStatDownEffect", "enemyFullyParalyzed", "enemyHitConfuse", "enemyStatused",
+        "enemyWokeUp", "enemySnappedOut", "enemyFainted"
+    )
+    COUNT_FIELDS = ("playerDamage", "playerCrit", "playerMoveMiss", "enemyDamage", "enemyCrit", "enemyMoveMiss")
+    MOVE_USED_FIELDS = ("playerMoveUsed", "enemyMoveUsed")
+    SIDES = ("player", "enemy")
+
+    def __init__(self):
+        # array typecodes: B = uint8, H = uint16, i = int32, I = uint32
+        self.columns = {"replay": array("I"), "turn": array("i")}
+        for field in self.FLAG_FIELDS:
+            self.columns[field] = array("B")
+        for field in self.COUNT_FIELDS:
+            self.columns[field] = array("i")
+        for field in self.MOVE_USED_FIELDS:
+            self.columns[field] = array("B")
+        for side in self.SIDES:
+            self.columns[f"{side}Species"] = array("B")
+            self.columns[f"{side}CurrentHP"] = array("H")
+            self.columns[f"{side}MaxHP"] = array("H")
+            for slot in range(1, 5):
+                self.columns[f"{side}Move{slot}"] = array("B")
+                self.columns[f"{side}Move{slot}PP"] = array("B")
+        self.replay_names = []  # Dictionary for the "replay" column
+        self.replay_index = {}
+
+    def __len__(self):
+        return len(self.columns["turn"])
+
+    def _replay_id(self, replay):
+        index = self.replay_index.get(replay)
+        if index is None:
+            index = self.replay_index[replay] = len(self.replay_names)
+            self.replay_names.append(replay)
+        return index
+
+    def append_turn(self, replay, turn, battle_state):
+        """Append one completed turn's state and active Pokemon"""
+        columns = self.columns
+        state = battle_state.state
+        columns["replay"].append(self._replay_id(replay))
+        columns["turn"].append(int(turn) if str(turn).isdigit() else -1)
+        for field in self.FLAG_FIELDS:
+            columns[field].append(1 if getattr(state, field) else 0)
+        for field in self.COUNT_FIELDS:
+            columns[field].append(int(getattr(state, field)))
+        for field in self.MOVE_USED_FIELDS:
+            columns[field].append(battle_state.get_move_id(getattr(state, field)))
+
+        for side, pokemon in (("player", battle_state.player_pokemon), ("enemy", battle_state.enemy_pokemon)):
+            columns[f"{side}Species"].append(pokemon.species)  # species_name is the switch name, maybe a nickname
+            columns[f"{side}CurrentHP"].append(max(0, min(pokemon.currentHP, 0xFFFF)))
+            columns[f"{side}MaxHP"].append(max(0, min(pokemon.maxHP, 0xFFFF)))
+            for slot in range(4):
+                columns[f"{side}Move{slot + 1}"].append(pokemon.moves[slot])
+                columns[f"{side}Move{slot + 1}PP"].append(max(0, min(pokemon.movesPP[slot], 0xFF)))
+
+    def extend(self, other):
+        """Append another buffer's rows (e.g. from a worker process), remapping replay IDs"""
+        remap = array("I", (self._replay_id(name) for name in other.replay_names))
+        self.columns["replay"].extend(array("I", (remap[index] for index in other.columns["replay"])))
+        for name, column in other.columns.items():
+            if name != "replay":
+                self.columns[name].extend(column)
+
+    def write_npz(self, path):
+        """Write all columns to a compressed NumPy .npz archive"""
+        if np is None:
+            raise RuntimeError("numpy is required for .npz export (pip install numpy)")
+        arrays = {name: np.frombuffer(column, dtype=column.typecode) for name, column in self.columns.items()}
+        arrays["replay_names"] = np.array(self.replay_names, dtype=str)
+        np.savez_compressed(path, **arrays)
+
+    def to_arrow(self):
+        """Build a pyarrow Table without copying through Python objects"""
+        if pa is None:
+            raise RuntimeError("pyarrow is required for Arrow/Parquet export (pip install pyarrow)")
+        arrow_types = {"B": pa.uint8(), "H": pa.uint16(), "i": pa.int32(), "I": pa.uint32()}
+        fields = {}
+        for name, column in self.columns.items():
+            values = pa.Array.from_buffers(arrow_types[column.typecode], len(column), [None, pa.py_buffer(column)])
+            if name == "replay":
+                values = pa.DictionaryArray.from_arrays(values, pa.array(self.replay_names, type=pa.string()))
+            fields[name] = values
+        return pa.table(fields)
+
+    def write_parquet(self, path):
+        """Write all columns to a Parquet file"""
+        if pq is None:
+            raise RuntimeError("pyarrow is required for Parquet export (pip install pyarrow)")
+        pq.write_table(self.to_arrow(), path)
+
+    def write(self, path, file_format=None):
+        """Write using the format given, or the one implied by the file extension"""
+        file_format = file_format or ("parquet" if path.endswith(".parquet") else "npz")
+        if file_format == "parquet":
+            self.write_parquet(path)
+        elif file_format == "npz":
+            self.write_npz(path)
+        else:
+            raise ValueError(f"Unknown columnar format: {file_format}")